@@ -2,6 +2,8 @@ import logging
 from typing import Dict, Optional
 from datetime import datetime
 
+from research.leadership import format_person, title_rank
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,7 +31,6 @@ class AccountPlanGenerator:
                 "risks": self._generate_risks(consolidated, news),
             },
             "user_notes": user_notes or {},
-            "raw_research": research_data,
         }
         
         return plan
@@ -55,12 +56,16 @@ class AccountPlanGenerator:
     
     def _generate_team(self, data: Dict) -> Dict:
         leadership = data.get("leadership", [])
+        decision_makers = [
+            person["name"] for person in leadership
+            if title_rank(person.get("title")) in (0, 1, 2)
+        ]
         
         return {
             "title": "Leadership Team",
             "content": {
-                "executives": leadership if leadership else ["Information not available"],
-                "key_decision_makers": "To be identified",
+                "executives": [format_person(person) for person in leadership] or ["Information not available"],
+                "key_decision_makers": ", ".join(decision_makers) if decision_makers else "To be identified",
                 "org_structure": "Research in progress",
                 "linkedin_profiles": self._format_social(data.get("social_media", {})),
             },
@@ -126,6 +131,8 @@ class AccountPlanGenerator:
         for key in ["city", "state", "country"]:
             if location.get(key):
                 parts.append(location[key])
+        if not parts and location.get("address"):
+            return location["address"]
         return ", ".join(parts) if parts else "N/A"
     
     def _format_social(self, social: Dict) -> Dict:
@@ -143,7 +150,8 @@ class AccountPlanGenerator:
             title = article.get("title", "")
             date = article.get("published_at", "")
             if title:
-                summaries.append(f"• {title} ({date[:10]})")
+                coverage = f", {article['cluster_size']} sources" if article.get("cluster_size", 1) > 1 else ""
+                summaries.append(f"• {title} ({date[:10]}{coverage})")
         
         return "\n".join(summaries) if summaries else "No recent news"
     
@@ -152,7 +160,7 @@ class AccountPlanGenerator:
         
         if data.get("founded"):
             try:
-                years = datetime.now().year - int(str(data["founded"])[:4])
+                years = datetime.now().year - int(data["founded"])
                 if years > 10:
                     strengths.append(f"Established company with {years}+ years experience")
             except:
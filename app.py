@@ -21,14 +21,13 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 from agents.conversation_manager import ConversationManager, ConversationState
-from research.data_aggregator import DataAggregator
-from account_plan.generator import AccountPlanGenerator
+from research.service import ResearchService, get_research_service, COMPLETE, FAILED
 from export.pdf_exporter import PDFExporter
 from export.docx_exporter import DOCXExporter
 from utils.validators import validate_company_name, validate_file_upload
 from utils.error_handlers import show_missing_api_keys_warning
 from utils.tts import add_tts_button
-from config.settings import FEATURES
+from config.settings import FEATURES, SERVICE_CONFIG
 
 st.set_page_config(
     page_title="Company Research Assistant",
@@ -57,6 +56,12 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_resource
+def load_research_service() -> ResearchService:
+    """Shared research service (aggregator, connection pools, cache) for all sessions."""
+    return get_research_service()
+
+
 def initialize_session_state():
     """Initialize all session state variables."""
     if 'session_id' not in st.session_state:
@@ -65,12 +70,6 @@ def initialize_session_state():
     if 'conversation_manager' not in st.session_state:
         st.session_state.conversation_manager = ConversationManager()
     
-    if 'data_aggregator' not in st.session_state:
-        st.session_state.data_aggregator = DataAggregator()
-    
-    if 'plan_generator' not in st.session_state:
-        st.session_state.plan_generator = AccountPlanGenerator()
-    
     if 'current_research' not in st.session_state:
         st.session_state.current_research = None
     
@@ -83,6 +82,9 @@ def initialize_session_state():
     if 'researching' not in st.session_state:
         st.session_state.researching = False
     
+    if 'active_job_id' not in st.session_state:
+        st.session_state.active_job_id = None
+    
     if 'export_data' not in st.session_state:
         st.session_state.export_data = None
 
@@ -118,55 +120,104 @@ def show_status(message: str):
 
 
 def conduct_research(company_name: str, domain: str = None):
-    """Conduct company research."""
+    """Queue company research in the background and return its job id."""
     conv_manager = st.session_state.conversation_manager
-    data_agg = st.session_state.data_aggregator
+    
+    job_id = load_research_service().submit(
+        company_name,
+        domain,
+        include_news=True,
+        include_officers=False,
+        session_id=st.session_state.session_id,
+    )
     
     conv_manager.set_state(ConversationState.RESEARCHING)
     st.session_state.researching = True
+    st.session_state.active_job_id = job_id
     
-    status_placeholder = st.empty()
+    return job_id
+
+
+def collect_finished_research():
+    """Pick up the result of the active research job once it has finished."""
+    job_id = st.session_state.active_job_id
+    if not job_id:
+        return
     
-    try:
-        with st.spinner("🔍 Researching company..."):
-            status_placeholder.info("📊 Gathering data from multiple sources...")
-            research_data = data_agg.research_company(
-                company_name=company_name,
-                company_domain=domain,
-                include_news=True,
-                include_officers=False
-            )
-        
-        with st.spinner("📋 Generating account plan..."):
-            status_placeholder.info("✨ Creating account plan structure...")
-            plan = st.session_state.plan_generator.generate(research_data)
-        
-        st.session_state.current_research = research_data
-        st.session_state.current_plan = plan
-        
-        conv_manager.set_state(ConversationState.PRESENTING_RESULTS)
-        st.session_state.researching = False
-        
-        status_placeholder.success("✅ Research complete!")
-        time.sleep(1)
-        status_placeholder.empty()
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Research failed: {str(e)}")
-        status_placeholder.error(f"❌ Research failed: {str(e)}")
-        st.session_state.researching = False
+    conv_manager = st.session_state.conversation_manager
+    job = load_research_service().get_job(job_id)
+    
+    if job is None or job['status'] == FAILED:
+        error = job['error'] if job else "Research job not found"
+        logger.error(f"Research failed: {error}")
+        content = f"❌ Research failed: {error}"
         conv_manager.set_state(ConversationState.IDLE)
-        return False
+    elif job['status'] == COMPLETE:
+        st.session_state.current_research = job['research']
+        st.session_state.current_plan = job['plan']
+        st.session_state.export_data = None
+        content = f"✅ Research complete for **{job['company_name']}**! Review the account plan below."
+        conv_manager.set_state(ConversationState.PRESENTING_RESULTS)
+    else:
+        return
+    
+    st.session_state.messages.append({
+        'role': 'assistant',
+        'content': content,
+        'timestamp': datetime.now().strftime("%H:%M")
+    })
+    st.session_state.active_job_id = None
+    st.session_state.researching = False
+
+
+def display_research_progress():
+    """Show progress and partial results for the active research job."""
+    job_id = st.session_state.active_job_id
+    if not job_id:
+        return
+    
+    job = load_research_service().get_job(job_id)
+    if job is None:
+        return
+    
+    if job['sources']:
+        st.info(format_source_progress(job['sources']))
+    else:
+        st.info(f"📊 Gathering data on {job['company_name']} from multiple sources...")
+    
+    if job['research']:
+        display_news_preview(job['research'].get('news', []))
+    if job['plan']:
+        display_account_plan(job['plan'])
 
 
-def display_account_plan():
+def format_source_progress(source_states: dict) -> str:
+    """Format per-source research progress for the status box."""
+    icons = {'started': '⏳', 'finished': '✅', 'failed': '⚠️'}
+    done = sum(1 for state in source_states.values() if state != 'started')
+    sources = " · ".join(f"{icons[state]} {source}" for source, state in source_states.items())
+    return f"🔍 Researching ({done}/{len(source_states)} sources done): {sources}"
+
+
+def display_news_preview(news: list):
+    """Display the latest headlines while research is still running."""
+    if not news:
+        return
+    
+    st.markdown("**📰 Latest News**")
+    for article in news[:5]:
+        title = article.get('title', 'Untitled')
+        url = article.get('url')
+        coverage = f" _({article['cluster_size']} sources)_" if article.get('cluster_size', 1) > 1 else ""
+        st.markdown((f"• [{title}]({url})" if url else f"• {title}") + coverage)
+
+
+def display_account_plan(plan: dict = None):
     """Display the account plan in tabs."""
-    if not st.session_state.current_plan:
+    plan = plan or st.session_state.current_plan
+    if not plan:
         return
     
-    plan = st.session_state.current_plan
     sections = plan['sections']
     
     st.markdown('<h2 class="section-header">📋 Account Plan</h2>', unsafe_allow_html=True)
@@ -221,6 +272,10 @@ def display_research_summary():
         
         if research.get('conflicts'):
             st.warning(f"⚠️ Found {len(research['conflicts'])} data conflicts. Review recommended.")
+        
+        if research.get('skipped_sources'):
+            skipped = ", ".join(research['skipped_sources'].keys())
+            st.info(f"⏳ Skipped to stay within API quotas: {skipped}")
 
 
 def export_plan(format: str):
@@ -266,6 +321,7 @@ def export_plan(format: str):
 def main():
     """Main application."""
     initialize_session_state()
+    collect_finished_research()
     
     conv_manager = st.session_state.conversation_manager
     
@@ -287,6 +343,8 @@ def main():
             st.session_state.current_plan = None
             st.session_state.messages = []
             st.session_state.export_data = None
+            st.session_state.active_job_id = None
+            st.session_state.researching = False
             st.rerun()
     
     with nav_col3:
@@ -439,17 +497,14 @@ def main():
             action = result.get('action')
             
             if action == 'start_research':
-                company = result.get('company')
-                if conduct_research(company):
-                    success_msg = f"✅ Research complete for **{company}**! Review the account plan below."
-                    st.session_state.messages.append({
-                        'role': 'assistant',
-                        'content': success_msg,
-                        'timestamp': datetime.now().strftime("%H:%M")
-                    })
+                conduct_research(result.get('company'))
             
             st.rerun()
     
+    if st.session_state.active_job_id:
+        st.divider()
+        display_research_progress()
+    
     if st.session_state.current_plan:
         st.divider()
         display_research_summary()
@@ -463,6 +518,10 @@ def main():
         <p>Data sources: NewsAPI, Hunter.io, Brandfetch, OpenCorporates, Web Scraping</p>
     </div>
     """, unsafe_allow_html=True)
+    
+    if st.session_state.active_job_id:
+        time.sleep(SERVICE_CONFIG["poll_interval"])
+        st.rerun()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+"""Compare per-page CPU time of the legacy and streaming web scraper parsers.
+
+Usage: python benchmarks/scraper_benchmark.py [--inflate-mb 3] [--repeat 5]
+
+Each fixture page under benchmarks/fixtures is parsed as stored, and again
+inflated with an inline SVG sprite and a hydration payload at the end of
+<body> to mimic multi-megabyte marketing homepages.
+"""
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+from config.settings import SCRAPING_CONFIG
+from research.html_extract import available_backends, decode_html, extract_social_links, parse_html, read_capped
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def legacy_parse(content: bytes) -> dict:
+    soup = BeautifulSoup(content, "html.parser")
+    social_media = {}
+    for link in soup.find_all("a", href=True):
+        href = link["href"]
+        href_lower = href.lower()
+        if "twitter.com" in href_lower or "x.com" in href_lower:
+            social_media["twitter_url"] = href
+            match = re.search(r"(?:twitter\.com|x\.com)/([a-zA-Z0-9_]+)", href)
+            if match:
+                social_media["twitter_id"] = match.group(1)
+        elif "linkedin.com/company" in href_lower:
+            social_media["linkedin_url"] = href
+            match = re.search(r"linkedin\.com/company/([a-zA-Z0-9\-_]+)", href)
+            if match:
+                social_media["linkedin_id"] = match.group(1)
+        elif "facebook.com" in href_lower:
+            social_media["facebook_url"] = href
+            match = re.search(r"facebook\.com/([a-zA-Z0-9\.\-_]+)", href)
+            if match:
+                social_media["facebook_id"] = match.group(1)
+        elif "instagram.com" in href_lower:
+            social_media["instagram_url"] = href
+            match = re.search(r"instagram\.com/([a-zA-Z0-9\._]+)", href)
+            if match:
+                social_media["instagram_id"] = match.group(1)
+        elif "youtube.com" in href_lower:
+            social_media["youtube_url"] = href
+    
+    title = soup.find("title")
+    return {"title": title.get_text().strip() if title else "", "social_media": social_media}
+
+
+def streaming_parse(content: bytes, backend: str) -> dict:
+    chunk_size = SCRAPING_CONFIG["chunk_size"]
+    chunks = (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+    facts = parse_html(decode_html(read_capped(chunks)), backend)
+    return {"title": facts["title"], "social_media": extract_social_links(facts["links"])}
+
+
+def inflate(html: str, megabytes: float) -> str:
+    if megabytes <= 0:
+        return html
+    symbol = '<symbol id="icon-%d" viewBox="0 0 24 24"><path d="M12 2L2 7l10 5 10-5-10-5z"/><path d="M2 17l10 5 10-5"/></symbol>'
+    row = '{"id":%d,"slug":"feature-%d","body":"' + "lorem ipsum dolor sit amet " * 8 + '"},'
+    half = megabytes * 1024 * 1024 / 2
+    symbols = "".join(symbol % i for i in range(int(half // len(symbol))))
+    rows = "".join(row % (i, i) for i in range(int(half // len(row))))
+    payload = (
+        '<svg style="display:none">' + symbols + "</svg>"
+        + '<script id="__NEXT_DATA__" type="application/json">[' + rows + "{}]</script>"
+    )
+    return html.replace("</body>", payload + "</body>", 1)
+
+
+def cpu_time(fn, content: bytes, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        fn(content)
+        best = min(best, time.process_time() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inflate-mb", type=float, default=3.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    print(f"Parser backends available: {', '.join(available_backends())}")
+    for fixture in sorted(FIXTURES.glob("*.html")):
+        html = fixture.read_text(encoding="utf-8")
+        for label, page in (("stored", html), (f"+{args.inflate_mb:g}MB", inflate(html, args.inflate_mb))):
+            content = page.encode("utf-8")
+            legacy = cpu_time(legacy_parse, content, args.repeat)
+            print(f"{fixture.name} [{label}, {len(content) / 1024:.0f} KB]")
+            print(f"  legacy bs4/html.parser   {legacy * 1000:8.1f} ms")
+            for backend in available_backends():
+                streaming = cpu_time(lambda c: streaming_parse(c, backend), content, args.repeat)
+                print(f"  streaming {backend:<14} {streaming * 1000:8.1f} ms  ({legacy / streaming:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,11 @@ load_dotenv()
 BASE_DIR = Path(__file__).resolve().parent.parent
 EXPORTS_DIR = BASE_DIR / "exports"
 TEMP_DIR = BASE_DIR / "temp"
+CACHE_DIR = BASE_DIR / "cache"
 
 EXPORTS_DIR.mkdir(exist_ok=True)
 TEMP_DIR.mkdir(exist_ok=True)
+CACHE_DIR.mkdir(exist_ok=True)
 
 NEWSAPI_KEY = os.getenv("NEWSAPI_KEY", "")
 GNEWS_API_KEY = os.getenv("GNEWS_API_KEY", "")
@@ -17,6 +19,7 @@ HUNTER_API_KEY = os.getenv("HUNTER_API_KEY", "")
 BRANDFETCH_API_KEY = os.getenv("BRANDFETCH_API_KEY", "")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 OPENCORPORATES_API_KEY = os.getenv("OPENCORPORATES_API_KEY", "")
+CLEARBIT_API_KEY = os.getenv("CLEARBIT_API_KEY", "")
 LINKEDIN_CLIENT_ID = os.getenv("LINKEDIN_CLIENT_ID", "")
 LINKEDIN_CLIENT_SECRET = os.getenv("LINKEDIN_CLIENT_SECRET", "")
 LINKEDIN_ACCESS_TOKEN = os.getenv("LINKEDIN_ACCESS_TOKEN", "")
@@ -35,6 +38,203 @@ SCRAPING_CONFIG = {
     "respect_robots_txt": os.getenv("RESPECT_ROBOTS_TXT", "True").lower() == "true",
     "concurrent_requests": 8,
     "timeout": 30,
+    "max_bytes": 2 * 1024 * 1024,
+    "body_bytes": 256 * 1024,
+    "chunk_size": 16 * 1024,
+    "parser": os.getenv("HTML_PARSER", "auto"),
+    "crawl": os.getenv("SCRAPING_CRAWL", "True").lower() == "true",
+    "crawl_paths": {
+        "/about": "about",
+        "/team": "team",
+        "/leadership": "leadership",
+        "/contact": "contact",
+        "/press": "press",
+    },
+    "crawl_budget": {"pages": 6, "seconds": 15},
+    "robots_timeout": 5,
+    "robots_max_bytes": 512 * 1024,
+    "robots_max_parsers": 256,
+}
+
+RESEARCH_CONFIG = {
+    "parallel": os.getenv("RESEARCH_PARALLEL", "True").lower() == "true",
+    "max_workers": 8,
+    "source_timeout": 20,
+    "research_budget": 45,
+}
+
+NEWS_CONFIG = {
+    "default_timeout": 8,
+    "provider_timeouts": {
+        "newsapi": 8,
+        "gnews": 8,
+    },
+    "recent_days": 7,
+    "duplicate_similarity": 0.7,
+    "minhash_bands": 16,
+    "minhash_rows": 4,
+    "preferred_sources": ["Reuters", "Associated Press", "Bloomberg", "Financial Times", "The Wall Street Journal"],
+}
+
+RETRY_CONFIG = {
+    "base_delay": 1.0,
+    "max_delay": 8.0,
+    "jitter": 0.5,
+    "max_retry_after": 30,
+    "retry_statuses": [429, 500, 502, 503, 504],
+    "run_retry_budget": 6,
+    "source_retry_budget": 2,
+    "cancel_poll_interval": 0.1,
+}
+
+HTTP_POOL_CONFIG = {
+    "pool_connections": 4,
+    "pool_maxsize": 16,
+    "pool_block": False,
+}
+
+ASYNC_HTTP_CONFIG = {
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 30,
+    "timeout": 15,
+}
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+CACHE_CONFIG = {
+    "disk_path": CACHE_DIR / "research_cache.db",
+    "memory_max_entries": 512,
+    "default_ttl": DAY,
+    "ttl": {
+        "newsapi": 15 * MINUTE,
+        "gnews": 15 * MINUTE,
+        "hunter": 7 * DAY,
+        "brandfetch": 30 * DAY,
+        "opencorporates": 30 * DAY,
+        "linkedin": 7 * DAY,
+        "clearbit": 7 * DAY,
+        "web_scraping": DAY,
+        "domain_resolution": 7 * DAY,
+        "robots_txt": DAY,
+    },
+    "stale_ttl": {
+        "newsapi": HOUR,
+        "gnews": HOUR,
+        "hunter": 30 * DAY,
+        "brandfetch": 60 * DAY,
+        "opencorporates": 60 * DAY,
+        "linkedin": 30 * DAY,
+        "clearbit": 30 * DAY,
+        "web_scraping": 7 * DAY,
+        "domain_resolution": 30 * DAY,
+        "robots_txt": 7 * DAY,
+    },
+}
+
+DOMAIN_RESOLUTION_CONFIG = {
+    "tlds": ["com", "io", "co"],
+    "probe_timeout": 5,
+    "head_timeout": 3,
+}
+
+CONSOLIDATION_CONFIG = {
+    "name_similarity": 0.85,
+    "employee_tolerance": 0.25,
+    "founded_tolerance": 1,
+    "person_similarity": 0.88,
+    "max_leaders": 12,
+}
+
+OPENCORPORATES_CONFIG = {
+    "search_limit": 10,
+    "min_name_similarity": 0.75,
+    "jurisdiction_bonus": 0.15,
+    "active_bonus": 0.1,
+    "inactive_penalty": 0.2,
+    "tld_jurisdictions": {
+        "uk": "gb",
+        "ie": "ie",
+        "ca": "ca",
+        "au": "au",
+        "nz": "nz",
+        "de": "de",
+        "fr": "fr",
+        "nl": "nl",
+        "be": "be",
+        "es": "es",
+        "it": "it",
+        "ch": "ch",
+        "se": "se",
+        "no": "no",
+        "dk": "dk",
+        "fi": "fi",
+        "in": "in",
+        "sg": "sg",
+        "hk": "hk",
+        "jp": "jp",
+        "us": "us",
+    },
+}
+
+RATE_LIMITS = {
+    "hunter": {"capacity": 25, "period": 30 * DAY},
+    "brandfetch": {"capacity": 100, "period": 30 * DAY},
+    "newsapi": {"capacity": 100, "period": DAY},
+    "gnews": {"capacity": 100, "period": DAY},
+    "opencorporates": {"capacity": 500, "period": 30 * DAY},
+    "clearbit": {"capacity": 50, "period": 30 * DAY},
+}
+
+RATE_LIMIT_CONFIG = {
+    "db_path": CACHE_DIR / "rate_limits.db",
+    "max_defer": 5,
+    "default_block": 60,
+}
+
+BATCH_CONFIG = {
+    "workers": int(os.getenv("BATCH_WORKERS", "4")),
+    "progress_interval": 30,
+}
+
+DATABASE_CONFIG = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "plan_max_age": DAY,
+    "write_batch_size": 20,
+    "write_flush_interval": 2.0,
+}
+
+BLOB_STORE_CONFIG = {
+    "path": CACHE_DIR / "blobs",
+    "compression": os.getenv("BLOB_COMPRESSION", "auto"),
+    "zstd_level": 10,
+    "gzip_level": 6,
+}
+
+HTTP_CACHE_CONFIG = {
+    "enabled": os.getenv("HTTP_CACHE", "True").lower() == "true",
+    "db_path": CACHE_DIR / "http_cache.db",
+    "max_body_bytes": 5 * 1024 * 1024,
+    "max_entry_age": 30 * DAY,
+}
+
+WATCHLIST_CONFIG = {
+    "default_cadence_hours": 24,
+    "max_accounts_per_run": 25,
+    "poll_interval": 5 * MINUTE,
+    "quota_reserve": 0.2,
+    "jitter": 0.1,
+}
+
+SERVICE_CONFIG = {
+    "workers": int(os.getenv("RESEARCH_SERVICE_WORKERS", "4")),
+    "job_retention": HOUR,
+    "poll_interval": 0.5,
+    "heartbeat_interval": 30,
+    "heartbeat_timeout": 5 * MINUTE,
 }
 
 CONVERSATION_CONFIG = {
@@ -57,10 +257,12 @@ SOURCE_PRIORITIES = {
     "linkedin": 11,
     "brandfetch": 10,
     "opencorporates": 9,
+    "officers": 9,
     "hunter": 8,
     "company_website": 7,
     "newsapi": 6,
     "web_scraping": 4,
+    "web_crawl": 4,
 }
 
 EXPORT_CONFIG = {
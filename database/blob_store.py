@@ -0,0 +1,117 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from config.settings import BLOB_STORE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+REF_PREFIX = "sha256:"
+SUFFIXES = {"zstd": ".json.zst", "gzip": ".json.gz", "none": ".json"}
+
+
+class BlobStore:
+    
+    def __init__(self, root: Path = None, compression: str = None):
+        self.root = Path(root or BLOB_STORE_CONFIG["path"])
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.zstd = None
+        
+        try:
+            import zstandard
+            self.zstd = zstandard
+        except ImportError:
+            logger.info("zstandard not available, blobs will use gzip")
+        
+        compression = compression or BLOB_STORE_CONFIG["compression"]
+        if compression == "auto":
+            compression = "zstd" if self.zstd else "gzip"
+        if compression == "zstd" and not self.zstd:
+            logger.warning("zstd compression requested but zstandard is not installed, using gzip")
+            compression = "gzip"
+        self.compression = compression
+    
+    def put(self, obj: Any) -> str:
+        return self.put_bytes(json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+    
+    def put_bytes(self, payload: bytes) -> str:
+        digest = hashlib.sha256(payload).hexdigest()
+        
+        if self._find(digest) is None:
+            path = self._path(digest, self.compression)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(path, self._compress(payload, self.compression))
+        
+        return REF_PREFIX + digest
+    
+    def get(self, ref: str) -> Optional[Any]:
+        payload = self.get_bytes(ref)
+        return json.loads(payload) if payload is not None else None
+    
+    def get_bytes(self, ref: str) -> Optional[bytes]:
+        if not ref or not ref.startswith(REF_PREFIX):
+            return None
+        
+        found = self._find(ref[len(REF_PREFIX):])
+        if found is None:
+            logger.warning(f"Blob not found: {ref}")
+            return None
+        
+        path, compression = found
+        return self._decompress(path.read_bytes(), compression)
+    
+    def _path(self, digest: str, compression: str) -> Path:
+        return self.root / digest[:2] / (digest[2:] + SUFFIXES[compression])
+    
+    def _find(self, digest: str):
+        for compression in SUFFIXES:
+            path = self._path(digest, compression)
+            if path.exists():
+                return path, compression
+        return None
+    
+    def _compress(self, payload: bytes, compression: str) -> bytes:
+        if compression == "zstd":
+            return self.zstd.ZstdCompressor(level=BLOB_STORE_CONFIG["zstd_level"]).compress(payload)
+        if compression == "gzip":
+            return gzip.compress(payload, compresslevel=BLOB_STORE_CONFIG["gzip_level"])
+        return payload
+    
+    def _decompress(self, data: bytes, compression: str) -> bytes:
+        if compression == "zstd":
+            if not self.zstd:
+                raise RuntimeError("zstandard is required to read zstd blobs")
+            return self.zstd.ZstdDecompressor().decompress(data)
+        if compression == "gzip":
+            return gzip.decompress(data)
+        return data
+    
+    def _write_atomic(self, path: Path, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+_store: Optional[BlobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = BlobStore()
+    return _store
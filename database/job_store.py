@@ -0,0 +1,109 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+from config.settings import SERVICE_CONFIG
+
+from database.blob_store import get_blob_store
+from database.models import ResearchJob, get_engine
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETE = "complete"
+FAILED = "failed"
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+
+class JobStore:
+    
+    def __init__(self, engine=None):
+        self.engine = engine or get_engine()
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+    
+    def create(self, job: Dict, session_id: Optional[str] = None):
+        with self.Session() as session, session.begin():
+            session.add(ResearchJob(
+                id=job["id"],
+                session_id=session_id,
+                company_name=job["company_name"],
+                company_domain=job["company_domain"],
+                status=job["status"],
+                sources=job["sources"],
+                heartbeat_at=datetime.utcnow(),
+            ))
+    
+    def update(self, job_id: str, **fields):
+        try:
+            with self.Session() as session, session.begin():
+                record = session.get(ResearchJob, job_id)
+                if record is None:
+                    return
+                for name, value in fields.items():
+                    setattr(record, name, value)
+        except Exception as e:
+            logger.warning(f"Failed to persist research job {job_id}: {str(e)}")
+    
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self.Session() as session:
+            record = session.get(ResearchJob, job_id)
+            if record is None:
+                return None
+            return {
+                "id": record.id,
+                "company_name": record.company_name,
+                "company_domain": record.company_domain,
+                "status": record.status,
+                "sources": record.sources or {},
+                "research": get_blob_store().get(record.research_ref) if record.research_ref else record.research_data,
+                "plan": record.plan_data,
+                "error": record.error,
+                "submitted_at": record.created_at.isoformat() if record.created_at else None,
+                "finished_at": record.finished_at.isoformat() if record.finished_at else None,
+            }
+    
+    def heartbeat(self, job_ids: Iterable[str]):
+        job_ids = list(job_ids)
+        if not job_ids:
+            return
+        try:
+            with self.Session() as session, session.begin():
+                session.query(ResearchJob).filter(
+                    ResearchJob.id.in_(job_ids), ResearchJob.status.in_(ACTIVE_STATUSES)
+                ).update({"heartbeat_at": datetime.utcnow()}, synchronize_session=False)
+        except Exception as e:
+            logger.warning(f"Failed to record research job heartbeats: {str(e)}")
+    
+    def fail_interrupted(self, timeout: float = SERVICE_CONFIG["heartbeat_timeout"]) -> int:
+        now = datetime.utcnow()
+        last_seen = func.coalesce(ResearchJob.heartbeat_at, ResearchJob.updated_at, ResearchJob.created_at)
+        with self.Session() as session, session.begin():
+            records = session.query(ResearchJob).filter(
+                ResearchJob.status.in_(ACTIVE_STATUSES), last_seen < now - timedelta(seconds=timeout)
+            ).all()
+            for record in records:
+                record.status = FAILED
+                record.error = "Interrupted: the worker running it stopped responding"
+                record.finished_at = now
+        
+        if records:
+            logger.warning(f"Marked {len(records)} interrupted research jobs as failed")
+        return len(records)
+
+
+_store: Optional[JobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = JobStore()
+    return _store
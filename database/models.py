@@ -1,8 +1,12 @@
+import json
+import threading
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, create_engine
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, JSON, create_engine, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from config.settings import DATABASE_CONFIG, DATABASE_URL
+
 Base = declarative_base()
 
 
@@ -24,10 +28,13 @@ class AccountPlan(Base):
     
     id = Column(Integer, primary_key=True)
     company_name = Column(String(200), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    normalized_name = Column(String(200), index=True)
+    domain = Column(String(200), index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     plan_data = Column(JSON)
     research_data = Column(JSON)
+    research_ref = Column(String(80))
     exported_count = Column(Integer, default=0)
     last_exported = Column(DateTime)
 
@@ -42,12 +49,93 @@ class Analytics(Base):
     session_id = Column(String(100))
 
 
-def init_database(database_url: str = "sqlite:///./account_plans.db"):
-    engine = create_engine(database_url)
+class ResearchJob(Base):
+    __tablename__ = 'research_jobs'
+    
+    id = Column(String(32), primary_key=True)
+    session_id = Column(String(100), index=True)
+    company_name = Column(String(200), nullable=False)
+    company_domain = Column(String(200))
+    status = Column(String(20), nullable=False, index=True)
+    sources = Column(JSON)
+    research_data = Column(JSON)
+    research_ref = Column(String(80))
+    plan_data = Column(JSON)
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)
+
+
+class WatchlistAccount(Base):
+    __tablename__ = 'watchlist_accounts'
+    
+    id = Column(Integer, primary_key=True)
+    company_name = Column(String(200), nullable=False)
+    normalized_name = Column(String(200), unique=True, nullable=False)
+    domain = Column(String(200))
+    cadence_hours = Column(Integer, default=24)
+    next_run_at = Column(DateTime, default=datetime.utcnow, index=True)
+    last_checked_at = Column(DateTime)
+    last_changed_at = Column(DateTime)
+    snapshot_ref = Column(String(80))
+    source_timestamps = Column(JSON)
+    changed = Column(Boolean, default=False, index=True)
+    last_diff = Column(JSON)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+def _enable_wal(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _add_missing_columns(engine):
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(engine.dialect)
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+
+def init_database(database_url: str = DATABASE_URL):
+    options = {
+        "pool_size": DATABASE_CONFIG["pool_size"],
+        "max_overflow": DATABASE_CONFIG["max_overflow"],
+        "pool_pre_ping": True,
+        "json_serializer": lambda obj: json.dumps(obj, default=str),
+    }
+    if database_url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+    
+    engine = create_engine(database_url, **options)
+    if database_url.startswith("sqlite"):
+        event.listen(engine, "connect", _enable_wal)
+    
     Base.metadata.create_all(engine)
+    _add_missing_columns(engine)
     return engine
 
 
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = init_database()
+    return _engine
+
+
 def get_session(engine):
     Session = sessionmaker(bind=engine)
     return Session()
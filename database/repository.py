@@ -0,0 +1,121 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import sessionmaker
+
+from config.settings import DATABASE_CONFIG
+from database.blob_store import get_blob_store
+from database.models import AccountPlan, get_engine
+from utils.normalization import normalize_company_name, normalize_domain
+
+logger = logging.getLogger(__name__)
+
+
+class PlanRepository:
+    
+    def __init__(self, engine=None,
+                 batch_size: int = DATABASE_CONFIG["write_batch_size"],
+                 flush_interval: float = DATABASE_CONFIG["write_flush_interval"]):
+        self.engine = engine or get_engine()
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        
+        self._queue: queue.Queue = queue.Queue()
+        self._pending: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._writer = threading.Thread(target=self._write_loop, name="plan-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+    
+    def save(self, research: Dict, plan: Dict, research_ref: Optional[str] = None) -> str:
+        research_ref = research_ref or get_blob_store().put(research)
+        record = {
+            "company_name": research.get("company_name", "Unknown"),
+            "normalized_name": normalize_company_name(research.get("company_name", "")),
+            "domain": normalize_domain(research.get("consolidated", {}).get("domain")),
+            "research_ref": research_ref,
+            "plan_data": plan,
+            "created_at": datetime.utcnow(),
+        }
+        
+        with self._lock:
+            self._pending[record["normalized_name"]] = (record, research)
+        self._queue.put(record)
+        return research_ref
+    
+    def find_recent(self, company_name: str, domain: Optional[str] = None,
+                    max_age: float = DATABASE_CONFIG["plan_max_age"]) -> Optional[Dict]:
+        normalized_name = normalize_company_name(company_name)
+        domain = normalize_domain(domain)
+        cutoff = datetime.utcnow() - timedelta(seconds=max_age)
+        
+        with self._lock:
+            pending, research = self._pending.get(normalized_name, (None, None))
+        if pending and pending["created_at"] >= cutoff and (not domain or pending["domain"] == domain):
+            return {"research": research, "plan": pending["plan_data"], "research_ref": pending["research_ref"]}
+        
+        with self.Session() as session:
+            query = session.query(AccountPlan).filter(AccountPlan.created_at >= cutoff)
+            if domain:
+                query = query.filter(AccountPlan.domain == domain)
+            else:
+                query = query.filter(AccountPlan.normalized_name == normalized_name)
+            record = query.order_by(AccountPlan.created_at.desc()).first()
+            
+            if record is None:
+                return None
+            research = get_blob_store().get(record.research_ref) if record.research_ref else record.research_data
+            if research is None:
+                return None
+            logger.info(f"Serving stored account plan for {company_name} from {record.created_at}")
+            return {"research": research, "plan": record.plan_data, "research_ref": record.research_ref}
+    
+    def flush(self):
+        self._queue.join()
+    
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                pass
+            
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to persist {len(batch)} account plans: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def _write_batch(self, batch: List[Dict]):
+        with self.Session() as session, session.begin():
+            session.add_all(AccountPlan(**record) for record in batch)
+        
+        with self._lock:
+            for record in batch:
+                if self._pending.get(record["normalized_name"], (None,))[0] is record:
+                    del self._pending[record["normalized_name"]]
+        logger.info(f"Persisted {len(batch)} account plans")
+
+
+_repository: Optional[PlanRepository] = None
+_repository_lock = threading.Lock()
+
+
+def get_plan_repository() -> PlanRepository:
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                _repository = PlanRepository()
+    return _repository
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import logging
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from config.settings import ASYNC_HTTP_CONFIG, SCRAPING_CONFIG
+from research.http_cache import HttpCache, cache_key, get_http_cache
+from research.rate_limiter import get_rate_limiter
+from utils.error_handlers import async_retry_with_backoff
+from utils.retry import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    
+    if client is None or client.is_closed:
+        limits = httpx.Limits(
+            max_connections=ASYNC_HTTP_CONFIG["max_connections"],
+            max_keepalive_connections=ASYNC_HTTP_CONFIG["max_keepalive_connections"],
+            keepalive_expiry=ASYNC_HTTP_CONFIG["keepalive_expiry"],
+        )
+        client = httpx.AsyncClient(
+            limits=limits,
+            timeout=ASYNC_HTTP_CONFIG["timeout"],
+            headers={"User-Agent": SCRAPING_CONFIG["user_agent"]},
+            follow_redirects=True,
+        )
+        _clients[loop] = client
+        logger.info("Created shared async HTTP client")
+    
+    return client
+
+
+async def close_async_client():
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+async def fetch_json(url: str,
+                     params: Optional[Dict] = None,
+                     headers: Optional[Dict] = None,
+                     timeout: float = 10,
+                     max_retries: int = 3,
+                     source: Optional[str] = None) -> Any:
+    cache = get_http_cache()
+    key = cache_key(url, params, headers) if cache else None
+    
+    async def api_call():
+        entry, body = await asyncio.to_thread(_lookup, cache, key) if cache else (None, None)
+        if body is not None and cache.is_fresh(entry):
+            cache.count("fresh")
+            return json.loads(body)
+        
+        request_headers = dict(headers or {})
+        if body is not None:
+            request_headers.update(cache.conditional_headers(entry))
+        
+        if source:
+            await asyncio.to_thread(get_rate_limiter().acquire, source)
+        
+        response = await get_async_client().get(
+            url,
+            params=params,
+            headers=request_headers,
+            timeout=timeout
+        )
+        if source and response.status_code == 429:
+            await asyncio.to_thread(
+                get_rate_limiter().record_rate_limited, source, parse_retry_after(response.headers)
+            )
+        
+        if body is not None and response.status_code == 304:
+            await asyncio.to_thread(cache.revalidated, entry, response.headers)
+            return json.loads(body)
+        
+        response.raise_for_status()
+        if cache and cache.cacheable(response.status_code, response.headers):
+            await asyncio.to_thread(
+                cache.store, key, str(response.url), response.status_code, response.headers, response.content
+            )
+        return response.json()
+    
+    return await async_retry_with_backoff(api_call, max_retries=max_retries, source=source)
+
+
+def _lookup(cache: HttpCache, key: str) -> Tuple[Optional[Dict], Optional[bytes]]:
+    entry = cache.lookup(key)
+    return entry, cache.body(entry) if entry else None
@@ -0,0 +1,190 @@
+import argparse
+import concurrent.futures
+import csv
+import json
+import logging
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set
+
+from account_plan.generator import AccountPlanGenerator
+from config.settings import BATCH_CONFIG
+from research.cache import make_key
+from research.data_aggregator import DataAggregator
+
+logger = logging.getLogger(__name__)
+
+NAME_COLUMNS = ("company_name", "name", "company", "account")
+DOMAIN_COLUMNS = ("domain", "company_domain", "website", "url")
+
+
+def read_companies(path: Path) -> Iterator[Dict]:
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            rows = (json.loads(line) for line in f if line.strip())
+            yield from (_normalize_row(row) for row in rows)
+        return
+    
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            yield _normalize_row(row)
+
+
+def _normalize_row(row: Dict) -> Dict:
+    lowered = {str(k).strip().lower(): str(v or "").strip() for k, v in row.items() if k}
+    name = next((lowered[c] for c in NAME_COLUMNS if lowered.get(c)), "")
+    domain = next((lowered[c] for c in DOMAIN_COLUMNS if lowered.get(c)), "")
+    return {"company_name": name, "domain": domain or None}
+
+
+def company_key(company_name: str, domain: Optional[str]) -> str:
+    return make_key(company_name, domain or "")
+
+
+class BatchResearchRunner:
+    
+    def __init__(self,
+                 workers: int = BATCH_CONFIG["workers"],
+                 include_news: bool = True,
+                 aggregator: Optional[DataAggregator] = None,
+                 plan_generator: Optional[AccountPlanGenerator] = None):
+        self.workers = workers
+        self.include_news = include_news
+        self.aggregator = aggregator or DataAggregator()
+        self.plan_generator = plan_generator or AccountPlanGenerator()
+    
+    def run(self, input_path: Path, output_path: Path, resume: bool = True) -> Dict:
+        completed = self._load_checkpoint(output_path) if resume else set()
+        if completed:
+            logger.info(f"Resuming: {len(completed)} companies already completed")
+        
+        stats = {"processed": 0, "succeeded": 0, "failed": 0, "skipped": 0}
+        started = time.monotonic()
+        last_report = started
+        max_in_flight = self.workers * 2
+        
+        mode = "a" if resume else "w"
+        with open(output_path, mode, encoding="utf-8") as out, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=self.workers,
+                                                      thread_name_prefix="batch") as executor:
+            in_flight = set()
+            
+            for row in read_companies(input_path):
+                if not row["company_name"]:
+                    stats["skipped"] += 1
+                    continue
+                
+                key = company_key(row["company_name"], row["domain"])
+                if key in completed:
+                    stats["skipped"] += 1
+                    continue
+                completed.add(key)
+                
+                in_flight.add(executor.submit(self._process_row, key, row))
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = concurrent.futures.wait(
+                        in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    self._write_results(out, done, stats)
+                
+                if time.monotonic() - last_report >= BATCH_CONFIG["progress_interval"]:
+                    self._report(stats, started)
+                    last_report = time.monotonic()
+            
+            for future in concurrent.futures.as_completed(in_flight):
+                self._write_results(out, [future], stats)
+        
+        stats["elapsed_seconds"] = round(time.monotonic() - started, 1)
+        stats["companies_per_minute"] = self._throughput(stats, started)
+        self._report(stats, started)
+        return stats
+    
+    def _process_row(self, key: str, row: Dict) -> Dict:
+        record = {
+            "key": key,
+            "company_name": row["company_name"],
+            "domain": row["domain"],
+            "processed_at": datetime.now().isoformat(),
+        }
+        started = time.monotonic()
+        
+        try:
+            research = self.aggregator.research_company(
+                company_name=row["company_name"],
+                company_domain=row["domain"],
+                include_news=self.include_news,
+                include_officers=False,
+            )
+            record["plan"] = self.plan_generator.generate(research)
+            record["sources_used"] = research.get("sources_used", [])
+            record["status"] = "ok"
+        except Exception as e:
+            logger.error(f"Batch research failed for {row['company_name']}: {str(e)}")
+            record["status"] = "error"
+            record["error"] = str(e)
+            record["traceback"] = traceback.format_exc()
+        
+        record["duration_seconds"] = round(time.monotonic() - started, 2)
+        return record
+    
+    def _write_results(self, out, futures, stats: Dict):
+        for future in futures:
+            record = future.result()
+            out.write(json.dumps(record, default=str) + "\n")
+            out.flush()
+            
+            stats["processed"] += 1
+            if record["status"] == "ok":
+                stats["succeeded"] += 1
+            else:
+                stats["failed"] += 1
+    
+    def _load_checkpoint(self, output_path: Path) -> Set[str]:
+        completed = set()
+        if not output_path.exists():
+            return completed
+        
+        with open(output_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("status") == "ok":
+                    completed.add(record["key"])
+        return completed
+    
+    def _throughput(self, stats: Dict, started: float) -> float:
+        elapsed_minutes = (time.monotonic() - started) / 60
+        if elapsed_minutes <= 0:
+            return 0.0
+        return round(stats["processed"] / elapsed_minutes, 2)
+    
+    def _report(self, stats: Dict, started: float):
+        logger.info(
+            f"Batch progress: {stats['processed']} processed "
+            f"({stats['succeeded']} ok, {stats['failed']} failed, {stats['skipped']} skipped), "
+            f"{self._throughput(stats, started)} companies/min"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Research a list of companies and write account plans as JSONL.")
+    parser.add_argument("input", type=Path, help="CSV or JSONL file with company names and optional domains")
+    parser.add_argument("-o", "--output", type=Path, default=Path("account_plans.jsonl"),
+                        help="JSONL output file, also used as the resume checkpoint")
+    parser.add_argument("-w", "--workers", type=int, default=BATCH_CONFIG["workers"],
+                        help="Number of companies researched concurrently")
+    parser.add_argument("--no-news", action="store_true", help="Skip news sources")
+    parser.add_argument("--restart", action="store_true", help="Ignore the existing output and start over")
+    args = parser.parse_args()
+    
+    runner = BatchResearchRunner(workers=args.workers, include_news=not args.no_news)
+    stats = runner.run(args.input, args.output, resume=not args.restart)
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
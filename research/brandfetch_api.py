@@ -1,9 +1,14 @@
 import logging
 from typing import Dict, Optional
-import requests
 
 from config.settings import BRANDFETCH_API_KEY
-from utils.error_handlers import APIError, handle_errors, retry_with_backoff
+from database.blob_store import get_blob_store
+from research.async_http import fetch_json
+from research.cache import cached
+from research.domain_resolver import get_domain_resolver
+from research.http_session import get_json
+from utils.error_handlers import APIError, handle_errors
+from utils.retry import status_code
 
 logger = logging.getLogger(__name__)
 
@@ -15,36 +20,49 @@ class BrandfetchClient:
         self.base_url = "https://api.brandfetch.io/v2"
         self.enabled = True
     
+    @cached("brandfetch")
     @handle_errors("Failed to fetch data from Brandfetch")
     def get_brand_info(self, domain: str) -> Optional[Dict]:
         domain = domain.replace("http://", "").replace("https://", "").split("/")[0]
-        
+        try:
+            return self._brand_result(get_json(**self._brand_request(domain)), domain)
+        except Exception as e:
+            return self._brand_failed(e, domain)
+    
+    @cached("brandfetch")
+    @handle_errors("Failed to fetch data from Brandfetch")
+    async def get_brand_info_async(self, domain: str) -> Optional[Dict]:
+        domain = domain.replace("http://", "").replace("https://", "").split("/")[0]
+        try:
+            return self._brand_result(await fetch_json(**self._brand_request(domain)), domain)
+        except Exception as e:
+            return self._brand_failed(e, domain)
+    
+    def _brand_request(self, domain: str) -> Dict:
         headers = {}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
         
-        def api_call():
-            response = requests.get(
-                f"{self.base_url}/brands/{domain}",
-                headers=headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        
-        try:
-            data = retry_with_backoff(api_call, max_retries=3)
-            logger.info(f"Successfully fetched brand data for {domain}")
-            return self._format_brand_data(data, domain)
-            
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                logger.warning(f"Brand not found: {domain}")
-                return None
-            raise APIError(f"Brandfetch API error: {str(e)}")
-        except Exception as e:
-            logger.error(f"Brandfetch request failed: {str(e)}")
+        return {
+            "url": f"{self.base_url}/brands/{domain}",
+            "headers": headers,
+            "timeout": 10,
+            "source": "brandfetch",
+        }
+    
+    def _brand_result(self, data: Dict, domain: str) -> Dict:
+        logger.info(f"Successfully fetched brand data for {domain}")
+        return self._format_brand_data(data, domain)
+    
+    def _brand_failed(self, error: Exception, domain: str) -> None:
+        status = status_code(error)
+        if status == 404:
+            logger.warning(f"Brand not found: {domain}")
             return None
+        if status is not None:
+            raise APIError(f"Brandfetch API error: {str(error)}")
+        logger.error(f"Brandfetch request failed: {str(error)}")
+        return None
     
     def _format_brand_data(self, data: Dict, domain: str) -> Dict:
         social_links = {}
@@ -76,24 +94,13 @@ class BrandfetchClient:
             "industry": data.get("industry", ""),
             "website": data.get("domain", domain),
             "source": "Brandfetch",
-            "raw_data": data,
+            "raw_ref": get_blob_store().put(data),
         }
     
     def search_by_name(self, company_name: str) -> Optional[Dict]:
-        name_lower = company_name.lower().replace(" ", "").replace(",", "")
-        
-        common_patterns = [
-            f"{name_lower}.com",
-            f"{name_lower}.io",
-            f"{name_lower}.co",
-        ]
-        
-        for domain in common_patterns:
-            try:
-                result = self.get_brand_info(domain)
-                if result:
-                    return result
-            except:
-                continue
+        domain = get_domain_resolver().resolve(company_name)
+        if not domain:
+            logger.warning(f"Could not find domain for company: {company_name}")
+            return None
         
-        return None
+        return self.get_brand_info(domain)
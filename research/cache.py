@@ -0,0 +1,351 @@
+import asyncio
+import contextvars
+import copy
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+from config.settings import CACHE_CONFIG
+from research.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+_cache_only: contextvars.ContextVar[bool] = contextvars.ContextVar("cache_only", default=False)
+_require_fresh: contextvars.ContextVar[bool] = contextvars.ContextVar("require_fresh", default=False)
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+def normalize_key_part(value: Any) -> str:
+    if isinstance(value, str):
+        value = value.strip().lower()
+        for prefix in ("https://", "http://", "www."):
+            if value.startswith(prefix):
+                value = value[len(prefix):]
+        return value.rstrip("/")
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def make_key(*parts: Any) -> str:
+    return ":".join(normalize_key_part(part) for part in parts)
+
+
+@contextmanager
+def cache_only() -> Iterator[None]:
+    token = _cache_only.set(True)
+    try:
+        yield
+    finally:
+        _cache_only.reset(token)
+
+
+@contextmanager
+def require_fresh() -> Iterator[None]:
+    token = _require_fresh.set(True)
+    try:
+        yield
+    finally:
+        _require_fresh.reset(token)
+
+
+class ResearchCache:
+    
+    def __init__(self, db_path: str = None, max_entries: int = None):
+        self.db_path = str(db_path or CACHE_CONFIG["disk_path"])
+        self.max_entries = max_entries or CACHE_CONFIG["memory_max_entries"]
+        self.ttl = CACHE_CONFIG["ttl"]
+        self.stale_ttl = CACHE_CONFIG["stale_ttl"]
+        
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._refreshing = set()
+        self._background_tasks = set()
+        self._flights = SingleFlight("cache")
+        self._stats = defaultdict(lambda: defaultdict(int))
+        
+        self._init_disk()
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def _init_disk(self):
+        try:
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache_entries ("
+                    "source TEXT NOT NULL, "
+                    "key TEXT NOT NULL, "
+                    "value TEXT NOT NULL, "
+                    "stored_at REAL NOT NULL, "
+                    "PRIMARY KEY (source, key))"
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache unavailable, using memory only: {str(e)}")
+            self.db_path = None
+    
+    def _age_status(self, source: str, stored_at: float) -> str:
+        age = time.time() - stored_at
+        ttl = self.ttl.get(source, CACHE_CONFIG["default_ttl"])
+        if age <= ttl:
+            return FRESH
+        if age <= ttl + self.stale_ttl.get(source, 0):
+            return STALE
+        return MISS
+    
+    def lookup(self, source: str, key: str) -> Tuple[str, Any]:
+        with self._lock:
+            entry = self._memory.get((source, key))
+            if entry:
+                self._memory.move_to_end((source, key))
+        
+        if not entry:
+            entry = self._disk_get(source, key)
+            if entry:
+                self._memory_set(source, key, entry[0], entry[1])
+        
+        if not entry:
+            return MISS, None
+        
+        stored_at, value = entry
+        status = self._age_status(source, stored_at)
+        if status == MISS:
+            return MISS, None
+        return status, copy.deepcopy(value)
+    
+    def set(self, source: str, key: str, value: Any):
+        stored_at = time.time()
+        self._memory_set(source, key, stored_at, copy.deepcopy(value))
+        self._disk_set(source, key, stored_at, value)
+    
+    def invalidate(self, source: Optional[str] = None, key: Optional[str] = None):
+        with self._lock:
+            for cached_source, cached_key in list(self._memory.keys()):
+                if source and cached_source != source:
+                    continue
+                if key and cached_key != key:
+                    continue
+                del self._memory[(cached_source, cached_key)]
+        
+        if not self.db_path:
+            return
+        
+        clauses, params = [], []
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        if key:
+            clauses.append("key = ?")
+            params.append(key)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        
+        try:
+            with self._connect() as conn:
+                conn.execute(f"DELETE FROM cache_entries{where}", params)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache invalidation failed: {str(e)}")
+    
+    def get_or_fetch(self, source: str, key: str, fetch: Callable[[], Any]) -> Any:
+        status, value = self.lookup(source, key)
+        
+        if status == FRESH:
+            self._count(source, "hits")
+            return value
+        
+        if status == STALE and (_cache_only.get() or not _require_fresh.get()):
+            self._count(source, "stale_hits")
+            if not _cache_only.get():
+                self._refresh_in_background(source, key, fetch)
+            return value
+        
+        if _cache_only.get():
+            self._count(source, "skipped")
+            return None
+        
+        self._count(source, "misses")
+        return self._flights.do((source, key), lambda: self._fetch_and_store(source, key, fetch))
+    
+    def _fetch_and_store(self, source: str, key: str, fetch: Callable[[], Any]) -> Any:
+        value = fetch()
+        if value:
+            self.set(source, key, value)
+        return value
+    
+    async def get_or_fetch_async(self, source: str, key: str,
+                                 fetch: Callable[[], Awaitable[Any]]) -> Any:
+        status, value = self.lookup(source, key)
+        
+        if status == FRESH:
+            self._count(source, "hits")
+            return value
+        
+        if status == STALE and (_cache_only.get() or not _require_fresh.get()):
+            self._count(source, "stale_hits")
+            if not _cache_only.get():
+                self._refresh_async_in_background(source, key, fetch)
+            return value
+        
+        if _cache_only.get():
+            self._count(source, "skipped")
+            return None
+        
+        self._count(source, "misses")
+        return await self._flights.do_async(
+            (source, key), lambda: self._fetch_and_store_async(source, key, fetch)
+        )
+    
+    async def _fetch_and_store_async(self, source: str, key: str,
+                                     fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = await fetch()
+        if value:
+            self.set(source, key, value)
+        return value
+    
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            stats = {source: dict(counts) for source, counts in self._stats.items()}
+            stats["_memory"] = {"entries": len(self._memory), "max_entries": self.max_entries}
+        return stats
+    
+    def _refresh_in_background(self, source: str, key: str, fetch: Callable[[], Any]):
+        with self._lock:
+            if (source, key) in self._refreshing:
+                return
+            self._refreshing.add((source, key))
+        
+        def refresh():
+            try:
+                value = fetch()
+                if value:
+                    self.set(source, key, value)
+                    self._count(source, "refreshes")
+            except Exception as e:
+                self._count(source, "refresh_errors")
+                logger.warning(f"Background refresh failed for {source}:{key}: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard((source, key))
+        
+        threading.Thread(target=refresh, name=f"cache-refresh-{source}", daemon=True).start()
+    
+    def _refresh_async_in_background(self, source: str, key: str,
+                                     fetch: Callable[[], Awaitable[Any]]):
+        with self._lock:
+            if (source, key) in self._refreshing:
+                return
+            self._refreshing.add((source, key))
+        
+        async def refresh():
+            try:
+                value = await fetch()
+                if value:
+                    self.set(source, key, value)
+                    self._count(source, "refreshes")
+            except Exception as e:
+                self._count(source, "refresh_errors")
+                logger.warning(f"Background refresh failed for {source}:{key}: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard((source, key))
+        
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    def _count(self, source: str, counter: str):
+        with self._lock:
+            self._stats[source][counter] += 1
+    
+    def _memory_set(self, source: str, key: str, stored_at: float, value: Any):
+        with self._lock:
+            self._memory[(source, key)] = (stored_at, value)
+            self._memory.move_to_end((source, key))
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+    
+    def _disk_get(self, source: str, key: str) -> Optional[Tuple[float, Any]]:
+        if not self.db_path:
+            return None
+        
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT stored_at, value FROM cache_entries WHERE source = ? AND key = ?",
+                    (source, key),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed: {str(e)}")
+            return None
+        
+        if not row:
+            return None
+        return row[0], json.loads(row[1])
+    
+    def _disk_set(self, source: str, key: str, stored_at: float, value: Any):
+        if not self.db_path:
+            return
+        
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (source, key, value, stored_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (source, key, json.dumps(value, default=str), stored_at),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Disk cache write failed: {str(e)}")
+
+
+_cache: Optional[ResearchCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_research_cache() -> ResearchCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResearchCache()
+    return _cache
+
+
+def cached(source: str, key_func: Optional[Callable[..., str]] = None):
+    def decorator(func: Callable) -> Callable:
+        name = func.__name__
+        if name.endswith("_async"):
+            name = name[:-len("_async")]
+        
+        def build_key(args, kwargs) -> str:
+            if key_func:
+                return key_func(*args, **kwargs)
+            return make_key(name, *args, *sorted(kwargs.items()))
+        
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                return await get_research_cache().get_or_fetch_async(
+                    source, build_key(args, kwargs), lambda: func(self, *args, **kwargs)
+                )
+            return async_wrapper
+        
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            return get_research_cache().get_or_fetch(
+                source, build_key(args, kwargs), lambda: func(self, *args, **kwargs)
+            )
+        return wrapper
+    return decorator
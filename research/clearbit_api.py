@@ -1,9 +1,14 @@
 import logging
 from typing import Dict, Optional
-import requests
 
 from config.settings import CLEARBIT_API_KEY
-from utils.error_handlers import APIError, handle_errors, retry_with_backoff
+from database.blob_store import get_blob_store
+from research.async_http import fetch_json
+from research.cache import cached
+from research.domain_resolver import get_domain_resolver
+from research.http_session import get_json
+from utils.error_handlers import APIError, handle_errors
+from utils.retry import status_code
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +19,7 @@ class ClearbitClient:
         self.base_url = "https://company.clearbit.com/v2"
         self.enabled = bool(api_key)
     
+    @cached("clearbit")
     @handle_errors("Failed to fetch data from Clearbit")
     def enrich_company(self, domain: str) -> Optional[Dict]:
         if not self.enabled:
@@ -21,33 +27,46 @@ class ClearbitClient:
             return None
         
         domain = domain.replace("http://", "").replace("https://", "").split("/")[0]
+        try:
+            return self._enrich_result(get_json(**self._enrich_request(domain)), domain)
+        except Exception as e:
+            return self._enrich_failed(e, domain)
+    
+    @cached("clearbit")
+    @handle_errors("Failed to fetch data from Clearbit")
+    async def enrich_company_async(self, domain: str) -> Optional[Dict]:
+        if not self.enabled:
+            logger.warning("Clearbit API key not configured")
+            return None
         
-        params = {"domain": domain}
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        
-        def api_call():
-            response = requests.get(
-                f"{self.base_url}/companies/find",
-                params=params,
-                headers=headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        
+        domain = domain.replace("http://", "").replace("https://", "").split("/")[0]
         try:
-            data = retry_with_backoff(api_call, max_retries=3)
-            logger.info(f"Successfully enriched data for {domain}")
-            return self._format_company_data(data)
-            
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                logger.warning(f"Company not found in Clearbit: {domain}")
-                return None
-            raise APIError(f"Clearbit API error: {str(e)}")
+            return self._enrich_result(await fetch_json(**self._enrich_request(domain)), domain)
         except Exception as e:
-            logger.error(f"Clearbit request failed: {str(e)}")
-            raise APIError(f"Clearbit unavailable: {str(e)}")
+            return self._enrich_failed(e, domain)
+    
+    def _enrich_request(self, domain: str) -> Dict:
+        return {
+            "url": f"{self.base_url}/companies/find",
+            "params": {"domain": domain},
+            "headers": {"Authorization": f"Bearer {self.api_key}"},
+            "timeout": 10,
+            "source": "clearbit",
+        }
+    
+    def _enrich_result(self, data: Dict, domain: str) -> Dict:
+        logger.info(f"Successfully enriched data for {domain}")
+        return self._format_company_data(data)
+    
+    def _enrich_failed(self, error: Exception, domain: str) -> None:
+        status = status_code(error)
+        if status == 404:
+            logger.warning(f"Company not found in Clearbit: {domain}")
+            return None
+        if status is not None:
+            raise APIError(f"Clearbit API error: {str(error)}")
+        logger.error(f"Clearbit request failed: {str(error)}")
+        raise APIError(f"Clearbit unavailable: {str(error)}")
     
     def _format_company_data(self, data: Dict) -> Dict:
         return {
@@ -80,32 +99,19 @@ class ClearbitClient:
             "ticker": data.get("ticker", ""),
             "parent_domain": data.get("parent", {}).get("domain", ""),
             "ultimate_parent": data.get("ultimateParent", {}).get("domain", ""),
-            "raw_data": data,
+            "raw_ref": get_blob_store().put(data),
         }
     
     def search_by_name(self, company_name: str) -> Optional[Dict]:
         if not self.enabled:
             return None
         
-        name_lower = company_name.lower().replace(" ", "").replace(",", "").replace(".", "")
-        
-        common_patterns = [
-            f"{name_lower}.com",
-            f"{name_lower}.io",
-            f"{name_lower}.co",
-            f"{name_lower}.net",
-        ]
-        
-        for domain in common_patterns:
-            try:
-                result = self.enrich_company(domain)
-                if result:
-                    return result
-            except:
-                continue
+        domain = get_domain_resolver().resolve(company_name)
+        if not domain:
+            logger.warning(f"Could not find domain for company: {company_name}")
+            return None
         
-        logger.warning(f"Could not find domain for company: {company_name}")
-        return None
+        return self.enrich_company(domain)
     
     def get_technologies(self, domain: str) -> list:
         data = self.enrich_company(domain)
@@ -0,0 +1,217 @@
+import logging
+import threading
+from difflib import SequenceMatcher
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config.settings import CONSOLIDATION_CONFIG, SOURCE_PRIORITIES
+from research.leadership import merge_people
+from research.schema import CANONICAL_FIELDS, SOURCE_FIELDS, parse_range
+from utils.normalization import normalize_company_name
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "name": None,
+    "legal_name": None,
+    "domain": None,
+    "description": None,
+    "founded": None,
+    "incorporation_date": None,
+    "employees": None,
+    "employee_range": None,
+    "revenue": None,
+    "industry": None,
+    "location": {},
+    "status": None,
+    "leadership": [],
+    "social_media": {},
+    "technologies": [],
+}
+
+MERGED_FIELDS = ("social_media", "leadership")
+COMPARED_AS = {"employees": "employee_range"}
+
+
+def _name_distance(a: str, b: str) -> float:
+    a, b = normalize_company_name(a), normalize_company_name(b)
+    if a == b or set(a.split()) <= set(b.split()) or set(b.split()) <= set(a.split()):
+        return 0.0
+    ratio = SequenceMatcher(None, a, b).ratio()
+    return 0.0 if ratio >= CONSOLIDATION_CONFIG["name_similarity"] else 1 - ratio
+
+
+def _range_distance(a: Any, b: Any) -> float:
+    a, b = parse_range(a), parse_range(b)
+    if not a or not b:
+        return 0.0
+
+    tolerance = CONSOLIDATION_CONFIG["employee_tolerance"]
+    if a["min"] > b["min"]:
+        a, b = b, a
+    upper = float("inf") if a["max"] is None else a["max"] * (1 + tolerance)
+    lower = b["min"] * (1 - tolerance)
+    if lower <= upper:
+        return 0.0
+    return min(1.0, (lower - upper) / lower)
+
+
+def _year_distance(a: int, b: int) -> float:
+    gap = abs(a - b)
+    return 0.0 if gap <= CONSOLIDATION_CONFIG["founded_tolerance"] else min(1.0, gap / 10)
+
+
+def _text_distance(a: Any, b: Any) -> float:
+    return 0.0 if str(a).strip().lower() == str(b).strip().lower() else 1.0
+
+
+DISTANCES: Dict[str, Callable[[Any, Any], float]] = {
+    "name": _name_distance,
+    "legal_name": _name_distance,
+    "employee_range": _range_distance,
+    "founded": _year_distance,
+}
+
+CONFLICT_FIELDS = ["name", "employees", "founded"]
+
+
+class ConsolidationEngine:
+    
+    def __init__(self, priorities: Dict[str, int] = None, source_fields: Dict[str, Dict[str, str]] = None):
+        self.priorities = priorities or SOURCE_PRIORITIES
+        self.source_fields = source_fields or SOURCE_FIELDS
+        self.max_priority = max(self.priorities.values(), default=1) or 1
+        
+        self._plan: Dict[str, List[str]] = {
+            field: sorted(
+                (source for source, fields in self.source_fields.items() if field in fields),
+                key=lambda source: self.priorities.get(source, 0),
+                reverse=True,
+            )
+            for field in CANONICAL_FIELDS
+            if field not in MERGED_FIELDS
+        }
+    
+    def consolidate(self, canonical: Dict[str, Dict]) -> Dict:
+        consolidated, _ = self.consolidate_with_provenance(canonical)
+        return consolidated
+    
+    def consolidate_with_provenance(self, canonical: Dict[str, Dict],
+                                    timestamps: Optional[Dict[str, str]] = None) -> Tuple[Dict, Dict]:
+        consolidated = {field: _copy_default(default) for field, default in DEFAULTS.items()}
+        provenance = {}
+        
+        for field, plan in self._plan.items():
+            candidates = [source for source in plan if canonical.get(source, {}).get(field)]
+            if not candidates:
+                continue
+            
+            source = candidates[0]
+            consolidated[field] = canonical[source][field]
+            provenance[field] = {
+                "source": source,
+                "fetched_at": (timestamps or {}).get(source),
+                "confidence": self._confidence(field, source, candidates, canonical),
+            }
+        
+        consolidated["social_media"] = self.merge_social_media(canonical)
+        consolidated["leadership"] = self.merge_leadership(canonical)
+        return consolidated, provenance
+    
+    def consolidate_many(self, records: Iterable[Dict[str, Dict]],
+                         timestamps: Optional[Iterable[Optional[Dict[str, str]]]] = None) -> List[Tuple[Dict, Dict]]:
+        records = list(records)
+        timestamps = list(timestamps) if timestamps is not None else [None] * len(records)
+        results = [
+            self.consolidate_with_provenance(canonical, stamps)
+            for canonical, stamps in zip(records, timestamps)
+        ]
+        logger.info(f"Consolidated {len(records)} research records")
+        return results
+    
+    def field_value(self, field: str, canonical: Dict[str, Dict]) -> Any:
+        for source in self._plan.get(field, []):
+            value = canonical.get(source, {}).get(field)
+            if value:
+                return value
+        return None
+    
+    def detect_conflicts(self, canonical: Dict[str, Dict]) -> List[Dict]:
+        conflicts = []
+        for field in CONFLICT_FIELDS:
+            compared = COMPARED_AS.get(field, field)
+            values = {
+                source: record[compared]
+                for source, record in canonical.items()
+                if record.get(compared)
+            }
+            
+            distance = DISTANCES.get(compared, _text_distance)
+            sources = list(values)
+            severity = max(
+                (
+                    distance(values[a], values[b])
+                    for i, a in enumerate(sources)
+                    for b in sources[i + 1:]
+                ),
+                default=0.0,
+            )
+            if severity > 0:
+                conflicts.append({
+                    "field": field,
+                    "values": {source: _display(value) for source, value in values.items()},
+                    "severity": round(severity, 2),
+                    "description": f"Conflicting {field} values found",
+                })
+        
+        return conflicts
+    
+    def merge_social_media(self, canonical: Dict[str, Dict]) -> Dict:
+        social_media = {}
+        for source in sorted(canonical, key=lambda source: self.priorities.get(source, 0), reverse=True):
+            for key, value in canonical[source].get("social_media", {}).items():
+                social_media.setdefault(key, value)
+        return social_media
+    
+    def merge_leadership(self, canonical: Dict[str, Dict]) -> List[Dict]:
+        return merge_people(
+            canonical[source]["leadership"]
+            for source in sorted(canonical, key=lambda source: self.priorities.get(source, 0), reverse=True)
+            if canonical[source].get("leadership")
+        )
+    
+    def _confidence(self, field: str, source: str, candidates: List[str], canonical: Dict[str, Dict]) -> float:
+        weight = self.priorities.get(source, 0) / self.max_priority
+        compared = COMPARED_AS.get(field, field)
+        distance = DISTANCES.get(compared, _text_distance)
+        
+        winner = canonical[source].get(compared)
+        others = [canonical[other].get(compared) for other in candidates]
+        agreeing = sum(1 for other in others if other is not None and distance(winner, other) == 0)
+        return round(0.6 * weight + 0.4 * agreeing / len(candidates), 2)
+
+
+def _display(value: Any) -> Any:
+    if isinstance(value, dict) and "min" in value:
+        if value["max"] is None:
+            return f"{value['min']}+"
+        if value["max"] == value["min"]:
+            return str(value["min"])
+        return f"{value['min']}-{value['max']}"
+    return value
+
+
+def _copy_default(value: Any) -> Any:
+    return type(value)() if isinstance(value, (dict, list)) else value
+
+
+_engine: Optional[ConsolidationEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_consolidation_engine() -> ConsolidationEngine:
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = ConsolidationEngine()
+    return _engine
@@ -0,0 +1,256 @@
+import concurrent.futures
+import contextvars
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+from config.settings import CACHE_CONFIG, SCRAPING_CONFIG
+from research.cache import get_research_cache, make_key
+from research.html_extract import charset_from_content_type, decode_html, parse_html, read_capped
+from research.http_session import http_get
+
+logger = logging.getLogger(__name__)
+
+EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+ASSET_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".pdf", ".css", ".js")
+
+_request_slots = threading.BoundedSemaphore(SCRAPING_CONFIG["concurrent_requests"])
+
+
+def fetch_html(url: str, headers: Optional[Dict] = None,
+               timeout: float = SCRAPING_CONFIG["timeout"]) -> Tuple[str, bytes, Optional[str]]:
+    with _request_slots:
+        response = http_get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+        try:
+            response.raise_for_status()
+            content = read_capped(response.iter_content(chunk_size=SCRAPING_CONFIG["chunk_size"]))
+        finally:
+            response.close()
+    return response.url, content, charset_from_content_type(response.headers.get("content-type"))
+
+
+class RobotsCache:
+    
+    def __init__(self, user_agent: str = SCRAPING_CONFIG["user_agent"]):
+        self.user_agent = user_agent
+        self.cache = get_research_cache()
+        self.ttl = CACHE_CONFIG["ttl"]["robots_txt"]
+        self.max_entries = SCRAPING_CONFIG["robots_max_parsers"]
+        self._parsers: "OrderedDict[str, Tuple[float, RobotFileParser]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def check(self, url: str) -> Tuple[bool, Optional[float]]:
+        if not SCRAPING_CONFIG["respect_robots_txt"]:
+            return True, None
+        parser = self._parser(_origin(url))
+        delay = parser.crawl_delay(self.user_agent)
+        return parser.can_fetch(self.user_agent, url), float(delay) if delay else None
+    
+    def allowed(self, url: str) -> bool:
+        return self.check(url)[0]
+    
+    def crawl_delay(self, url: str) -> Optional[float]:
+        return self.check(url)[1]
+    
+    def _parser(self, origin: str) -> RobotFileParser:
+        with self._lock:
+            entry = self._parsers.get(origin)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                self._parsers.move_to_end(origin)
+                return entry[1]
+        
+        robots = self.cache.get_or_fetch("robots_txt", make_key(origin), lambda: self._download(origin))
+        
+        parser = RobotFileParser()
+        if robots is None:
+            parser.allow_all = True
+        elif robots["disallow_all"]:
+            parser.disallow_all = True
+        else:
+            parser.parse(robots["text"].splitlines())
+        with self._lock:
+            self._parsers[origin] = (time.monotonic(), parser)
+            self._parsers.move_to_end(origin)
+            while len(self._parsers) > self.max_entries:
+                self._parsers.popitem(last=False)
+        return parser
+    
+    def _download(self, origin: str) -> Optional[Dict]:
+        try:
+            response = http_get(f"{origin}/robots.txt", timeout=SCRAPING_CONFIG["robots_timeout"])
+        except Exception as e:
+            logger.warning(f"Could not fetch robots.txt for {origin}: {str(e)}")
+            return None
+        
+        if response.status_code in (401, 403):
+            return {"text": "", "disallow_all": True}
+        if response.status_code >= 400:
+            return {"text": "", "disallow_all": False}
+        return {"text": response.text[:SCRAPING_CONFIG["robots_max_bytes"]], "disallow_all": False}
+
+
+class HostThrottle:
+    
+    def __init__(self):
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def reserve(self, host: str, delay: float, deadline: Optional[float] = None) -> Optional[float]:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            if deadline is not None and slot >= deadline:
+                return None
+            self._next_slot[host] = slot + delay
+        return slot - now
+    
+    def wait(self, host: str, delay: float, deadline: Optional[float] = None) -> bool:
+        wait = self.reserve(host, delay, deadline)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
+class SiteCrawler:
+    
+    def __init__(self, headers: Optional[Dict] = None, timeout: float = SCRAPING_CONFIG["timeout"]):
+        self.headers = headers
+        self.timeout = timeout
+        self.robots = get_robots_cache()
+        self.throttle = get_host_throttle()
+    
+    def polite_fetch(self, url: str, deadline: Optional[float] = None) -> Optional[Tuple[str, bytes, Optional[str]]]:
+        allowed, delay = self.robots.check(url)
+        if not allowed:
+            logger.info(f"robots.txt disallows {url}")
+            return None
+        
+        if not self.throttle.wait(urlparse(url).netloc, self.politeness_delay(delay), deadline):
+            logger.info(f"Crawl budget exhausted before {url}")
+            return None
+        return fetch_html(url, self.headers, self.timeout)
+    
+    def politeness_delay(self, crawl_delay: Optional[float] = None) -> float:
+        return max(SCRAPING_CONFIG["download_delay"], crawl_delay or 0)
+    
+    def crawl(self, base_url: str, targets: List[Tuple[str, str]]) -> List[Dict]:
+        started = time.monotonic()
+        deadline = started + SCRAPING_CONFIG["crawl_budget"]["seconds"]
+        if not targets:
+            return []
+        
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(SCRAPING_CONFIG["concurrent_requests"], len(targets)),
+            thread_name_prefix="crawl",
+        )
+        futures = {
+            executor.submit(contextvars.copy_context().run, self._crawl_page, kind, url, deadline): url
+            for kind, url in targets
+        }
+        try:
+            done, not_done = concurrent.futures.wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        pages = []
+        for future in done:
+            try:
+                page = future.result()
+            except Exception as e:
+                logger.info(f"Crawl of {futures[future]} failed: {str(e)}")
+                continue
+            if page:
+                pages.append(page)
+        
+        pages.sort(key=lambda page: [url for _, url in targets].index(page["requested_url"]))
+        logger.info(
+            f"Crawled {len(pages)}/{len(targets)} pages of {urlparse(base_url).netloc} "
+            f"in {time.monotonic() - started:.1f}s ({len(not_done)} over budget)"
+        )
+        return pages
+    
+    def _crawl_page(self, kind: str, url: str, deadline: float) -> Optional[Dict]:
+        fetched = self.polite_fetch(url, deadline)
+        if fetched is None:
+            return None
+        
+        final_url, content, encoding = fetched
+        if urlparse(final_url).path in ("", "/"):
+            return None
+        
+        html = decode_html(content, encoding)
+        facts = parse_html(html)
+        return {
+            "kind": kind,
+            "requested_url": url,
+            "url": final_url,
+            "title": facts["title"],
+            "description": facts["meta"].get("description") or facts["paragraph"][:500],
+            "blocks": facts["blocks"],
+            "emails": sorted(set(EMAIL_PATTERN.findall(html)))[:20],
+        }
+    
+    def targets(self, base_url: str, links: List[str]) -> List[Tuple[str, str]]:
+        host = urlparse(base_url).netloc
+        paths = SCRAPING_CONFIG["crawl_paths"]
+        targets: Dict[str, Tuple[str, str]] = {}
+        
+        for link in links:
+            url = urljoin(base_url, link).split("#")[0].rstrip("/")
+            parsed = urlparse(url)
+            if parsed.netloc != host or parsed.path.lower().endswith(ASSET_EXTENSIONS):
+                continue
+            segments = [segment for segment in parsed.path.lower().split("/") if segment]
+            for path, kind in paths.items():
+                keyword = path.strip("/")
+                if segments and any(segment.startswith(keyword) for segment in segments[-2:]):
+                    if kind not in targets and not parsed.query:
+                        targets[kind] = (kind, url)
+                    break
+        
+        for path, kind in paths.items():
+            if kind not in targets:
+                targets[kind] = (kind, urljoin(base_url, path))
+        
+        seen = set()
+        unique = []
+        for kind, url in targets.values():
+            if url not in seen:
+                seen.add(url)
+                unique.append((kind, url))
+        return unique[:max(0, SCRAPING_CONFIG["crawl_budget"]["pages"] - 1)]
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+_robots: Optional[RobotsCache] = None
+_throttle: Optional[HostThrottle] = None
+_singleton_lock = threading.Lock()
+
+
+def get_robots_cache() -> RobotsCache:
+    global _robots
+    if _robots is None:
+        with _singleton_lock:
+            if _robots is None:
+                _robots = RobotsCache()
+    return _robots
+
+
+def get_host_throttle() -> HostThrottle:
+    global _throttle
+    if _throttle is None:
+        with _singleton_lock:
+            if _throttle is None:
+                _throttle = HostThrottle()
+    return _throttle
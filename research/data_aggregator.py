@@ -1,5 +1,11 @@
+import asyncio
+import contextvars
+import copy
 import logging
-from typing import Dict, Optional, List
+import queue
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, List
 from datetime import datetime
 import concurrent.futures
 
@@ -9,10 +15,31 @@ from research.brandfetch_api import BrandfetchClient
 from research.opencorporates_api import OpenCorporatesClient
 from research.linkedin_api import LinkedInClient
 from research.web_scraper import SimpleWebScraper
-from config.settings import SOURCE_PRIORITIES
+from research.consolidation import get_consolidation_engine
+from research.schema import normalize_source, normalize_sources
+from research.cache import cache_only, get_research_cache, make_key, require_fresh
+from research.domain_resolver import get_domain_resolver
+from research.rate_limiter import get_rate_limiter
+from research.single_flight import SingleFlight
+from config.settings import CACHE_CONFIG, RATE_LIMIT_CONFIG, RESEARCH_CONFIG
+from utils.retry import retry_scope
 
 logger = logging.getLogger(__name__)
 
+SOURCE_PROVIDERS = {
+    "news": ["newsapi", "gnews"],
+    "hunter": ["hunter"],
+    "brandfetch": ["brandfetch"],
+    "opencorporates": ["opencorporates"],
+    "officers": ["opencorporates"],
+}
+
+_research_flights = SingleFlight("research")
+
+_event_sink: contextvars.ContextVar[Optional[Callable[[Dict], None]]] = contextvars.ContextVar(
+    "research_event_sink", default=None
+)
+
 
 class DataAggregator:
     
@@ -25,132 +52,576 @@ class DataAggregator:
         self.web_scraper = SimpleWebScraper()
         
         self.last_research = None
-        self.cache = {}
+        self.cache = get_research_cache()
+        self.rate_limiter = get_rate_limiter()
+        self.domain_resolver = get_domain_resolver()
+        self.consolidator = get_consolidation_engine()
     
     def research_company(self, company_name: str, company_domain: Optional[str] = None,
-                        include_news: bool = True, include_officers: bool = True) -> Dict:
+                        include_news: bool = True, include_officers: bool = True,
+                        parallel: Optional[bool] = None,
+                        on_event: Optional[Callable[[Dict], None]] = None) -> Dict:
+        key = self._research_key(company_name, company_domain, include_news, include_officers)
+        token = _event_sink.set(_research_flights.publish)
+        try:
+            results = _research_flights.do(key, lambda: self._research_company(
+                company_name, company_domain, include_news, include_officers, parallel
+            ), on_event=on_event)
+        finally:
+            _event_sink.reset(token)
+        
+        if on_event:
+            on_event({"type": "complete", "research": results})
+        return results
+    
+    def research_company_stream(self, company_name: str, company_domain: Optional[str] = None,
+                                include_news: bool = True, include_officers: bool = True,
+                                parallel: Optional[bool] = None) -> Iterator[Dict]:
+        events = queue.Queue()
+        
+        def run():
+            try:
+                self.research_company(company_name, company_domain, include_news, include_officers,
+                                      parallel, on_event=events.put)
+            except Exception as e:
+                logger.error(f"Streaming research failed: {str(e)}")
+                events.put({"type": "error", "error": str(e)})
+            finally:
+                events.put(None)
+        
+        threading.Thread(target=run, name="research-stream", daemon=True).start()
+        
+        while True:
+            event = events.get()
+            if event is None:
+                return
+            yield event
+    
+    def _research_company(self, company_name: str, company_domain: Optional[str],
+                          include_news: bool, include_officers: bool,
+                          parallel: Optional[bool]) -> Dict:
         logger.info(f"Starting research for: {company_name}")
         
-        results = {
+        results = self._new_results(company_name)
+        company_domain = company_domain or self.domain_resolver.resolve(company_name)
+        results["company_domain"] = company_domain
+        results["include_news"] = include_news
+        results["include_officers"] = include_officers
+        
+        if parallel is None:
+            parallel = RESEARCH_CONFIG["parallel"]
+        
+        with retry_scope(RESEARCH_CONFIG["research_budget"]) as retry_run:
+            try:
+                if parallel:
+                    self._collect_parallel(results, company_name, company_domain, include_news)
+                else:
+                    self._collect_sequential(results, company_name, company_domain, include_news)
+            finally:
+                retry_run.cancel()
+        
+        return self._finalize(results)
+    
+    async def research_company_async(self, company_name: str, company_domain: Optional[str] = None,
+                                     include_news: bool = True, include_officers: bool = True,
+                                     on_event: Optional[Callable[[Dict], None]] = None) -> Dict:
+        key = self._research_key(company_name, company_domain, include_news, include_officers)
+        token = _event_sink.set(_research_flights.publish)
+        try:
+            results = await _research_flights.do_async(key, lambda: self._research_company_async(
+                company_name, company_domain, include_news, include_officers
+            ), on_event=on_event)
+        finally:
+            _event_sink.reset(token)
+        
+        if on_event:
+            on_event({"type": "complete", "research": results})
+        return results
+    
+    async def _research_company_async(self, company_name: str, company_domain: Optional[str],
+                                      include_news: bool, include_officers: bool) -> Dict:
+        logger.info(f"Starting async research for: {company_name}")
+        
+        results = self._new_results(company_name)
+        company_domain = company_domain or await self.domain_resolver.resolve_async(company_name)
+        results["company_domain"] = company_domain
+        results["include_news"] = include_news
+        results["include_officers"] = include_officers
+        
+        with retry_scope(RESEARCH_CONFIG["research_budget"]) as retry_run:
+            try:
+                await self._collect_async(results, company_name, company_domain, include_news)
+            finally:
+                retry_run.cancel()
+        
+        return self._finalize(results)
+    
+    def refresh_research(self, previous: Dict, sources: Optional[List[str]] = None,
+                         parallel: Optional[bool] = None) -> Dict:
+        company_name = previous["company_name"]
+        company_domain = previous.get("company_domain") or previous.get("consolidated", {}).get("domain")
+        
+        results = copy.deepcopy(previous)
+        results.setdefault("source_timestamps", {})
+        results.setdefault("canonical", {})
+        results["research_date"] = datetime.now().isoformat()
+        results["skipped_sources"] = {}
+        results["status"] = "in_progress"
+        
+        include_news = previous.get("include_news", True)
+        available = self._source_calls(company_name, company_domain, include_news)
+        if sources:
+            refresh = [source for source in sources if source in available]
+        else:
+            refresh = self._stale_sources(results, available)
+        if not refresh:
+            logger.info(f"Research for {company_name} is fresh, nothing to refresh")
+            return self._finalize(results)
+        
+        logger.info(f"Refreshing {', '.join(refresh)} for {company_name}")
+        for source in refresh:
+            if source in results["data"] and "error" in results["data"][source]:
+                del results["data"][source]
+        
+        if parallel is None:
+            parallel = RESEARCH_CONFIG["parallel"]
+        
+        with require_fresh(), retry_scope(RESEARCH_CONFIG["research_budget"]) as retry_run:
+            try:
+                if parallel:
+                    self._collect_parallel(results, company_name, company_domain, include_news, only=refresh)
+                else:
+                    self._collect_sequential(results, company_name, company_domain, include_news, only=refresh)
+            finally:
+                retry_run.cancel()
+        
+        return self._finalize(results)
+    
+    def stale_sources(self, previous: Dict) -> List[str]:
+        company_domain = previous.get("company_domain") or previous.get("consolidated", {}).get("domain")
+        available = self._source_calls(previous["company_name"], company_domain,
+                                       previous.get("include_news", True))
+        return self._stale_sources(
+            {"data": previous.get("data", {}), "source_timestamps": previous.get("source_timestamps", {})},
+            available,
+        )
+    
+    def _stale_sources(self, results: Dict, sources) -> List[str]:
+        now = datetime.now()
+        stale = []
+        for source in sources:
+            fetched_at = results["source_timestamps"].get(source)
+            if fetched_at is None or "error" in results["data"].get(source, {}):
+                stale.append(source)
+            elif (now - datetime.fromisoformat(fetched_at)).total_seconds() > self._freshness(source):
+                stale.append(source)
+        return stale
+    
+    def _freshness(self, source: str) -> float:
+        ttl = CACHE_CONFIG["ttl"]
+        providers = SOURCE_PROVIDERS.get(source, [source])
+        return min(ttl.get(provider, CACHE_CONFIG["default_ttl"]) for provider in providers)
+    
+    def _research_key(self, company_name: str, company_domain: Optional[str],
+                      include_news: bool, include_officers: bool) -> str:
+        return make_key("research", company_name, company_domain or "", include_news, include_officers)
+    
+    def _new_results(self, company_name: str) -> Dict:
+        return {
             "company_name": company_name,
             "research_date": datetime.now().isoformat(),
             "sources_used": [],
             "data": {},
+            "canonical": {},
             "news": [],
             "conflicts": [],
+            "skipped_sources": {},
+            "source_timestamps": {},
+            "company_domain": None,
+            "include_news": True,
+            "include_officers": True,
             "status": "in_progress",
         }
+    
+    def _finalize(self, results: Dict) -> Dict:
+        canonical = results.get("canonical", {})
+        results["canonical"] = {
+            source: canonical.get(source) or normalize_source(source, data)
+            for source, data in results["data"].items()
+            if data and "error" not in data
+        }
+        results["consolidated"], results["provenance"] = self.consolidator.consolidate_with_provenance(
+            results["canonical"], results.get("source_timestamps")
+        )
+        results["conflicts"] = self.consolidator.detect_conflicts(results["canonical"])
         
-        if not company_domain:
-            name_clean = company_name.lower().replace(" ", "").replace(",", "")
-            company_domain = f"{name_clean}.com"
-            logger.info(f"No domain provided, trying: {company_domain}")
+        results["status"] = "complete"
+        self.last_research = results
         
-        if include_news:
+        return results
+    
+    def _collect_sequential(self, results: Dict, company_name: str, company_domain: str,
+                            include_news: bool, only: Optional[List[str]] = None):
+        calls = {
+            source: self._with_quota(results, source, call)
+            for source, call in self._source_calls(company_name, company_domain, include_news).items()
+            if only is None or source in only
+        }
+        
+        for source, call in calls.items():
+            self._emit("started", source)
+            logger.info(f"Fetching {source} data...")
             try:
-                logger.info("Fetching news...")
-                news_result = self._fetch_news(company_name)
-                if news_result:
-                    results["news"] = news_result
-                    results["sources_used"].append("news")
-                    logger.info(f"✓ Fetched {len(news_result)} news articles")
+                value, error = call(), None
             except Exception as e:
-                logger.warning(f"News fetch failed: {str(e)}")
-                results["data"]["news"] = {"error": str(e)}
+                value, error = None, e
+            
+            follow_ups = self._handle_source_result(results, source, value, error)
+            for follow_up, argument in follow_ups.items():
+                self._emit("started", follow_up)
+                try:
+                    value, error = self._follow_up_call(follow_up, argument)(), None
+                except Exception as e:
+                    value, error = None, e
+                self._handle_source_result(results, follow_up, value, error)
+    
+    def _source_calls(self, company_name: str, company_domain: str,
+                      include_news: bool) -> Dict[str, Callable]:
+        calls = {}
+        
+        if include_news:
+            calls["news"] = lambda: self._fetch_news(company_name)
         
         if company_domain:
-            try:
-                logger.info("Fetching Hunter.io data...")
-                hunter_result = self._fetch_hunter(company_domain)
-                if hunter_result:
-                    results["data"]["hunter"] = hunter_result
-                    results["sources_used"].append("hunter")
-                    logger.info("✓ Fetched Hunter.io data")
-            except Exception as e:
-                logger.warning(f"Hunter.io fetch failed: {str(e)}")
-                results["data"]["hunter"] = {"error": str(e)}
+            calls["hunter"] = lambda: self._fetch_hunter(company_domain)
+            calls["brandfetch"] = lambda: self._fetch_brandfetch(company_domain)
+        
+        if self.opencorporates.enabled:
+            calls["opencorporates"] = lambda: self._fetch_opencorporates(company_name, company_domain)
+        else:
+            logger.info("OpenCorporates skipped (API key not configured)")
+        
+        if self.linkedin.enabled:
+            calls["linkedin"] = lambda: self._fetch_linkedin(company_name, company_domain)
+        else:
+            logger.info("LinkedIn API skipped (API key not configured)")
         
         if company_domain:
-            try:
-                logger.info("Fetching Brandfetch data...")
-                brandfetch_result = self._fetch_brandfetch(company_domain)
-                if brandfetch_result:
-                    results["data"]["brandfetch"] = brandfetch_result
-                    results["sources_used"].append("brandfetch")
-                    logger.info("✓ Fetched Brandfetch data")
-            except Exception as e:
-                logger.warning(f"Brandfetch fetch failed: {str(e)}")
-                results["data"]["brandfetch"] = {"error": str(e)}
+            calls["web_scraping"] = lambda: self.web_scraper.scrape_company_website(company_domain)
+        
+        return calls
+    
+    def _collect_parallel(self, results: Dict, company_name: str, company_domain: str,
+                          include_news: bool, only: Optional[List[str]] = None):
+        calls = {
+            source: self._with_quota(results, source, call)
+            for source, call in self._source_calls(company_name, company_domain, include_news).items()
+            if only is None or source in only
+        }
+        budget = RESEARCH_CONFIG["research_budget"]
+        source_timeout = min(RESEARCH_CONFIG["source_timeout"], budget)
+        
+        started = time.monotonic()
+        research_deadline = started + budget
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=RESEARCH_CONFIG["max_workers"],
+            thread_name_prefix="research",
+        )
+        pending = {}
+        
+        def submit(source: str, call: Callable):
+            self._emit("started", source)
+            logger.info(f"Fetching {source} data...")
+            future = executor.submit(contextvars.copy_context().run, call)
+            pending[future] = (source, min(time.monotonic() + source_timeout, research_deadline))
+        
+        try:
+            for source, call in calls.items():
+                submit(source, call)
+            
+            while pending:
+                next_deadline = min(deadline for _, deadline in pending.values())
+                done, _ = concurrent.futures.wait(
+                    pending,
+                    timeout=max(0.0, next_deadline - time.monotonic()),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                
+                for future in done:
+                    source, _ = pending.pop(future)
+                    follow_ups = self._handle_source_done(results, source, future)
+                    for follow_up, argument in follow_ups.items():
+                        submit(follow_up, self._follow_up_call(follow_up, argument))
+                
+                now = time.monotonic()
+                for future, (source, deadline) in list(pending.items()):
+                    if now >= deadline:
+                        pending.pop(future)
+                        future.cancel()
+                        self._handle_source_timeout(results, source, now - started)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        logger.info(f"Parallel research finished in {time.monotonic() - started:.1f}s")
+    
+    def _async_source_calls(self, company_name: str, company_domain: str,
+                            include_news: bool) -> Dict[str, Callable[[], Awaitable]]:
+        calls = {}
+        
+        if include_news:
+            calls["news"] = lambda: self._fetch_news_async(company_name)
+        
+        if company_domain:
+            calls["hunter"] = lambda: self.hunter.get_domain_info_async(company_domain)
+            calls["brandfetch"] = lambda: self.brandfetch.get_brand_info_async(company_domain)
         
         if self.opencorporates.enabled:
-            try:
-                logger.info("Fetching OpenCorporates data...")
-                oc_result = self._fetch_opencorporates(company_name)
-                if oc_result:
-                    results["data"]["opencorporates"] = oc_result
-                    results["sources_used"].append("opencorporates")
-                    logger.info("✓ Fetched OpenCorporates data")
-            except Exception as e:
-                logger.warning(f"OpenCorporates fetch failed: {str(e)}")
-                results["data"]["opencorporates"] = {"error": str(e)}
+            calls["opencorporates"] = lambda: self.opencorporates.find_best_match_async(company_name, company_domain)
         else:
             logger.info("OpenCorporates skipped (API key not configured)")
         
         if self.linkedin.enabled:
-            try:
-                logger.info("Fetching LinkedIn data...")
-                linkedin_result = self._fetch_linkedin(company_name, company_domain)
-                if linkedin_result:
-                    results["data"]["linkedin"] = linkedin_result
-                    results["sources_used"].append("linkedin")
-                    logger.info("✓ Fetched LinkedIn data")
-            except Exception as e:
-                logger.warning(f"LinkedIn fetch failed: {str(e)}")
-                results["data"]["linkedin"] = {"error": str(e)}
+            calls["linkedin"] = lambda: self._fetch_linkedin_async(company_name, company_domain)
         else:
             logger.info("LinkedIn API skipped (API key not configured)")
         
+        if company_domain:
+            calls["web_scraping"] = lambda: self.web_scraper.scrape_company_website_async(company_domain)
+        
+        return calls
+    
+    async def _collect_async(self, results: Dict, company_name: str, company_domain: str,
+                             include_news: bool, only: Optional[List[str]] = None):
+        calls = {
+            source: self._with_quota_async(results, source, call)
+            for source, call in self._async_source_calls(company_name, company_domain, include_news).items()
+            if only is None or source in only
+        }
+        budget = RESEARCH_CONFIG["research_budget"]
+        source_timeout = min(RESEARCH_CONFIG["source_timeout"], budget)
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        research_deadline = started + budget
+        pending = {}
+        
+        def submit(source: str, call: Callable[[], Awaitable]):
+            self._emit("started", source)
+            logger.info(f"Fetching {source} data...")
+            task = asyncio.ensure_future(call())
+            pending[task] = (source, min(loop.time() + source_timeout, research_deadline))
+        
         try:
-            logger.info("Fetching social media links via web scraping...")
-            web_data = self.web_scraper.scrape_company_website(company_domain)
-            if web_data:
-                results["data"]["web_scraping"] = web_data
-                results["sources_used"].append("web_scraping")
-                logger.info("✓ Fetched data via web scraping")
+            for source, call in calls.items():
+                submit(source, call)
+            
+            while pending:
+                next_deadline = min(deadline for _, deadline in pending.values())
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, next_deadline - loop.time()),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
                 
-                if "linkedin" not in results["data"] and web_data.get("social_media", {}).get("linkedin_id"):
-                    linkedin_vanity = web_data["social_media"]["linkedin_id"]
-                    logger.info(f"Found LinkedIn ID from web scraping: {linkedin_vanity}")
-                    if self.linkedin.enabled:
-                        try:
-                            linkedin_result = self.linkedin.get_company_by_vanity_name(linkedin_vanity)
-                            if linkedin_result:
-                                results["data"]["linkedin"] = linkedin_result
-                                results["sources_used"].append("linkedin")
-                                logger.info("✓ Fetched LinkedIn data using scraped vanity name")
-                        except Exception as e:
-                            logger.warning(f"LinkedIn fetch with vanity name failed: {str(e)}")
-        except Exception as e:
-            logger.warning(f"Web scraping failed: {str(e)}")
+                for task in done:
+                    source, _ = pending.pop(task)
+                    follow_ups = self._handle_source_done(results, source, task)
+                    for follow_up, argument in follow_ups.items():
+                        submit(follow_up, self._follow_up_call_async(follow_up, argument))
+                
+                now = loop.time()
+                for task, (source, deadline) in list(pending.items()):
+                    if now >= deadline:
+                        pending.pop(task)
+                        task.cancel()
+                        self._handle_source_timeout(results, source, now - started)
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        logger.info(f"Async research finished in {loop.time() - started:.1f}s")
+    
+    def _quota_wait(self, source: str) -> float:
+        providers = SOURCE_PROVIDERS.get(source)
+        if not providers:
+            return 0.0
+        return min(self.rate_limiter.wait_time(provider) for provider in providers)
+    
+    def _with_quota(self, results: Dict, source: str, call: Callable) -> Callable:
+        wait = self._quota_wait(source)
+        if wait <= 0:
+            return call
         
-        if not results["data"] or all(isinstance(v, dict) and "error" in v for v in results["data"].values()):
-            logger.info("No API data available, trying web scraping...")
-            try:
-                web_data = self.web_scraper.scrape_company_website(company_domain)
-                if web_data:
-                    results["data"]["web_scraping"] = web_data
-                    results["sources_used"].append("web_scraping")
-                    logger.info("✓ Fetched data via web scraping")
-            except Exception as e:
-                logger.warning(f"Web scraping failed: {str(e)}")
+        if wait <= RATE_LIMIT_CONFIG["max_defer"]:
+            logger.info(f"Deferring {source} for {wait:.1f}s to stay within quota")
+            
+            def deferred():
+                time.sleep(wait)
+                return call()
+            return deferred
+        
+        logger.warning(f"{source} quota exhausted, serving cached data only")
+        
+        def cached():
+            with cache_only():
+                value = call()
+            if not value:
+                results["skipped_sources"][source] = {
+                    "reason": "quota_exhausted",
+                    "retry_after": round(wait),
+                }
+            return value
+        return cached
+    
+    def _with_quota_async(self, results: Dict, source: str,
+                          call: Callable[[], Awaitable]) -> Callable[[], Awaitable]:
+        wait = self._quota_wait(source)
+        if wait <= 0:
+            return call
+        
+        if wait <= RATE_LIMIT_CONFIG["max_defer"]:
+            logger.info(f"Deferring {source} for {wait:.1f}s to stay within quota")
+            
+            async def deferred():
+                await asyncio.sleep(wait)
+                return await call()
+            return deferred
+        
+        logger.warning(f"{source} quota exhausted, serving cached data only")
+        
+        async def cached():
+            with cache_only():
+                value = await call()
+            if not value:
+                results["skipped_sources"][source] = {
+                    "reason": "quota_exhausted",
+                    "retry_after": round(wait),
+                }
+            return value
+        return cached
+    
+    def _handle_source_done(self, results: Dict, source: str, future) -> Dict[str, Any]:
+        try:
+            value = future.result()
+        except Exception as e:
+            return self._handle_source_result(results, source, error=e)
+        return self._handle_source_result(results, source, value)
+    
+    def _handle_source_result(self, results: Dict, source: str, value=None,
+                              error: Optional[Exception] = None) -> Dict[str, Any]:
+        if error is not None:
+            logger.warning(f"{source} fetch failed: {str(error)}")
+            if source != "linkedin_vanity":
+                results["data"].setdefault(source, {"error": str(error)})
+            self._emit("failed", source, error=str(error))
+            return {}
+        
+        if source == "officers" and value:
+            self._merge_registry_details(results, value.pop("details", {}))
+            value = value if value["officers"] else None
+        
+        self._record_source(results, source, value)
+        self._emit("finished", source, found=bool(value))
+        self._emit_snapshot(results)
+        
+        follow_ups = {}
+        if source == "web_scraping" and value:
+            vanity_name = self._linkedin_vanity_name(results, value)
+            if vanity_name:
+                follow_ups["linkedin_vanity"] = vanity_name
+            if value.get("crawl_targets"):
+                follow_ups["web_crawl"] = (value["url"], value["crawl_targets"])
+        if source == "opencorporates" and value and results.get("include_officers", True):
+            if value.get("jurisdiction") and value.get("company_number"):
+                follow_ups["officers"] = (value["jurisdiction"], value["company_number"])
+        return follow_ups
+    
+    def _follow_up_call(self, follow_up: str, argument: Any) -> Callable:
+        if follow_up == "officers":
+            return lambda: self._fetch_officers(*argument)
+        if follow_up == "web_crawl":
+            return lambda: self.web_scraper.crawl_website(*argument)
+        return lambda: self.linkedin.get_company_by_vanity_name(argument)
+    
+    def _follow_up_call_async(self, follow_up: str, argument: Any) -> Callable[[], Awaitable]:
+        if follow_up == "officers":
+            return lambda: self._fetch_officers_async(*argument)
+        if follow_up == "web_crawl":
+            return lambda: asyncio.to_thread(self.web_scraper.crawl_website, *argument)
+        return lambda: self.linkedin.get_company_by_vanity_name_async(argument)
+    
+    def _handle_source_timeout(self, results: Dict, source: str, elapsed: float):
+        logger.warning(f"{source} fetch timed out after {elapsed:.1f}s")
+        if source != "linkedin_vanity":
+            results["data"].setdefault(source, {"error": "Timed out"})
+        self._emit("failed", source, error="Timed out")
+    
+    def _emit(self, event_type: str, source: str, **fields):
+        sink = _event_sink.get()
+        if sink is None:
+            return
         
-        results["consolidated"] = self._consolidate_data(results["data"])
-        results["conflicts"] = self._detect_conflicts(results["data"])
+        try:
+            sink({"type": event_type, "source": source, **fields})
+        except Exception as e:
+            logger.warning(f"Research event handler failed: {str(e)}")
+    
+    def _emit_snapshot(self, results: Dict):
+        sink = _event_sink.get()
+        if sink is None:
+            return
+        
+        snapshot = {
+            "company_name": results["company_name"],
+            "research_date": results["research_date"],
+            "sources_used": list(results["sources_used"]),
+            "news": list(results["news"]),
+            "consolidated": self.consolidator.consolidate(results["canonical"]),
+            "conflicts": [],
+            "skipped_sources": dict(results["skipped_sources"]),
+            "status": "in_progress",
+        }
+        try:
+            sink({"type": "snapshot", "research": snapshot})
+        except Exception as e:
+            logger.warning(f"Research event handler failed: {str(e)}")
+    
+    def _linkedin_vanity_name(self, results: Dict, web_data: Dict) -> Optional[str]:
+        linkedin_vanity = web_data.get("social_media", {}).get("linkedin_id")
+        if not linkedin_vanity or not self.linkedin.enabled:
+            return None
         
-        results["status"] = "complete"
-        self.last_research = results
+        if results["data"].get("linkedin") and "error" not in results["data"]["linkedin"]:
+            return None
         
-        return results
+        logger.info(f"Found LinkedIn ID from web scraping: {linkedin_vanity}")
+        return linkedin_vanity
+    
+    def _record_source(self, results: Dict, source: str, value):
+        if not value:
+            return
+        
+        if source == "news":
+            results["news"] = value
+            results["data"].pop("news", None)
+            if "news" not in results["sources_used"]:
+                results["sources_used"].append("news")
+            results["source_timestamps"]["news"] = datetime.now().isoformat()
+            logger.info(f"✓ Fetched {len(value)} news articles")
+            return
+        
+        if source == "linkedin_vanity":
+            existing = results["data"].get("linkedin")
+            if existing and "error" not in existing:
+                return
+            source = "linkedin"
+        
+        results["data"][source] = value
+        results["canonical"][source] = normalize_source(source, value)
+        results["source_timestamps"][source] = datetime.now().isoformat()
+        if source not in results["sources_used"]:
+            results["sources_used"].append(source)
+        logger.info(f"✓ Fetched {source} data")
     
     def _fetch_news(self, company_name: str) -> List[Dict]:
         try:
@@ -175,13 +646,31 @@ class DataAggregator:
             logger.error(f"Brandfetch fetch failed: {str(e)}")
             return None
     
-    def _fetch_opencorporates(self, company_name: str) -> Optional[Dict]:
+    def _fetch_opencorporates(self, company_name: str, domain: Optional[str] = None) -> Optional[Dict]:
         try:
-            return self.opencorporates.find_best_match(company_name)
+            return self.opencorporates.find_best_match(company_name, domain)
         except Exception as e:
             logger.error(f"OpenCorporates fetch failed: {str(e)}")
             return None
     
+    def _fetch_officers(self, jurisdiction: str, company_number: str) -> Optional[Dict]:
+        calls = {
+            "details": lambda: self.opencorporates.get_company_details(jurisdiction, company_number),
+            "officers": lambda: self.opencorporates.get_company_officers(jurisdiction, company_number),
+        }
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(calls),
+                                                   thread_name_prefix="opencorporates") as executor:
+            futures = {name: executor.submit(contextvars.copy_context().run, call) for name, call in calls.items()}
+        
+        fetched = {}
+        for name, future in futures.items():
+            try:
+                fetched[name] = future.result()
+            except Exception as e:
+                logger.error(f"OpenCorporates {name} fetch failed: {str(e)}")
+                fetched[name] = None
+        return self._officers_record(jurisdiction, company_number, fetched["officers"], fetched["details"])
+    
     def _fetch_linkedin(self, company_name: str, domain: str = None) -> Optional[Dict]:
         try:
             result = self.linkedin.get_company_info(company_name)
@@ -198,180 +687,71 @@ class DataAggregator:
             logger.error(f"LinkedIn fetch failed: {str(e)}")
             return None
     
-    def _consolidate_data(self, source_data: Dict) -> Dict:
-        consolidated = {
-            "name": None,
-            "legal_name": None,
-            "domain": None,
-            "description": None,
-            "founded": None,
-            "employees": None,
-            "revenue": None,
-            "industry": None,
-            "location": {},
-            "status": None,
-            "leadership": [],
-            "social_media": {},
-            "technologies": [],
+    async def _fetch_news_async(self, company_name: str) -> List[Dict]:
+        try:
+            return await self.news_aggregator.get_aggregated_news_async(
+                company_name, days_back=30, limit=15
+            )
+        except Exception as e:
+            logger.error(f"News fetch failed: {str(e)}")
+            return []
+    
+    async def _fetch_officers_async(self, jurisdiction: str, company_number: str) -> Optional[Dict]:
+        details, officers = await asyncio.gather(
+            self.opencorporates.get_company_details_async(jurisdiction, company_number),
+            self.opencorporates.get_company_officers_async(jurisdiction, company_number),
+            return_exceptions=True,
+        )
+        if isinstance(details, Exception):
+            logger.error(f"OpenCorporates details fetch failed: {str(details)}")
+            details = None
+        if isinstance(officers, Exception):
+            logger.error(f"OpenCorporates officers fetch failed: {str(officers)}")
+            officers = None
+        return self._officers_record(jurisdiction, company_number, officers, details)
+    
+    def _officers_record(self, jurisdiction: str, company_number: str, officers: Optional[List[Dict]],
+                         details: Optional[Dict]) -> Optional[Dict]:
+        if not officers and not details:
+            return None
+        return {
+            "jurisdiction": jurisdiction,
+            "company_number": company_number,
+            "officers": officers or [],
+            "details": details or {},
         }
-        
-        for field in consolidated.keys():
-            if field == "social_media":
-                consolidated[field] = self._merge_social_media(source_data)
-            elif field == "location":
-                location = self._merge_location(source_data)
-                if location:
-                    consolidated[field] = location
-            else:
-                value = self._get_field_by_priority(field, source_data)
-                if value:
-                    consolidated[field] = value
-        
-        return consolidated
-    
-    def _merge_location(self, source_data: Dict) -> Dict:
-        location = {}
-        
-        if "linkedin" in source_data and source_data["linkedin"]:
-            hq = source_data["linkedin"].get("headquarters")
-            if hq and isinstance(hq, dict):
-                location = hq
-        
-        if not location and "opencorporates" in source_data:
-            oc_data = source_data["opencorporates"]
-            if oc_data and oc_data.get("registered_address"):
-                addr = oc_data["registered_address"]
-                location = {
-                    "city": addr.get("locality", ""),
-                    "state": addr.get("region", ""),
-                    "country": addr.get("country", "")
-                }
-        
-        return location
     
-    def _merge_social_media(self, source_data: Dict) -> Dict:
-        social_media = {}
-        
-        for source, data in source_data.items():
-            if not data or isinstance(data, dict) and "error" in data:
-                continue
-            
-            if source == "linkedin":
-                if data.get("linkedin_url"):
-                    social_media["linkedin_url"] = data["linkedin_url"]
-                if data.get("linkedin_id"):
-                    social_media["linkedin_id"] = data["linkedin_id"]
-                if data.get("vanity_name"):
-                    social_media["linkedin_vanity_name"] = data["vanity_name"]
+    def _merge_registry_details(self, results: Dict, details: Dict):
+        registry = results["data"].get("opencorporates")
+        if not registry or "error" in registry:
+            return
+        merged = dict(registry)
+        merged.update({key: value for key, value in details.items() if value not in (None, "", [])})
+        self._record_source(results, "opencorporates", merged)
+    
+    async def _fetch_linkedin_async(self, company_name: str, domain: str = None) -> Optional[Dict]:
+        try:
+            result = await self.linkedin.get_company_info_async(company_name)
+            if result:
+                return result
             
-            elif source == "web_scraping" and data.get("social_media"):
-                sm = data["social_media"]
-                for key, value in sm.items():
-                    if value and key not in social_media:
-                        social_media[key] = value
+            if domain:
+                domain_parts = domain.replace('www.', '').split('.')[0]
+                return await self.linkedin.get_company_info_async(domain_parts)
             
-            elif source == "brandfetch" and data.get("social_media"):
-                sm = data["social_media"]
-                for key, value in sm.items():
-                    if value and key not in social_media:
-                        social_media[key] = value
-        
-        return social_media
+            return None
+        except Exception as e:
+            logger.error(f"LinkedIn fetch failed: {str(e)}")
+            return None
+    
+    def _consolidate_data(self, source_data: Dict) -> Dict:
+        return self.consolidator.consolidate(normalize_sources(source_data))
     
     def _get_field_by_priority(self, field: str, source_data: Dict) -> any:
-        field_mappings = {
-            "name": {
-                "linkedin": "company_name",
-                "brandfetch": "name",
-                "hunter": "name",
-                "opencorporates": "name",
-                "web_scraping": "name",
-            },
-            "legal_name": {
-                "opencorporates": "name",
-            },
-            "domain": {
-                "hunter": "domain",
-                "brandfetch": "domain",
-                "linkedin": "website",
-                "web_scraping": "domain",
-            },
-            "description": {
-                "linkedin": "description",
-                "brandfetch": "description",
-                "web_scraping": "description",
-            },
-            "founded": {
-                "linkedin": "founded",
-                "opencorporates": "incorporation_date",
-            },
-            "employees": {
-                "linkedin": "employee_count",
-                "hunter": "employees",
-            },
-            "revenue": {},
-            "industry": {
-                "linkedin": "industry",
-                "brandfetch": "industry",
-            },
-            "status": {
-                "linkedin": "company_type",
-                "opencorporates": "status",
-            },
-            "social_media": {
-                "linkedin": "linkedin_url",
-                "brandfetch": "social_media",
-                "web_scraping": "social_media",
-            },
-        }
-        
-        if field not in field_mappings:
-            return None
-        
-        sorted_sources = sorted(
-            source_data.keys(),
-            key=lambda x: SOURCE_PRIORITIES.get(x, 0),
-            reverse=True
-        )
-        
-        for source in sorted_sources:
-            if source not in source_data or not source_data[source]:
-                continue
-            
-            if source not in field_mappings[field]:
-                continue
-            
-            source_field = field_mappings[field][source]
-            value = source_data[source].get(source_field)
-            
-            if value:
-                return value
-        
-        return None
+        return self.consolidator.field_value(field, normalize_sources(source_data))
     
     def _detect_conflicts(self, source_data: Dict) -> List[Dict]:
-        conflicts = []
-        check_fields = ["name", "employees", "founded_year", "incorporation_date"]
-        
-        for field in check_fields:
-            values = {}
-            
-            for source, data in source_data.items():
-                if not data or isinstance(data, dict) and "error" in data:
-                    continue
-                
-                value = data.get(field)
-                if value:
-                    values[source] = value
-            
-            if len(set(str(v) for v in values.values())) > 1:
-                conflicts.append({
-                    "field": field,
-                    "values": values,
-                    "description": f"Conflicting {field} values found",
-                })
-        
-        return conflicts
+        return self.consolidator.detect_conflicts(normalize_sources(source_data))
     
     def get_summary(self, research_data: Dict) -> str:
         consolidated = research_data.get("consolidated", {})
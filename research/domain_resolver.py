@@ -0,0 +1,135 @@
+import asyncio
+import concurrent.futures
+import logging
+import re
+import socket
+import threading
+from typing import Dict, List, Optional
+
+import httpx
+import requests
+
+from config.settings import DOMAIN_RESOLUTION_CONFIG
+from research.async_http import get_async_client
+from research.cache import get_research_cache, make_key
+from research.http_session import get_session_registry
+
+logger = logging.getLogger(__name__)
+
+LIVE = "live"
+RESOLVED = "resolved"
+UNRESOLVED = "unresolved"
+
+
+class DomainResolver:
+    
+    def __init__(self, tlds: List[str] = None):
+        self.tlds = tlds or DOMAIN_RESOLUTION_CONFIG["tlds"]
+        self.probe_timeout = DOMAIN_RESOLUTION_CONFIG["probe_timeout"]
+        self.head_timeout = DOMAIN_RESOLUTION_CONFIG["head_timeout"]
+        self.cache = get_research_cache()
+    
+    def candidates(self, company_name: str) -> List[str]:
+        name = re.sub(r"[^a-z0-9-]", "", company_name.lower())
+        if not name:
+            return []
+        return [f"{name}.{tld}" for tld in self.tlds]
+    
+    def resolve(self, company_name: str) -> Optional[str]:
+        candidates = self.candidates(company_name)
+        if not candidates:
+            return None
+        
+        resolution = self.cache.get_or_fetch(
+            "domain_resolution", make_key(*candidates), lambda: self._probe_all(candidates)
+        )
+        return resolution.get("domain") if resolution else None
+    
+    async def resolve_async(self, company_name: str) -> Optional[str]:
+        candidates = self.candidates(company_name)
+        if not candidates:
+            return None
+        
+        resolution = await self.cache.get_or_fetch_async(
+            "domain_resolution", make_key(*candidates), lambda: self._probe_all_async(candidates)
+        )
+        return resolution.get("domain") if resolution else None
+    
+    def _probe_all(self, candidates: List[str]) -> Optional[Dict]:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(candidates), thread_name_prefix="domain"
+        )
+        try:
+            futures = {executor.submit(self._probe, domain): domain for domain in candidates}
+            done, _ = concurrent.futures.wait(futures, timeout=self.probe_timeout)
+            checks = {domain: UNRESOLVED for domain in candidates}
+            for future in done:
+                checks[futures[future]] = future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return self._resolution(candidates, checks)
+    
+    async def _probe_all_async(self, candidates: List[str]) -> Optional[Dict]:
+        tasks = {asyncio.create_task(self._probe_async(domain)): domain for domain in candidates}
+        done, pending = await asyncio.wait(tasks, timeout=self.probe_timeout)
+        for task in pending:
+            task.cancel()
+        
+        checks = {domain: UNRESOLVED for domain in candidates}
+        for task in done:
+            checks[tasks[task]] = task.result()
+        
+        return self._resolution(candidates, checks)
+    
+    def _probe(self, domain: str) -> str:
+        try:
+            socket.getaddrinfo(domain, 443, type=socket.SOCK_STREAM)
+        except (socket.gaierror, UnicodeError):
+            return UNRESOLVED
+        
+        try:
+            response = get_session_registry().head(
+                f"https://{domain}", timeout=self.head_timeout, allow_redirects=True
+            )
+            return LIVE if response.status_code < 500 else RESOLVED
+        except requests.RequestException:
+            return RESOLVED
+    
+    async def _probe_async(self, domain: str) -> str:
+        try:
+            await asyncio.get_running_loop().getaddrinfo(domain, 443, type=socket.SOCK_STREAM)
+        except (socket.gaierror, UnicodeError):
+            return UNRESOLVED
+        
+        try:
+            response = await get_async_client().head(
+                f"https://{domain}", timeout=self.head_timeout, follow_redirects=True
+            )
+            return LIVE if response.status_code < 500 else RESOLVED
+        except httpx.HTTPError:
+            return RESOLVED
+    
+    def _resolution(self, candidates: List[str], checks: Dict[str, str]) -> Optional[Dict]:
+        domain = next((d for d in candidates if checks[d] == LIVE), None)
+        domain = domain or next((d for d in candidates if checks[d] == RESOLVED), None)
+        
+        if not domain:
+            logger.info(f"No candidate domain resolved: {', '.join(candidates)}")
+            return None
+        
+        logger.info(f"Resolved company domain: {domain}")
+        return {"domain": domain, "checks": checks}
+
+
+_resolver: Optional[DomainResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_domain_resolver() -> DomainResolver:
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = DomainResolver()
+    return _resolver
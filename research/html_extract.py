@@ -0,0 +1,275 @@
+import logging
+import re
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional
+
+from config.settings import SCRAPING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+HEAD_END = re.compile(rb"</head\s*>", re.IGNORECASE)
+BODY_START = re.compile(rb"<body[\s>]", re.IGNORECASE)
+CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([A-Za-z0-9_\-]+)""", re.IGNORECASE)
+HEADER_CHARSET = re.compile(r"charset=[\"']?([A-Za-z0-9_\-]+)", re.IGNORECASE)
+
+SOCIAL_LINK = re.compile(
+    r"(?<![\w-])(?:"
+    r"(?P<twitter_host>twitter\.com|x\.com)(?:/(?P<twitter>[A-Za-z0-9_]+))?"
+    r"|(?P<linkedin_host>linkedin\.com/company)(?:/(?P<linkedin>[A-Za-z0-9\-_]+))?"
+    r"|(?P<facebook_host>facebook\.com)(?:/(?P<facebook>[A-Za-z0-9.\-_]+))?"
+    r"|(?P<instagram_host>instagram\.com)(?:/(?P<instagram>[A-Za-z0-9._]+))?"
+    r"|(?P<youtube_host>youtube\.com)"
+    r")",
+    re.IGNORECASE,
+)
+
+MIN_PARAGRAPH = 100
+BLOCK_TAGS = ("h1", "h2", "h3", "h4", "p", "li")
+MAX_BLOCK_LENGTH = 300
+MAX_BLOCKS = 500
+
+
+class PageBuffer:
+    
+    def __init__(self, max_bytes: int = SCRAPING_CONFIG["max_bytes"],
+                 body_bytes: int = SCRAPING_CONFIG["body_bytes"]):
+        self.max_bytes = max_bytes
+        self.body_bytes = body_bytes
+        self.data = bytearray()
+        self.head_end: Optional[int] = None
+        self.body_start: Optional[int] = None
+        self.truncated = False
+    
+    def feed(self, chunk: bytes) -> bool:
+        if not chunk:
+            return False
+        
+        scan_from = max(0, len(self.data) - 16)
+        self.data.extend(chunk)
+        
+        if self.head_end is None:
+            match = HEAD_END.search(self.data, scan_from)
+            if match:
+                self.head_end = match.end()
+        if self.head_end is not None and self.body_start is None:
+            match = BODY_START.search(self.data, max(scan_from, self.head_end))
+            if match:
+                self.body_start = match.start()
+        
+        if len(self.data) >= self.limit:
+            self.truncated = True
+            return True
+        return False
+    
+    @property
+    def limit(self) -> int:
+        if self.body_start is None:
+            return self.max_bytes
+        return min(self.max_bytes, self.body_start + self.body_bytes)
+    
+    @property
+    def content(self) -> bytes:
+        return bytes(self.data[:self.limit])
+
+
+def read_capped(chunks: Iterable[bytes], buffer: Optional[PageBuffer] = None) -> bytes:
+    buffer = buffer or PageBuffer()
+    for chunk in chunks:
+        if buffer.feed(chunk):
+            break
+    return buffer.content
+
+
+def charset_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    match = HEADER_CHARSET.search(content_type or "")
+    return match.group(1) if match else None
+
+
+def decode_html(content: bytes, encoding: Optional[str] = None) -> str:
+    match = CHARSET.search(content[:2048])
+    for candidate in (match.group(1).decode("ascii") if match else None, encoding, "utf-8"):
+        if not candidate:
+            continue
+        try:
+            return content.decode(candidate, errors="replace")
+        except LookupError:
+            continue
+    return content.decode("utf-8", errors="replace")
+
+
+def extract_social_links(hrefs: Iterable[str]) -> Dict[str, str]:
+    social_media = {}
+    
+    for href in hrefs:
+        match = SOCIAL_LINK.search(href) if href else None
+        if not match:
+            continue
+        
+        if match.group("twitter_host"):
+            social_media["twitter_url"] = href
+            if match.group("twitter"):
+                social_media["twitter_id"] = match.group("twitter")
+                social_media["twitter_handle"] = f"@{match.group('twitter')}"
+        elif match.group("linkedin_host"):
+            social_media["linkedin_url"] = href
+            if match.group("linkedin"):
+                social_media["linkedin_id"] = match.group("linkedin")
+                social_media["linkedin_vanity_name"] = match.group("linkedin")
+        elif match.group("facebook_host"):
+            social_media["facebook_url"] = href
+            if match.group("facebook"):
+                social_media["facebook_id"] = match.group("facebook")
+        elif match.group("instagram_host"):
+            social_media["instagram_url"] = href
+            if match.group("instagram"):
+                social_media["instagram_id"] = match.group("instagram")
+        elif match.group("youtube_host"):
+            social_media["youtube_url"] = href
+    
+    return social_media
+
+
+class _FactParser(HTMLParser):
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.facts = _empty_facts()
+        self._in_title = False
+        self._title: List[str] = []
+        self._paragraph: Optional[List[str]] = None
+        self._block_tag: Optional[str] = None
+        self._block: List[str] = []
+    
+    def handle_starttag(self, tag: str, attrs):
+        if tag in BLOCK_TAGS and self._block_tag is None:
+            self._block_tag = tag
+            self._block = []
+        
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.facts["links"].append(href)
+        elif tag == "meta":
+            _add_meta(self.facts["meta"], dict(attrs))
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "p" and not self.facts["paragraph"]:
+            self._paragraph = []
+    
+    def handle_endtag(self, tag: str):
+        if tag == self._block_tag:
+            _add_block(self.facts["blocks"], "".join(self._block))
+            self._block_tag = None
+        
+        if tag == "title":
+            self._in_title = False
+        elif tag == "p" and self._paragraph is not None:
+            text = "".join(self._paragraph).strip()
+            if len(text) > MIN_PARAGRAPH:
+                self.facts["paragraph"] = text
+            self._paragraph = None
+    
+    def handle_data(self, data: str):
+        if self._in_title:
+            self._title.append(data)
+        if self._paragraph is not None:
+            self._paragraph.append(data)
+        if self._block_tag is not None:
+            self._block.append(data)
+    
+    def close(self):
+        super().close()
+        self.facts["title"] = "".join(self._title).strip()
+
+
+def _empty_facts() -> Dict:
+    return {"title": "", "meta": {}, "paragraph": "", "links": [], "blocks": []}
+
+
+def _add_block(blocks: List[str], text: str):
+    text = " ".join(text.split())
+    if text and len(text) <= MAX_BLOCK_LENGTH and len(blocks) < MAX_BLOCKS:
+        blocks.append(text)
+
+
+def _add_meta(meta: Dict[str, str], attrs: Dict):
+    key = attrs.get("property") or attrs.get("name")
+    content = attrs.get("content")
+    if key and content:
+        meta.setdefault(key.lower(), content)
+
+
+def _parse_selectolax(html: str) -> Dict:
+    tree = _selectolax.HTMLParser(html)
+    facts = _empty_facts()
+    
+    title = tree.css_first("title")
+    facts["title"] = title.text().strip() if title else ""
+    for node in tree.css("meta"):
+        _add_meta(facts["meta"], node.attributes)
+    for node in tree.css("p"):
+        text = node.text().strip()
+        if len(text) > MIN_PARAGRAPH:
+            facts["paragraph"] = text
+            break
+    facts["links"] = [node.attributes.get("href") for node in tree.css("a[href]")]
+    for node in tree.css(",".join(BLOCK_TAGS)):
+        _add_block(facts["blocks"], node.text(separator=" "))
+    return facts
+
+
+def _parse_lxml(html: str) -> Dict:
+    document = _lxml_html.fromstring(html)
+    facts = _empty_facts()
+    
+    facts["title"] = (document.findtext(".//title") or "").strip()
+    for node in document.iter("meta"):
+        _add_meta(facts["meta"], node.attrib)
+    for node in document.iter("p"):
+        text = node.text_content().strip()
+        if len(text) > MIN_PARAGRAPH:
+            facts["paragraph"] = text
+            break
+    facts["links"] = [node.get("href") for node in document.iter("a") if node.get("href")]
+    for node in document.iter(*BLOCK_TAGS):
+        _add_block(facts["blocks"], node.text_content())
+    return facts
+
+
+def _parse_stdlib(html: str) -> Dict:
+    parser = _FactParser()
+    parser.feed(html)
+    parser.close()
+    return parser.facts
+
+
+try:
+    from selectolax import parser as _selectolax
+except ImportError:
+    _selectolax = None
+
+try:
+    from lxml import html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
+BACKENDS = {"selectolax": _parse_selectolax, "lxml": _parse_lxml, "stdlib": _parse_stdlib}
+
+
+def available_backends() -> List[str]:
+    return [
+        name for name, module in (("selectolax", _selectolax), ("lxml", _lxml_html), ("stdlib", True))
+        if module
+    ]
+
+
+def parse_html(html: str, backend: Optional[str] = None) -> Dict:
+    backend = backend or SCRAPING_CONFIG["parser"]
+    if backend == "auto" or backend not in available_backends():
+        if backend != "auto":
+            logger.warning(f"HTML parser {backend} not available, falling back")
+        backend = available_backends()[0]
+    
+    if not html.strip():
+        return _empty_facts()
+    return BACKENDS[backend](html)
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlencode, urlparse
+
+from config.settings import HTTP_CACHE_CONFIG
+from database.blob_store import get_blob_store
+
+logger = logging.getLogger(__name__)
+
+STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "expires", "date")
+VARY_HEADERS = ("accept", "accept-language", "authorization")
+MAX_AGE = re.compile(r"max-age=(\d+)", re.IGNORECASE)
+
+
+def cache_key(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> str:
+    headers = {name.lower(): value for name, value in (headers or {}).items()}
+    parts = [
+        url,
+        urlencode(sorted((params or {}).items()), doseq=True),
+        json.dumps({name: headers.get(name) for name in VARY_HEADERS}, sort_keys=True),
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    
+    def __init__(self, db_path: str = None):
+        self.db_path = str(db_path or HTTP_CACHE_CONFIG["db_path"])
+        self.blob_store = get_blob_store()
+        self._stats = defaultdict(int)
+        self._lock = threading.Lock()
+        self._init_disk()
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def _init_disk(self):
+        try:
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS http_entries ("
+                    "key TEXT PRIMARY KEY, "
+                    "url TEXT NOT NULL, "
+                    "status INTEGER NOT NULL, "
+                    "headers TEXT NOT NULL, "
+                    "body_ref TEXT NOT NULL, "
+                    "partial INTEGER NOT NULL, "
+                    "stored_at REAL NOT NULL, "
+                    "expires_at REAL NOT NULL)"
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache unavailable: {str(e)}")
+            self.db_path = None
+    
+    def lookup(self, key: str, allow_partial: bool = False) -> Optional[Dict]:
+        if not self.db_path:
+            return None
+        
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT url, status, headers, body_ref, partial, stored_at, expires_at "
+                    "FROM http_entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache read failed: {str(e)}")
+            return None
+        
+        if row is None or (row[4] and not allow_partial):
+            return None
+        if time.time() - row[5] > HTTP_CACHE_CONFIG["max_entry_age"]:
+            return None
+        
+        return {
+            "key": key,
+            "url": row[0],
+            "status": row[1],
+            "headers": json.loads(row[2]),
+            "body_ref": row[3],
+            "partial": bool(row[4]),
+            "stored_at": row[5],
+            "expires_at": row[6],
+        }
+    
+    def is_fresh(self, entry: Dict) -> bool:
+        return entry["expires_at"] > time.time()
+    
+    def conditional_headers(self, entry: Dict) -> Dict[str, str]:
+        headers = {}
+        if entry["headers"].get("etag"):
+            headers["If-None-Match"] = entry["headers"]["etag"]
+        if entry["headers"].get("last-modified"):
+            headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+        return headers
+    
+    def body(self, entry: Dict) -> Optional[bytes]:
+        return self.blob_store.get_bytes(entry["body_ref"])
+    
+    def cacheable(self, status: int, headers: Dict[str, str]) -> bool:
+        headers = _lower(headers)
+        cache_control = headers.get("cache-control", "").lower()
+        if status != 200 or "no-store" in cache_control:
+            return False
+        return bool(headers.get("etag") or headers.get("last-modified") or self._lifetime(headers) > 0)
+    
+    def store(self, key: str, url: str, status: int, headers: Dict[str, str], body: bytes, partial: bool = False):
+        if not self.db_path or len(body) > HTTP_CACHE_CONFIG["max_body_bytes"]:
+            return
+        
+        headers = _lower(headers)
+        stored = {name: headers[name] for name in STORED_HEADERS if headers.get(name)}
+        now = time.time()
+        try:
+            body_ref = self.blob_store.put_bytes(body)
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_entries "
+                    "(key, url, status, headers, body_ref, partial, stored_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, _redacted(url), status, json.dumps(stored), body_ref, int(partial),
+                     now, now + self._lifetime(headers)),
+                )
+            self.count("stored")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"HTTP cache write failed for {_redacted(url)}: {str(e)}")
+    
+    def revalidated(self, entry: Dict, headers: Dict[str, str]):
+        headers = _lower(headers)
+        entry["headers"].update({name: headers[name] for name in STORED_HEADERS if headers.get(name)})
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "UPDATE http_entries SET headers = ?, stored_at = ?, expires_at = ? WHERE key = ?",
+                    (json.dumps(entry["headers"]), now, now + self._lifetime(entry["headers"]), entry["key"]),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache update failed: {str(e)}")
+        self.count("revalidated")
+    
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+    
+    def count(self, event: str):
+        with self._lock:
+            self._stats[event] += 1
+    
+    def _lifetime(self, headers: Dict[str, str]) -> float:
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-cache" in cache_control or "must-revalidate" in cache_control:
+            return 0.0
+        
+        match = MAX_AGE.search(cache_control)
+        if match:
+            return float(match.group(1))
+        
+        if headers.get("expires"):
+            try:
+                expires = parsedate_to_datetime(headers["expires"]).timestamp()
+                date = parsedate_to_datetime(headers["date"]).timestamp() if headers.get("date") else time.time()
+                return max(0.0, expires - date)
+            except (TypeError, ValueError):
+                return 0.0
+        return 0.0
+
+
+def _lower(headers) -> Dict[str, str]:
+    return {name.lower(): value for name, value in dict(headers or {}).items()}
+
+
+def _redacted(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+
+_cache: Optional[HttpCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    global _cache
+    if not HTTP_CACHE_CONFIG["enabled"]:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = HttpCache()
+    return _cache
@@ -0,0 +1,216 @@
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from config.settings import HTTP_POOL_CONFIG, SCRAPING_CONFIG
+from research.http_cache import HttpCache, cache_key, get_http_cache
+from research.rate_limiter import get_rate_limiter
+from utils.retry import RetryPolicy, call_with_retry, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRegistry:
+    
+    def __init__(self,
+                 pool_connections: int = HTTP_POOL_CONFIG["pool_connections"],
+                 pool_maxsize: int = HTTP_POOL_CONFIG["pool_maxsize"]):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        
+        self._sessions: Dict[str, requests.Session] = {}
+        self._request_counts = defaultdict(int)
+        self._lock = threading.Lock()
+    
+    def get_session(self, host: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._build_session()
+                self._sessions[host] = session
+                logger.info(f"Created pooled HTTP session for {host}")
+            return session
+    
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": SCRAPING_CONFIG["user_agent"],
+            "Connection": "keep-alive",
+        })
+        
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=HTTP_POOL_CONFIG["pool_block"],
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        host = urlparse(url).netloc
+        with self._lock:
+            self._request_counts[host] += 1
+        return self.get_session(host).request(method, url, **kwargs)
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+    
+    def head(self, url: str, **kwargs) -> requests.Response:
+        return self.request("HEAD", url, **kwargs)
+    
+    def get_stats(self) -> Dict[str, Dict]:
+        stats = {}
+        totals = {"requests": 0, "connections_opened": 0}
+        
+        with self._lock:
+            sessions = dict(self._sessions)
+            request_counts = dict(self._request_counts)
+        
+        for host, session in sessions.items():
+            adapter = session.get_adapter("https://")
+            pools = adapter.poolmanager.pools
+            connections = 0
+            pool_requests = 0
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections += pool.num_connections
+                pool_requests += pool.num_requests
+            
+            stats[host] = {
+                "requests": request_counts.get(host, 0),
+                "connections_opened": connections,
+                "connections_reused": max(pool_requests - connections, 0),
+            }
+            totals["requests"] += pool_requests
+            totals["connections_opened"] += connections
+        
+        totals["connections_reused"] = max(totals["requests"] - totals["connections_opened"], 0)
+        totals["reuse_ratio"] = (
+            totals["connections_reused"] / totals["requests"] if totals["requests"] else 0.0
+        )
+        stats["_total"] = totals
+        return stats
+    
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_registry: Optional[SessionRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_session_registry() -> SessionRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SessionRegistry()
+    return _registry
+
+
+def http_get(url: str, provider: Optional[str] = None, **kwargs) -> requests.Response:
+    cache = get_http_cache()
+    stream = kwargs.get("stream", False)
+    key = cache_key(url, kwargs.get("params"), kwargs.get("headers")) if cache else None
+    entry = cache.lookup(key, allow_partial=stream) if cache else None
+    body = cache.body(entry) if entry else None
+    
+    if body is not None and cache.is_fresh(entry):
+        cache.count("fresh")
+        return _cached_response(entry, body, url)
+    
+    if body is not None:
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), **cache.conditional_headers(entry)}
+    
+    if provider:
+        get_rate_limiter().acquire(provider)
+    
+    response = get_session_registry().get(url, **kwargs)
+    
+    if provider and response.status_code == 429:
+        get_rate_limiter().record_rate_limited(provider, parse_retry_after(response.headers))
+    
+    if body is not None and response.status_code == 304:
+        response.close()
+        cache.revalidated(entry, response.headers)
+        return _cached_response(entry, body, response.url or url)
+    
+    if cache and cache.cacheable(response.status_code, response.headers):
+        if stream:
+            return _RecordingResponse(response, cache, key)
+        cache.store(key, response.url, response.status_code, response.headers, response.content)
+    return response
+
+
+def get_json(url: str,
+             params: Optional[Dict] = None,
+             headers: Optional[Dict] = None,
+             timeout: float = 10,
+             max_retries: int = 3,
+             source: Optional[str] = None) -> Any:
+    def api_call():
+        response = http_get(url, provider=source, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    
+    return call_with_retry(api_call, RetryPolicy(max_attempts=max_retries), source=source)
+
+
+def _cached_response(entry: Dict, body: bytes, url: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.url = url
+    response._content = body
+    response._content_consumed = True
+    response.encoding = get_encoding_from_headers(response.headers)
+    return response
+
+
+class _RecordingResponse:
+    
+    def __init__(self, response: requests.Response, cache: HttpCache, key: str):
+        self._response = response
+        self._cache = cache
+        self._key = key
+        self._chunks = []
+        self._complete = False
+        self._stored = False
+    
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+    
+    def iter_content(self, chunk_size: int = 1, decode_unicode: bool = False):
+        for chunk in self._response.iter_content(chunk_size=chunk_size):
+            self._chunks.append(chunk)
+            yield chunk
+        self._complete = True
+    
+    def close(self):
+        self._response.close()
+        if self._chunks and not self._stored:
+            self._stored = True
+            self._cache.store(
+                self._key, self._response.url, self._response.status_code, self._response.headers,
+                b"".join(self._chunks), partial=not self._complete,
+            )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
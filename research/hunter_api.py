@@ -1,9 +1,14 @@
 import logging
 from typing import Dict, Optional
-import requests
 
 from config.settings import HUNTER_API_KEY
-from utils.error_handlers import APIError, handle_errors, retry_with_backoff
+from database.blob_store import get_blob_store
+from research.async_http import fetch_json
+from research.cache import cached
+from research.domain_resolver import get_domain_resolver
+from research.http_session import get_json
+from utils.error_handlers import APIError, handle_errors
+from utils.retry import status_code
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +20,7 @@ class HunterClient:
         self.base_url = "https://api.hunter.io/v2"
         self.enabled = bool(api_key)
     
+    @cached("hunter")
     @handle_errors("Failed to fetch data from Hunter.io")
     def get_domain_info(self, domain: str) -> Optional[Dict]:
         if not self.enabled:
@@ -22,37 +28,50 @@ class HunterClient:
             return None
         
         domain = domain.replace("http://", "").replace("https://", "").split("/")[0]
-        
-        params = {
-            "domain": domain,
-            "api_key": self.api_key
-        }
-        
-        def api_call():
-            response = requests.get(
-                f"{self.base_url}/domain-search",
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        
         try:
-            data = retry_with_backoff(api_call, max_retries=3)
-            
-            if data.get("data"):
-                logger.info(f"Successfully fetched data from Hunter.io for {domain}")
-                return self._format_company_data(data["data"], domain)
+            return self._domain_result(get_json(**self._domain_request(domain)), domain)
+        except Exception as e:
+            return self._domain_failed(e, domain)
+    
+    @cached("hunter")
+    @handle_errors("Failed to fetch data from Hunter.io")
+    async def get_domain_info_async(self, domain: str) -> Optional[Dict]:
+        if not self.enabled:
+            logger.warning("Hunter.io API key not configured")
             return None
-            
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                logger.warning(f"Domain not found in Hunter.io: {domain}")
-                return None
-            raise APIError(f"Hunter.io API error: {str(e)}")
+        
+        domain = domain.replace("http://", "").replace("https://", "").split("/")[0]
+        try:
+            return self._domain_result(await fetch_json(**self._domain_request(domain)), domain)
         except Exception as e:
-            logger.error(f"Hunter.io request failed: {str(e)}")
+            return self._domain_failed(e, domain)
+    
+    def _domain_request(self, domain: str) -> Dict:
+        return {
+            "url": f"{self.base_url}/domain-search",
+            "params": {
+                "domain": domain,
+                "api_key": self.api_key
+            },
+            "timeout": 10,
+            "source": "hunter",
+        }
+    
+    def _domain_result(self, data: Dict, domain: str) -> Optional[Dict]:
+        if data.get("data"):
+            logger.info(f"Successfully fetched data from Hunter.io for {domain}")
+            return self._format_company_data(data["data"], domain)
+        return None
+    
+    def _domain_failed(self, error: Exception, domain: str) -> None:
+        status = status_code(error)
+        if status == 404:
+            logger.warning(f"Domain not found in Hunter.io: {domain}")
             return None
+        if status is not None:
+            raise APIError(f"Hunter.io API error: {str(error)}")
+        logger.error(f"Hunter.io request failed: {str(error)}")
+        return None
     
     def _format_company_data(self, data: Dict, domain: str) -> Dict:
         return {
@@ -67,27 +86,16 @@ class HunterClient:
                 "linkedin": data.get("linkedin", ""),
             },
             "source": "Hunter.io",
-            "raw_data": data,
+            "raw_ref": get_blob_store().put(data),
         }
     
     def search_by_name(self, company_name: str) -> Optional[Dict]:
         if not self.enabled:
             return None
         
-        name_lower = company_name.lower().replace(" ", "").replace(",", "").replace(".", "")
-        
-        common_patterns = [
-            f"{name_lower}.com",
-            f"{name_lower}.io",
-            f"{name_lower}.co",
-        ]
-        
-        for domain in common_patterns:
-            try:
-                result = self.get_domain_info(domain)
-                if result:
-                    return result
-            except:
-                continue
+        domain = get_domain_resolver().resolve(company_name)
+        if not domain:
+            logger.warning(f"Could not find domain for company: {company_name}")
+            return None
         
-        return None
+        return self.get_domain_info(domain)
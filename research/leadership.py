@@ -0,0 +1,191 @@
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Iterable, List, Optional
+
+from config.settings import CONSOLIDATION_CONFIG
+
+HONORIFICS = frozenset("mr mrs ms miss dr prof sir dame lord lady".split())
+SUFFIXES = frozenset("jr sr ii iii iv phd md mba cpa esq obe mbe cbe".split())
+ORGANIZATION_WORDS = frozenset(
+    "limited ltd llc llp inc corp corporation plc gmbh bv nv sa sarl company services secretaries nominees".split()
+)
+
+TITLE_RANKS = [
+    (re.compile(r"\b(ceo|chief executive|managing director|founder|co-founder|president)\b", re.IGNORECASE), 0),
+    (re.compile(r"\b(chair|chairman|chairwoman|chairperson)\b", re.IGNORECASE), 1),
+    (re.compile(r"\b(c[a-z]o|chief)\b", re.IGNORECASE), 2),
+    (re.compile(r"\b(evp|svp|vp|vice president|general manager|partner)\b", re.IGNORECASE), 3),
+    (re.compile(r"\b(head|director|officer|secretary|treasurer|board)\b", re.IGNORECASE), 4),
+]
+NOT_LEADERSHIP = re.compile(r"\b(assistant|intern|associate|coordinator)\b", re.IGNORECASE)
+NAME_AND_TITLE = re.compile(r"^(?P<name>[^,|–—]{4,60}?)\s*(?:,|\||–|—|\s-\s)\s*(?P<title>.{2,80})$")
+WORD = re.compile(r"[a-z]+")
+
+
+def title_rank(title: Optional[str]) -> Optional[int]:
+    if not title or NOT_LEADERSHIP.search(title):
+        return None
+    for pattern, rank in TITLE_RANKS:
+        if pattern.search(title):
+            return rank
+    return None
+
+
+def name_tokens(name: str) -> List[str]:
+    if "," in name:
+        last, _, first = name.partition(",")
+        name = f"{first} {last}"
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return [
+        token for token in WORD.findall(ascii_name.lower())
+        if token not in HONORIFICS and token not in SUFFIXES
+    ]
+
+
+def same_person(a: List[str], b: List[str]) -> bool:
+    if not a or not b:
+        return False
+    if a == b:
+        return True
+    if a[-1] == b[-1] and (a[0].startswith(b[0]) or b[0].startswith(a[0])):
+        return True
+    ratio = SequenceMatcher(None, " ".join(a), " ".join(b)).ratio()
+    return ratio >= CONSOLIDATION_CONFIG["person_similarity"]
+
+
+def display_name(name: str) -> str:
+    name = " ".join(name.split())
+    if "," in name:
+        last, _, first = name.partition(",")
+        name = f"{first.strip()} {last.strip()}"
+    return " ".join(word.title() if word.isupper() or word.islower() else word for word in name.split())
+
+
+def looks_like_name(text: str) -> bool:
+    words = text.split()
+    return 2 <= len(words) <= 4 and all(
+        word[0].isupper() and all(char.isalpha() or char in "'-." for char in word)
+        for word in words
+    )
+
+
+def _person(name: str, title: Optional[str], source: str, **fields) -> Optional[Dict]:
+    tokens = name_tokens(name or "")
+    if len(tokens) < 2 or ORGANIZATION_WORDS & set(tokens):
+        return None
+    person = {"name": display_name(name), "title": " ".join((title or "").split()) or None, "sources": [source]}
+    person.update({key: value for key, value in fields.items() if value})
+    return person
+
+
+def people_from_officers(data: Dict) -> List[Dict]:
+    people = []
+    for officer in data.get("officers", []):
+        if officer.get("end_date"):
+            continue
+        person = _person(officer.get("name"), officer.get("position"), "officers")
+        if person:
+            people.append(person)
+    return people
+
+
+def people_from_hunter(data: Dict) -> List[Dict]:
+    people = []
+    for contact in data.get("emails_found") or []:
+        title = contact.get("position")
+        if contact.get("seniority") != "executive" and title_rank(title) is None:
+            continue
+        name = f"{contact.get('first_name') or ''} {contact.get('last_name') or ''}"
+        person = _person(name, title, "hunter", email=contact.get("value"), linkedin=contact.get("linkedin"))
+        if person:
+            people.append(person)
+    return people
+
+
+def people_from_pages(data: Dict) -> List[Dict]:
+    people = []
+    for page in data.get("pages") or []:
+        if page.get("kind") not in ("team", "leadership", "about"):
+            continue
+        
+        blocks = page.get("blocks", [])
+        for index, block in enumerate(blocks):
+            match = NAME_AND_TITLE.match(block)
+            if match and looks_like_name(match.group("name")) and title_rank(match.group("title")) is not None:
+                name, title = match.group("name").strip(), match.group("title")
+            elif looks_like_name(block) and index + 1 < len(blocks) and title_rank(blocks[index + 1]) is not None:
+                name, title = block, blocks[index + 1]
+            else:
+                continue
+            
+            if title_rank(name) is not None or len(title) > 80:
+                continue
+            person = _person(name, title, "web_scraping")
+            if person:
+                people.append(person)
+    return people
+
+
+EXTRACTORS: Dict[str, Callable[[Dict], List[Dict]]] = {
+    "officers": people_from_officers,
+    "hunter": people_from_hunter,
+    "web_scraping": people_from_pages,
+    "web_crawl": people_from_pages,
+}
+
+
+def merge_people(groups: Iterable[List[Dict]]) -> List[Dict]:
+    merged: List[Dict] = []
+    keys: List[List[str]] = []
+    
+    for people in groups:
+        for person in people:
+            tokens = name_tokens(person["name"])
+            for index, existing in enumerate(keys):
+                if same_person(tokens, existing):
+                    _absorb(merged[index], person)
+                    if len(tokens) > len(existing):
+                        keys[index] = tokens
+                    break
+            else:
+                merged.append(dict(person, sources=list(person["sources"])))
+                keys.append(tokens)
+    
+    ranked = [
+        (title_rank(person.get("title")), -len(person["sources"]), order, person)
+        for order, person in enumerate(merged)
+    ]
+    ranked = [item for item in ranked if item[0] is not None]
+    ranked.sort(key=lambda item: item[:3])
+    return [person for *_, person in ranked][:CONSOLIDATION_CONFIG["max_leaders"]]
+
+
+def _absorb(person: Dict, other: Dict):
+    for key, value in other.items():
+        if key == "sources":
+            person["sources"].extend(source for source in value if source not in person["sources"])
+        elif key == "title":
+            if value and (not person.get("title") or _more_specific(value, person["title"])):
+                person["title"] = value
+        elif key == "name":
+            if len(name_tokens(value)) > len(name_tokens(person["name"])):
+                person["name"] = value
+        elif value and not person.get(key):
+            person[key] = value
+
+
+def _more_specific(title: str, current: str) -> bool:
+    rank, current_rank = title_rank(title), title_rank(current)
+    if rank is None:
+        return False
+    return current_rank is None or rank < current_rank
+
+
+def format_person(person: Dict) -> str:
+    text = person["name"]
+    if person.get("title"):
+        text += f", {person['title']}"
+    if person.get("email"):
+        text += f" ({person['email']})"
+    return text
@@ -1,32 +1,32 @@
+import asyncio
 import os
+import httpx
 import requests
 import logging
 from typing import Dict, List, Optional
 from functools import wraps
 
-logger = logging.getLogger(__name__)
+from research.async_http import fetch_json
+from research.cache import cached
+from research.http_session import get_json
+from utils.retry import status_code
 
+logger = logging.getLogger(__name__)
 
-def retry_on_failure(max_retries=3):
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            import time
-            last_exception = None
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        time.sleep(1 * (attempt + 1))
-            logger.error(f"All {max_retries} attempts failed for {func.__name__}")
-            return None
-        return wrapper
-    return decorator
+REQUEST_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
 
 
 def handle_api_error(func):
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"API error in {func.__name__}: {str(e)}")
+                return None
+        return async_wrapper
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
@@ -56,7 +56,6 @@ class LinkedInClient:
             'X-Restli-Protocol-Version': '2.0.0'
         }
     
-    @retry_on_failure(max_retries=2)
     @handle_api_error
     def search_company(self, company_name: str) -> Optional[Dict]:
         if not self.enabled:
@@ -64,34 +63,17 @@ class LinkedInClient:
             return None
         
         try:
-            url = f"{self.base_url}/organizationalEntityAcls"
-            params = {
+            data = get_json(**self._request("organizationalEntityAcls", {
                 'q': 'roleAssignee',
                 'projection': '(elements*(organizationalTarget~(localizedName,vanityName)))'
-            }
-            
-            response = requests.get(
-                url,
-                headers=self._get_headers(),
-                params=params,
-                timeout=10
-            )
-            
-            if response.status_code == 401:
-                logger.error("LinkedIn API authentication failed - check access token")
-                return None
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            logger.info(f"LinkedIn search successful for: {company_name}")
-            return self._parse_company_data(data)
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"LinkedIn API request failed: {str(e)}")
-            return None
+            }))
+        except REQUEST_ERRORS as e:
+            return self._request_failed(e, "LinkedIn API request failed")
+        
+        logger.info(f"LinkedIn search successful for: {company_name}")
+        return self._parse_company_data(data)
     
-    @retry_on_failure(max_retries=2)
+    @cached("linkedin")
     @handle_api_error
     def get_company_by_vanity_name(self, vanity_name: str) -> Optional[Dict]:
         if not self.enabled:
@@ -99,37 +81,12 @@ class LinkedInClient:
             return None
         
         try:
-            url = f"{self.base_url}/organizations"
-            params = {
-                'q': 'vanityName',
-                'vanityName': vanity_name
-            }
-            
-            response = requests.get(
-                url,
-                headers=self._get_headers(),
-                params=params,
-                timeout=10
-            )
-            
-            if response.status_code == 401:
-                logger.error("LinkedIn API authentication failed")
-                return None
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            if data.get('elements'):
-                org_data = data['elements'][0]
-                return self._parse_organization_data(org_data, vanity_name)
-            
-            return None
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"LinkedIn API request failed: {str(e)}")
-            return None
+            data = get_json(**self._vanity_name_request(vanity_name))
+        except REQUEST_ERRORS as e:
+            return self._request_failed(e, "LinkedIn API request failed")
+        return self._vanity_name_result(data, vanity_name)
     
-    @retry_on_failure(max_retries=2)
+    @cached("linkedin")
     @handle_api_error
     def get_company_stats(self, organization_id: str) -> Optional[Dict]:
         if not self.enabled:
@@ -137,30 +94,71 @@ class LinkedInClient:
             return None
         
         try:
-            url = f"{self.base_url}/organizationPageStatistics/{organization_id}"
-            
-            response = requests.get(
-                url,
-                headers=self._get_headers(),
-                timeout=10
-            )
-            
-            if response.status_code == 401:
-                logger.error("LinkedIn API authentication failed")
-                return None
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            return {
-                'follower_count': data.get('followerCount', 0),
-                'employee_count_range': data.get('employeeCountRange', {}),
-                'page_views': data.get('pageViews', 0)
-            }
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"LinkedIn stats request failed: {str(e)}")
+            data = get_json(**self._request(f"organizationPageStatistics/{organization_id}"))
+        except REQUEST_ERRORS as e:
+            return self._request_failed(e, "LinkedIn stats request failed")
+        return self._parse_stats(data)
+    
+    @cached("linkedin")
+    @handle_api_error
+    async def get_company_by_vanity_name_async(self, vanity_name: str) -> Optional[Dict]:
+        if not self.enabled:
+            logger.info("LinkedIn API not enabled")
             return None
+        
+        try:
+            data = await fetch_json(**self._vanity_name_request(vanity_name))
+        except REQUEST_ERRORS as e:
+            return self._request_failed(e, "LinkedIn API request failed")
+        return self._vanity_name_result(data, vanity_name)
+    
+    @cached("linkedin")
+    @handle_api_error
+    async def get_company_stats_async(self, organization_id: str) -> Optional[Dict]:
+        if not self.enabled:
+            logger.info("LinkedIn API not enabled")
+            return None
+        
+        try:
+            data = await fetch_json(**self._request(f"organizationPageStatistics/{organization_id}"))
+        except REQUEST_ERRORS as e:
+            return self._request_failed(e, "LinkedIn stats request failed")
+        return self._parse_stats(data)
+    
+    def _request(self, path: str, params: Optional[Dict] = None) -> Dict:
+        return {
+            "url": f"{self.base_url}/{path}",
+            "params": params,
+            "headers": self._get_headers(),
+            "timeout": 10,
+            "source": "linkedin",
+        }
+    
+    def _vanity_name_request(self, vanity_name: str) -> Dict:
+        return self._request("organizations", {
+            'q': 'vanityName',
+            'vanityName': vanity_name
+        })
+    
+    def _vanity_name_result(self, data: Dict, vanity_name: str) -> Optional[Dict]:
+        if data.get('elements'):
+            org_data = data['elements'][0]
+            return self._parse_organization_data(org_data, vanity_name)
+        return None
+    
+    def _request_failed(self, error: Exception, message: str) -> None:
+        if status_code(error) == 401:
+            logger.error("LinkedIn API authentication failed - check access token")
+        else:
+            logger.error(f"{message}: {str(error)}")
+        return None
+    
+    def _parse_stats(self, data: Dict) -> Dict:
+        return {
+            'follower_count': data.get('followerCount', 0),
+            'employee_count_range': data.get('employeeCountRange', {}),
+            'page_views': data.get('pageViews', 0)
+        }
     
     def _parse_company_data(self, data: Dict) -> Dict:
         result = {
@@ -259,6 +257,25 @@ class LinkedInClient:
                     result.update(stats)
         
         return result
+    
+    async def get_company_info_async(self, company_identifier: str) -> Optional[Dict]:
+        if not self.enabled:
+            return None
+        
+        logger.info(f"Fetching LinkedIn data for: {company_identifier}")
+        
+        clean_identifier = company_identifier.lower().replace(' ', '-').replace(',', '')
+        
+        result = await self.get_company_by_vanity_name_async(clean_identifier)
+        
+        if result:
+            org_id = result.get('linkedin_id')
+            if org_id:
+                stats = await self.get_company_stats_async(org_id)
+                if stats:
+                    result.update(stats)
+        
+        return result
 
 
 def get_linkedin_data(company_name: str, vanity_name: str = None) -> Optional[Dict]:
@@ -1,10 +1,17 @@
+import asyncio
+import concurrent.futures
+import contextvars
 import logging
-from typing import List, Dict, Optional
+import time
+from typing import Callable, List, Dict, Optional
 from datetime import datetime, timedelta
-import requests
 
-from config.settings import NEWSAPI_KEY, GNEWS_API_KEY
-from utils.error_handlers import APIError, handle_errors, retry_with_backoff
+from config.settings import NEWSAPI_KEY, GNEWS_API_KEY, NEWS_CONFIG
+from research.async_http import fetch_json
+from research.cache import cached
+from research.http_session import get_json
+from research.news_clustering import collapse_duplicates
+from utils.error_handlers import APIError, handle_errors
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +22,7 @@ class NewsAPIClient:
         self.base_url = "https://newsapi.org/v2"
         self.enabled = bool(api_key)
     
+    @cached("newsapi")
     @handle_errors("Failed to fetch news from NewsAPI")
     def search_company_news(self, 
                            company: str, 
@@ -24,10 +32,50 @@ class NewsAPIClient:
             logger.warning("NewsAPI key not configured")
             return []
         
+        try:
+            return self._search_result(get_json(**self._search_request(company, days_back, limit)), company)
+        except Exception as e:
+            logger.error(f"NewsAPI request failed: {str(e)}")
+            raise APIError(f"NewsAPI unavailable: {str(e)}")
+    
+    @cached("newsapi")
+    @handle_errors("Failed to fetch news from NewsAPI")
+    async def search_company_news_async(self,
+                                        company: str,
+                                        days_back: int = 30,
+                                        limit: int = 10) -> List[Dict]:
+        if not self.enabled:
+            logger.warning("NewsAPI key not configured")
+            return []
+        
+        try:
+            return self._search_result(await fetch_json(**self._search_request(company, days_back, limit)), company)
+        except Exception as e:
+            logger.error(f"NewsAPI request failed: {str(e)}")
+            raise APIError(f"NewsAPI unavailable: {str(e)}")
+    
+    def _search_request(self, company: str, days_back: int, limit: int) -> Dict:
+        return {
+            "url": f"{self.base_url}/everything",
+            "params": self._build_params(company, days_back, limit),
+            "timeout": 10,
+            "source": "newsapi",
+        }
+    
+    def _search_result(self, data: Dict, company: str) -> List[Dict]:
+        if data.get("status") != "ok":
+            raise APIError(f"NewsAPI error: {data.get('message', 'Unknown error')}")
+        
+        articles = data.get("articles", [])
+        logger.info(f"Fetched {len(articles)} articles from NewsAPI for {company}")
+        
+        return self._format_articles(articles)
+    
+    def _build_params(self, company: str, days_back: int, limit: int) -> Dict:
         to_date = datetime.now()
         from_date = to_date - timedelta(days=days_back)
         
-        params = {
+        return {
             "q": company,
             "from": from_date.strftime("%Y-%m-%d"),
             "to": to_date.strftime("%Y-%m-%d"),
@@ -36,30 +84,6 @@ class NewsAPIClient:
             "apiKey": self.api_key,
             "language": "en",
         }
-        
-        def api_call():
-            response = requests.get(
-                f"{self.base_url}/everything",
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        
-        try:
-            data = retry_with_backoff(api_call, max_retries=3)
-            
-            if data.get("status") != "ok":
-                raise APIError(f"NewsAPI error: {data.get('message', 'Unknown error')}")
-            
-            articles = data.get("articles", [])
-            logger.info(f"Fetched {len(articles)} articles from NewsAPI for {company}")
-            
-            return self._format_articles(articles)
-            
-        except Exception as e:
-            logger.error(f"NewsAPI request failed: {str(e)}")
-            raise APIError(f"NewsAPI unavailable: {str(e)}")
     
     def _format_articles(self, articles: List[Dict]) -> List[Dict]:
         formatted = []
@@ -82,6 +106,7 @@ class GNewsClient:
         self.base_url = "https://gnews.io/api/v4"
         self.enabled = bool(api_key)
     
+    @cached("gnews")
     @handle_errors("Failed to fetch news from GNews")
     def search_company_news(self,
                            company: str,
@@ -91,36 +116,52 @@ class GNewsClient:
             logger.warning("GNews API key not configured")
             return []
         
+        try:
+            return self._search_result(get_json(**self._search_request(company, days_back, limit)), company)
+        except Exception as e:
+            logger.error(f"GNews request failed: {str(e)}")
+            raise APIError(f"GNews unavailable: {str(e)}")
+    
+    @cached("gnews")
+    @handle_errors("Failed to fetch news from GNews")
+    async def search_company_news_async(self,
+                                        company: str,
+                                        days_back: int = 30,
+                                        limit: int = 10) -> List[Dict]:
+        if not self.enabled:
+            logger.warning("GNews API key not configured")
+            return []
+        
+        try:
+            return self._search_result(await fetch_json(**self._search_request(company, days_back, limit)), company)
+        except Exception as e:
+            logger.error(f"GNews request failed: {str(e)}")
+            raise APIError(f"GNews unavailable: {str(e)}")
+    
+    def _search_request(self, company: str, days_back: int, limit: int) -> Dict:
+        return {
+            "url": f"{self.base_url}/search",
+            "params": self._build_params(company, days_back, limit),
+            "timeout": 10,
+            "source": "gnews",
+        }
+    
+    def _search_result(self, data: Dict, company: str) -> List[Dict]:
+        articles = data.get("articles", [])
+        logger.info(f"Fetched {len(articles)} articles from GNews for {company}")
+        
+        return self._format_articles(articles)
+    
+    def _build_params(self, company: str, days_back: int, limit: int) -> Dict:
         from_date = datetime.now() - timedelta(days=days_back)
         
-        params = {
+        return {
             "q": company,
             "lang": "en",
             "max": limit,
             "from": from_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
             "apikey": self.api_key,
         }
-        
-        def api_call():
-            response = requests.get(
-                f"{self.base_url}/search",
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
-        
-        try:
-            data = retry_with_backoff(api_call, max_retries=3)
-            
-            articles = data.get("articles", [])
-            logger.info(f"Fetched {len(articles)} articles from GNews for {company}")
-            
-            return self._format_articles(articles)
-            
-        except Exception as e:
-            logger.error(f"GNews request failed: {str(e)}")
-            raise APIError(f"GNews unavailable: {str(e)}")
     
     def _format_articles(self, articles: List[Dict]) -> List[Dict]:
         formatted = []
@@ -142,40 +183,140 @@ class NewsAggregator:
     def __init__(self):
         self.newsapi = NewsAPIClient()
         self.gnews = GNewsClient()
+        self.providers = {
+            "newsapi": self.newsapi,
+            "gnews": self.gnews,
+        }
     
     def get_company_news(self,
                         company: str,
                         days_back: int = 30,
                         limit: int = 20) -> Dict[str, List[Dict]]:
-        results = {
-            "newsapi": [],
-            "gnews": [],
+        return self._collect_news(company, days_back, limit)
+    
+    async def get_company_news_async(self,
+                                     company: str,
+                                     days_back: int = 30,
+                                     limit: int = 20) -> Dict[str, List[Dict]]:
+        return await self._collect_news_async(company, days_back, limit)
+    
+    def get_aggregated_news(self,
+                           company: str,
+                           days_back: int = 30,
+                           limit: int = 20) -> List[Dict]:
+        all_results = self._collect_news(company, days_back, limit, enough=self._enough(limit))
+        return self._merge(all_results, limit)
+    
+    async def get_aggregated_news_async(self,
+                                        company: str,
+                                        days_back: int = 30,
+                                        limit: int = 20) -> List[Dict]:
+        all_results = await self._collect_news_async(company, days_back, limit, enough=self._enough(limit))
+        return self._merge(all_results, limit)
+    
+    def _collect_news(self, company: str, days_back: int, limit: int,
+                      enough: Optional[Callable[[Dict[str, List[Dict]]], bool]] = None) -> Dict[str, List[Dict]]:
+        results = {name: [] for name in self.providers}
+        enabled = {name: client for name, client in self.providers.items() if client.enabled}
+        if not enabled:
+            return results
+        
+        started = time.monotonic()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(enabled), thread_name_prefix="news")
+        pending = {
+            executor.submit(contextvars.copy_context().run, client.search_company_news, company, days_back, limit):
+                (name, started + self._timeout(name))
+            for name, client in enabled.items()
         }
         
         try:
-            if self.newsapi.enabled:
-                results["newsapi"] = self.newsapi.search_company_news(
-                    company, days_back, limit
+            while pending:
+                next_deadline = min(deadline for _, deadline in pending.values())
+                done, _ = concurrent.futures.wait(
+                    pending,
+                    timeout=max(0.0, next_deadline - time.monotonic()),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
                 )
-        except Exception as e:
-            logger.warning(f"NewsAPI failed: {str(e)}")
+                
+                for future in done:
+                    name, _ = pending.pop(future)
+                    try:
+                        results[name] = future.result() or []
+                    except Exception as e:
+                        logger.warning(f"{name} failed: {str(e)}")
+                
+                if enough and pending and enough(results):
+                    logger.info(f"Enough recent news for {company}, not waiting for {', '.join(n for n, _ in pending.values())}")
+                    break
+                
+                self._drop_expired(pending, started)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return results
+    
+    async def _collect_news_async(self, company: str, days_back: int, limit: int,
+                                  enough: Optional[Callable[[Dict[str, List[Dict]]], bool]] = None) -> Dict[str, List[Dict]]:
+        results = {name: [] for name in self.providers}
+        enabled = {name: client for name, client in self.providers.items() if client.enabled}
+        
+        started = time.monotonic()
+        pending = {
+            asyncio.ensure_future(client.search_company_news_async(company, days_back, limit)):
+                (name, started + self._timeout(name))
+            for name, client in enabled.items()
+        }
         
         try:
-            if self.gnews.enabled:
-                results["gnews"] = self.gnews.search_company_news(
-                    company, days_back, limit
+            while pending:
+                next_deadline = min(deadline for _, deadline in pending.values())
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, next_deadline - time.monotonic()),
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-        except Exception as e:
-            logger.warning(f"GNews failed: {str(e)}")
+                
+                for task in done:
+                    name, _ = pending.pop(task)
+                    try:
+                        results[name] = task.result() or []
+                    except Exception as e:
+                        logger.warning(f"{name} failed: {str(e)}")
+                
+                if enough and pending and enough(results):
+                    logger.info(f"Enough recent news for {company}, not waiting for {', '.join(n for n, _ in pending.values())}")
+                    break
+                
+                for task in self._drop_expired(pending, started):
+                    task.cancel()
+        finally:
+            for task in pending:
+                task.cancel()
         
         return results
     
-    def get_aggregated_news(self,
-                           company: str,
-                           days_back: int = 30,
-                           limit: int = 20) -> List[Dict]:
-        all_results = self.get_company_news(company, days_back, limit * 2)
+    def _drop_expired(self, pending: Dict, started: float) -> List:
+        now = time.monotonic()
+        expired = [future for future, (_, deadline) in pending.items() if now >= deadline]
+        for future in expired:
+            name, _ = pending.pop(future)
+            logger.warning(f"{name} timed out after {now - started:.1f}s")
+        return expired
+    
+    def _timeout(self, name: str) -> float:
+        return NEWS_CONFIG["provider_timeouts"].get(name, NEWS_CONFIG["default_timeout"])
+    
+    def _enough(self, limit: int) -> Callable[[Dict[str, List[Dict]]], bool]:
+        cutoff = (datetime.now() - timedelta(days=NEWS_CONFIG["recent_days"])).strftime("%Y-%m-%dT%H:%M:%S")
         
+        def enough(results: Dict[str, List[Dict]]) -> bool:
+            articles = self._deduplicate([article for articles in results.values() for article in articles])
+            recent = [article for article in articles if (article.get("published_at") or "") >= cutoff]
+            return len(recent) >= limit
+        
+        return enough
+    
+    def _merge(self, all_results: Dict[str, List[Dict]], limit: int) -> List[Dict]:
         all_articles = []
         for source_articles in all_results.values():
             all_articles.extend(source_articles)
@@ -190,22 +331,4 @@ class NewsAggregator:
         return unique_articles[:limit]
     
     def _deduplicate(self, articles: List[Dict]) -> List[Dict]:
-        seen_urls = set()
-        seen_titles = set()
-        unique = []
-        
-        for article in articles:
-            url = article.get("url", "")
-            title = article.get("title", "").lower()
-            
-            if url and url in seen_urls:
-                continue
-            
-            if title and title in seen_titles:
-                continue
-            
-            seen_urls.add(url)
-            seen_titles.add(title)
-            unique.append(article)
-        
-        return unique
+        return collapse_duplicates(articles)
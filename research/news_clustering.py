@@ -0,0 +1,114 @@
+import hashlib
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List
+
+import numpy as np
+
+from config.settings import NEWS_CONFIG
+
+MERSENNE_PRIME = (1 << 31) - 1
+TOKEN_PATTERN = re.compile(r"[a-z0-9$%]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was will with".split()
+)
+
+_random = np.random.RandomState(1)
+_PERMUTATIONS = NEWS_CONFIG["minhash_bands"] * NEWS_CONFIG["minhash_rows"]
+_A = _random.randint(1, MERSENNE_PRIME, size=(_PERMUTATIONS, 1)).astype(np.uint64)
+_B = _random.randint(0, MERSENNE_PRIME, size=(_PERMUTATIONS, 1)).astype(np.uint64)
+
+
+@lru_cache(maxsize=65536)
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+def shingles(article: Dict) -> FrozenSet[str]:
+    text = f"{article.get('title') or ''} {article.get('description') or ''}".lower()
+    return frozenset(token for token in TOKEN_PATTERN.findall(text) if token not in STOPWORDS)
+
+
+def minhash(tokens: FrozenSet[str]) -> np.ndarray:
+    hashes = np.fromiter((_token_hash(token) for token in tokens), dtype=np.uint64, count=len(tokens))
+    return ((_A * hashes + _B) % MERSENNE_PRIME).min(axis=1)
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def cluster_articles(articles: List[Dict], threshold: float = None) -> List[List[int]]:
+    threshold = NEWS_CONFIG["duplicate_similarity"] if threshold is None else threshold
+    rows = NEWS_CONFIG["minhash_rows"]
+    
+    parent = list(range(len(articles)))
+    
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    def union(i: int, j: int):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    
+    exact: Dict[str, int] = {}
+    token_sets = [shingles(article) for article in articles]
+    buckets: Dict[tuple, List[int]] = defaultdict(list)
+    
+    for index, article in enumerate(articles):
+        for key in ("url:" + (article.get("url") or ""), "title:" + (article.get("title") or "").lower()):
+            if key in ("url:", "title:"):
+                continue
+            if key in exact:
+                union(index, exact[key])
+            else:
+                exact[key] = index
+        
+        tokens = token_sets[index]
+        if not tokens:
+            continue
+        
+        signature = minhash(tokens)
+        for band in range(NEWS_CONFIG["minhash_bands"]):
+            bucket = buckets[(band, signature[band * rows:(band + 1) * rows].tobytes())]
+            joined = False
+            for representative in bucket:
+                if find(representative) == find(index):
+                    joined = True
+                elif jaccard(tokens, token_sets[representative]) >= threshold:
+                    union(index, representative)
+                    joined = True
+            if not joined:
+                bucket.append(index)
+    
+    clusters: Dict[int, List[int]] = defaultdict(list)
+    for index in range(len(articles)):
+        clusters[find(index)].append(index)
+    return list(clusters.values())
+
+
+def collapse_duplicates(articles: List[Dict], threshold: float = None) -> List[Dict]:
+    representatives = []
+    for cluster in cluster_articles(articles, threshold):
+        members = [articles[index] for index in cluster]
+        best = dict(min(members, key=_representative_rank))
+        best["cluster_size"] = sum(member.get("cluster_size", 1) for member in members)
+        representatives.append((cluster[0], best))
+    
+    representatives.sort(key=lambda item: item[0])
+    return [article for _, article in representatives]
+
+
+def _representative_rank(article: Dict):
+    preferred = [source.lower() for source in NEWS_CONFIG["preferred_sources"]]
+    source = (article.get("source") or "").lower()
+    source_rank = preferred.index(source) if source in preferred else len(preferred)
+    completeness = len(article.get("description") or "") + len(article.get("content") or "")
+    return source_rank, -completeness, article.get("published_at") or "9999"
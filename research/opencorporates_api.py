@@ -1,19 +1,62 @@
 import logging
+import re
+from difflib import SequenceMatcher
 from typing import Dict, List, Optional
-import requests
 
-from config.settings import OPENCORPORATES_API_KEY
-from utils.error_handlers import APIError, handle_errors, retry_with_backoff
+from config.settings import OPENCORPORATES_API_KEY, OPENCORPORATES_CONFIG
+from research.async_http import fetch_json
+from research.cache import cached, make_key
+from research.http_session import get_json
+from utils.error_handlers import APIError, handle_errors
+from utils.normalization import normalize_company_name, normalize_domain
 
 logger = logging.getLogger(__name__)
 
 
+ACTIVE_STATUS = re.compile(r"\b(active|live|good standing|registered|in existence)\b", re.IGNORECASE)
+INACTIVE_STATUS = re.compile(
+    r"\b(dissolved|inactive|struck|liquidation|closed|cancelled|revoked|forfeited|merged|converted)\b",
+    re.IGNORECASE,
+)
+
+
+def _company_key(jurisdiction: str, company_number: str) -> str:
+    return make_key("company", jurisdiction.lower(), company_number.upper())
+
+
+def _officers_key(jurisdiction: str, company_number: str) -> str:
+    return make_key("officers", jurisdiction.lower(), company_number.upper())
+
+
+def name_similarity(a: str, b: str) -> float:
+    a, b = normalize_company_name(a or ""), normalize_company_name(b or "")
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    ratio = SequenceMatcher(None, a, b).ratio()
+    a_tokens, b_tokens = set(a.split()), set(b.split())
+    if a_tokens <= b_tokens or b_tokens <= a_tokens:
+        shared = sum(len(token) for token in a_tokens & b_tokens)
+        coverage = shared / max(sum(len(token) for token in a_tokens), sum(len(token) for token in b_tokens))
+        ratio = max(ratio, coverage)
+    return ratio
+
+
+def jurisdiction_hint(domain: Optional[str]) -> Optional[str]:
+    domain = normalize_domain(domain)
+    if not domain or "." not in domain:
+        return None
+    return OPENCORPORATES_CONFIG["tld_jurisdictions"].get(domain.rsplit(".", 1)[1])
+
+
 class OpenCorporatesClient:
     def __init__(self, api_key: str = OPENCORPORATES_API_KEY):
         self.api_key = api_key
         self.base_url = "https://api.opencorporates.com/v0.4"
         self.enabled = bool(api_key)
     
+    @cached("opencorporates")
     @handle_errors("Failed to fetch data from OpenCorporates")
     def search_companies(self, 
                         name: str, 
@@ -23,6 +66,49 @@ class OpenCorporatesClient:
             logger.warning("OpenCorporates API key required but not configured")
             return []
         
+        try:
+            return self._search_result(get_json(**self._search_request(name, jurisdiction, limit)), name)
+        except Exception as e:
+            logger.error(f"OpenCorporates search failed: {str(e)}")
+            raise APIError(f"OpenCorporates unavailable: {str(e)}")
+    
+    @cached("opencorporates")
+    @handle_errors("Failed to fetch data from OpenCorporates")
+    async def search_companies_async(self,
+                                     name: str,
+                                     jurisdiction: Optional[str] = None,
+                                     limit: int = 10) -> List[Dict]:
+        if not self.enabled:
+            logger.warning("OpenCorporates API key required but not configured")
+            return []
+        
+        try:
+            return self._search_result(await fetch_json(**self._search_request(name, jurisdiction, limit)), name)
+        except Exception as e:
+            logger.error(f"OpenCorporates search failed: {str(e)}")
+            raise APIError(f"OpenCorporates unavailable: {str(e)}")
+    
+    @cached("opencorporates", key_func=_company_key)
+    @handle_errors("Failed to fetch company details")
+    def get_company_details(self, jurisdiction: str, company_number: str) -> Optional[Dict]:
+        try:
+            data = get_json(**self._company_request(f"companies/{jurisdiction}/{company_number}"))
+            return self._format_company_detailed(data.get("results", {}).get("company", {}))
+        except Exception as e:
+            logger.error(f"OpenCorporates company details failed: {str(e)}")
+            raise APIError(f"OpenCorporates unavailable: {str(e)}")
+    
+    @cached("opencorporates", key_func=_company_key)
+    @handle_errors("Failed to fetch company details")
+    async def get_company_details_async(self, jurisdiction: str, company_number: str) -> Optional[Dict]:
+        try:
+            data = await fetch_json(**self._company_request(f"companies/{jurisdiction}/{company_number}"))
+            return self._format_company_detailed(data.get("results", {}).get("company", {}))
+        except Exception as e:
+            logger.error(f"OpenCorporates company details failed: {str(e)}")
+            raise APIError(f"OpenCorporates unavailable: {str(e)}")
+    
+    def _search_request(self, name: str, jurisdiction: Optional[str], limit: int) -> Dict:
         params = {
             "q": name,
             "per_page": limit,
@@ -32,50 +118,30 @@ class OpenCorporatesClient:
         if jurisdiction:
             params["jurisdiction_code"] = jurisdiction
         
-        def api_call():
-            response = requests.get(
-                f"{self.base_url}/companies/search",
-                params=params,
-                timeout=15
-            )
-            response.raise_for_status()
-            return response.json()
+        return {
+            "url": f"{self.base_url}/companies/search",
+            "params": params,
+            "timeout": 15,
+            "source": "opencorporates",
+        }
+    
+    def _search_result(self, data: Dict, name: str) -> List[Dict]:
+        companies = data.get("results", {}).get("companies", [])
+        logger.info(f"Found {len(companies)} companies matching '{name}'")
         
-        try:
-            data = retry_with_backoff(api_call, max_retries=3)
-            
-            companies = data.get("results", {}).get("companies", [])
-            logger.info(f"Found {len(companies)} companies matching '{name}'")
-            
-            return [self._format_company(c.get("company", {})) for c in companies]
-            
-        except Exception as e:
-            logger.error(f"OpenCorporates search failed: {str(e)}")
-            raise APIError(f"OpenCorporates unavailable: {str(e)}")
+        return [self._format_company(c.get("company", {})) for c in companies]
     
-    @handle_errors("Failed to fetch company details")
-    def get_company_details(self, jurisdiction: str, company_number: str) -> Optional[Dict]:
+    def _company_request(self, path: str) -> Dict:
         params = {}
         if self.api_key:
             params["api_token"] = self.api_key
         
-        def api_call():
-            response = requests.get(
-                f"{self.base_url}/companies/{jurisdiction}/{company_number}",
-                params=params,
-                timeout=15
-            )
-            response.raise_for_status()
-            return response.json()
-        
-        try:
-            data = retry_with_backoff(api_call, max_retries=3)
-            company = data.get("results", {}).get("company", {})
-            return self._format_company_detailed(company)
-            
-        except Exception as e:
-            logger.error(f"OpenCorporates company details failed: {str(e)}")
-            raise APIError(f"OpenCorporates unavailable: {str(e)}")
+        return {
+            "url": f"{self.base_url}/{path}",
+            "params": params,
+            "timeout": 15,
+            "source": "opencorporates",
+        }
     
     def _format_company(self, data: Dict) -> Dict:
         return {
@@ -85,6 +151,7 @@ class OpenCorporatesClient:
             "incorporation_date": data.get("incorporation_date", ""),
             "company_type": data.get("company_type", ""),
             "status": data.get("current_status", ""),
+            "inactive": data.get("inactive"),
             "registered_address": data.get("registered_address_in_full", ""),
             "url": data.get("opencorporates_url", ""),
         }
@@ -105,31 +172,30 @@ class OpenCorporatesClient:
         
         return formatted
     
+    @cached("opencorporates", key_func=_officers_key)
     @handle_errors("Failed to fetch company officers")
     def get_company_officers(self, jurisdiction: str, company_number: str) -> List[Dict]:
-        params = {}
-        if self.api_key:
-            params["api_token"] = self.api_key
-        
-        def api_call():
-            response = requests.get(
-                f"{self.base_url}/companies/{jurisdiction}/{company_number}/officers",
-                params=params,
-                timeout=15
-            )
-            response.raise_for_status()
-            return response.json()
-        
         try:
-            data = retry_with_backoff(api_call, max_retries=3)
-            officers = data.get("results", {}).get("officers", [])
-            
-            return [self._format_officer(o.get("officer", {})) for o in officers]
-            
+            data = get_json(**self._company_request(f"companies/{jurisdiction}/{company_number}/officers"))
+            return self._officers_result(data)
         except Exception as e:
             logger.error(f"OpenCorporates officers request failed: {str(e)}")
             return []
     
+    @cached("opencorporates", key_func=_officers_key)
+    @handle_errors("Failed to fetch company officers")
+    async def get_company_officers_async(self, jurisdiction: str, company_number: str) -> List[Dict]:
+        try:
+            data = await fetch_json(**self._company_request(f"companies/{jurisdiction}/{company_number}/officers"))
+            return self._officers_result(data)
+        except Exception as e:
+            logger.error(f"OpenCorporates officers request failed: {str(e)}")
+            return []
+    
+    def _officers_result(self, data: Dict) -> List[Dict]:
+        officers = data.get("results", {}).get("officers", [])
+        return [self._format_officer(o.get("officer", {})) for o in officers]
+    
     def _format_officer(self, data: Dict) -> Dict:
         return {
             "name": data.get("name", ""),
@@ -141,10 +207,43 @@ class OpenCorporatesClient:
             "address": data.get("address", ""),
         }
     
-    def find_best_match(self, company_name: str) -> Optional[Dict]:
-        results = self.search_companies(company_name, limit=5)
+    def find_best_match(self, company_name: str, domain: Optional[str] = None) -> Optional[Dict]:
+        results = self.search_companies(company_name, limit=OPENCORPORATES_CONFIG["search_limit"])
+        return self.rank_candidates(company_name, results, domain)
+    
+    async def find_best_match_async(self, company_name: str, domain: Optional[str] = None) -> Optional[Dict]:
+        results = await self.search_companies_async(company_name, limit=OPENCORPORATES_CONFIG["search_limit"])
+        return self.rank_candidates(company_name, results, domain)
+    
+    def rank_candidates(self, company_name: str, candidates: List[Dict],
+                        domain: Optional[str] = None) -> Optional[Dict]:
+        hint = jurisdiction_hint(domain)
+        scored = []
+        for order, candidate in enumerate(candidates or []):
+            similarity = name_similarity(company_name, candidate.get("name"))
+            if similarity < OPENCORPORATES_CONFIG["min_name_similarity"]:
+                continue
+            scored.append((similarity + self._status_score(candidate) + self._jurisdiction_score(candidate, hint),
+                           -order, candidate))
         
-        if not results:
+        if not scored:
+            logger.info(f"No OpenCorporates candidate is a close match for '{company_name}'")
             return None
         
-        return results[0]
+        score, _, best = max(scored, key=lambda item: item[:2])
+        logger.info(f"Matched '{company_name}' to {best['name']} ({best['jurisdiction']}, score {score:.2f})")
+        return best
+    
+    def _status_score(self, candidate: Dict) -> float:
+        status = candidate.get("status") or ""
+        if candidate.get("inactive") or INACTIVE_STATUS.search(status):
+            return -OPENCORPORATES_CONFIG["inactive_penalty"]
+        if ACTIVE_STATUS.search(status):
+            return OPENCORPORATES_CONFIG["active_bonus"]
+        return 0.0
+    
+    def _jurisdiction_score(self, candidate: Dict, hint: Optional[str]) -> float:
+        jurisdiction = (candidate.get("jurisdiction") or "").lower()
+        if hint and (jurisdiction == hint or jurisdiction.startswith(f"{hint}_")):
+            return OPENCORPORATES_CONFIG["jurisdiction_bonus"]
+        return 0.0
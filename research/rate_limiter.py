@@ -0,0 +1,140 @@
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from config.settings import RATE_LIMITS, RATE_LIMIT_CONFIG
+from utils.error_handlers import RateLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+
+class QuotaRateLimiter:
+    
+    def __init__(self, db_path: str = None, limits: Dict[str, Dict] = None):
+        self.db_path = str(db_path or RATE_LIMIT_CONFIG["db_path"])
+        self.limits = limits or RATE_LIMITS
+        self._lock = threading.Lock()
+        self._init_db()
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+    
+    def _init_db(self):
+        with self._transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS token_buckets ("
+                "provider TEXT PRIMARY KEY, "
+                "tokens REAL NOT NULL, "
+                "updated_at REAL NOT NULL, "
+                "blocked_until REAL NOT NULL DEFAULT 0)"
+            )
+    
+    def _load(self, conn: sqlite3.Connection, provider: str, now: float) -> Tuple[float, float]:
+        limit = self.limits[provider]
+        capacity = limit["capacity"]
+        rate = capacity / limit["period"]
+        
+        row = conn.execute(
+            "SELECT tokens, updated_at, blocked_until FROM token_buckets WHERE provider = ?",
+            (provider,),
+        ).fetchone()
+        if row is None:
+            return float(capacity), 0.0
+        
+        tokens, updated_at, blocked_until = row
+        tokens = min(capacity, tokens + max(0.0, now - updated_at) * rate)
+        return tokens, blocked_until
+    
+    def _store(self, conn: sqlite3.Connection, provider: str, tokens: float, now: float,
+               blocked_until: float = 0.0):
+        conn.execute(
+            "INSERT OR REPLACE INTO token_buckets (provider, tokens, updated_at, blocked_until) "
+            "VALUES (?, ?, ?, ?)",
+            (provider, tokens, now, blocked_until),
+        )
+    
+    def _wait_for(self, provider: str, tokens: float, blocked_until: float, now: float,
+                  cost: float) -> float:
+        limit = self.limits[provider]
+        rate = limit["capacity"] / limit["period"]
+        wait = max(0.0, blocked_until - now)
+        if tokens < cost:
+            wait = max(wait, (cost - tokens) / rate)
+        return wait
+    
+    def try_acquire(self, provider: str, cost: float = 1.0) -> bool:
+        if provider not in self.limits:
+            return True
+        
+        now = time.time()
+        with self._lock, self._transaction() as conn:
+            tokens, blocked_until = self._load(conn, provider, now)
+            if self._wait_for(provider, tokens, blocked_until, now, cost) > 0:
+                return False
+            self._store(conn, provider, tokens - cost, now, blocked_until)
+            return True
+    
+    def acquire(self, provider: str, cost: float = 1.0):
+        if not self.try_acquire(provider, cost):
+            retry_after = self.wait_time(provider, cost)
+            logger.warning(f"{provider} quota exhausted, next request in {retry_after:.0f}s")
+            raise RateLimitExceeded(provider, retry_after)
+    
+    def wait_time(self, provider: str, cost: float = 1.0) -> float:
+        if provider not in self.limits:
+            return 0.0
+        
+        now = time.time()
+        with self._lock, self._transaction() as conn:
+            tokens, blocked_until = self._load(conn, provider, now)
+        return self._wait_for(provider, tokens, blocked_until, now, cost)
+    
+    def record_rate_limited(self, provider: str, retry_after: Optional[float] = None):
+        if provider not in self.limits:
+            return
+        
+        now = time.time()
+        blocked_until = now + (retry_after or RATE_LIMIT_CONFIG["default_block"])
+        with self._lock, self._transaction() as conn:
+            self._store(conn, provider, 0.0, now, blocked_until)
+        logger.warning(f"{provider} returned 429, pausing until {time.ctime(blocked_until)}")
+    
+    def get_status(self) -> Dict[str, Dict]:
+        now = time.time()
+        status = {}
+        with self._lock, self._transaction() as conn:
+            for provider, limit in self.limits.items():
+                tokens, blocked_until = self._load(conn, provider, now)
+                status[provider] = {
+                    "available": int(tokens),
+                    "capacity": limit["capacity"],
+                    "wait_seconds": round(self._wait_for(provider, tokens, blocked_until, now, 1.0)),
+                }
+        return status
+
+
+_limiter: Optional[QuotaRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> QuotaRateLimiter:
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = QuotaRateLimiter()
+    return _limiter
@@ -0,0 +1,230 @@
+import re
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional
+
+from research.leadership import EXTRACTORS as LEADERSHIP_EXTRACTORS
+from utils.normalization import normalize_domain
+
+CANONICAL_FIELDS = [
+    "name",
+    "legal_name",
+    "domain",
+    "description",
+    "founded",
+    "incorporation_date",
+    "employees",
+    "employee_range",
+    "industry",
+    "status",
+    "location",
+    "social_media",
+    "leadership",
+]
+
+SOURCE_FIELDS = {
+    "linkedin": {
+        "name": "company_name",
+        "domain": "website",
+        "description": "description",
+        "founded": "founded",
+        "employees": "employee_count",
+        "employee_range": "employee_count_range",
+        "industry": "industry",
+        "status": "company_type",
+        "location": "headquarters",
+    },
+    "brandfetch": {
+        "name": "name",
+        "domain": "domain",
+        "description": "description",
+        "industry": "industry",
+        "social_media": "social_media",
+    },
+    "hunter": {
+        "name": "name",
+        "domain": "domain",
+        "employees": "employees",
+        "social_media": "social_media",
+    },
+    "opencorporates": {
+        "name": "name",
+        "legal_name": "name",
+        "founded": "incorporation_date",
+        "incorporation_date": "incorporation_date",
+        "status": "status",
+        "location": "registered_address",
+    },
+    "web_scraping": {
+        "name": "name",
+        "domain": "domain",
+        "description": "description",
+        "social_media": "social_media",
+    },
+}
+
+YEAR_PATTERN = re.compile(r"\b(1[6-9]\d{2}|20\d{2})\b")
+RANGE_PATTERN = re.compile(r"^\s*([\d,.]+)\s*([km]?)\s*(?:(\+)|-\s*([\d,.]+)\s*([km]?))?\s*$", re.IGNORECASE)
+DATE_FORMATS = ["%Y-%m-%d", "%Y/%m/%d", "%d/%m/%Y", "%m/%d/%Y", "%d %B %Y", "%B %d, %Y", "%Y-%m", "%Y"]
+MULTIPLIERS = {"": 1, "k": 1_000, "m": 1_000_000}
+
+
+def parse_text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    text = " ".join(str(value).split())
+    return text or None
+
+
+def parse_date(value: Any) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    
+    text = parse_text(value)
+    if not text:
+        return None
+    
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text[:10] if fmt == "%Y-%m-%d" else text, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_year(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if 1600 <= value <= datetime.now().year + 1 else None
+    if isinstance(value, (date, datetime)):
+        return value.year
+    
+    match = YEAR_PATTERN.search(str(value or ""))
+    return int(match.group(1)) if match else None
+
+
+def parse_count(value: Any) -> Optional[int]:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value > 0 else None
+    
+    employee_range = parse_range(value)
+    if not employee_range:
+        return None
+    if employee_range["max"] is None:
+        return employee_range["min"]
+    return (employee_range["min"] + employee_range["max"]) // 2
+
+
+def parse_range(value: Any) -> Optional[Dict[str, Optional[int]]]:
+    if isinstance(value, dict) and "min" in value:
+        return {"min": value["min"], "max": value.get("max")}
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {"min": int(value), "max": int(value)} if value > 0 else None
+    
+    match = RANGE_PATTERN.match(str(value or ""))
+    if not match:
+        return None
+    
+    low, low_unit, open_ended, high, high_unit = match.groups()
+    minimum = _scaled(low, low_unit or high_unit or "")
+    if open_ended or high is None:
+        maximum = None if open_ended else minimum
+    else:
+        maximum = _scaled(high, high_unit or "")
+    
+    if not minimum or (maximum is not None and maximum < minimum):
+        return None
+    return {"min": minimum, "max": maximum}
+
+
+def parse_location(value: Any) -> Optional[Dict[str, str]]:
+    if isinstance(value, dict):
+        location = {
+            "city": parse_text(value.get("city") or value.get("locality")) or "",
+            "state": parse_text(value.get("state") or value.get("region")) or "",
+            "country": parse_text(value.get("country")) or "",
+        }
+        address = parse_text(value.get("street_address") or value.get("address"))
+        if address:
+            location["address"] = address
+        return location if any(location.values()) else None
+    
+    address = parse_text(value)
+    return {"city": "", "state": "", "country": "", "address": address} if address else None
+
+
+def parse_social_media(value: Any) -> Optional[Dict[str, str]]:
+    if not isinstance(value, dict):
+        return None
+    links = {key: str(link).strip() for key, link in value.items() if link}
+    return links or None
+
+
+PARSERS: Dict[str, Callable[[Any], Any]] = {
+    "name": parse_text,
+    "legal_name": parse_text,
+    "domain": normalize_domain,
+    "description": parse_text,
+    "founded": parse_year,
+    "incorporation_date": parse_date,
+    "employees": parse_count,
+    "employee_range": parse_range,
+    "industry": parse_text,
+    "status": parse_text,
+    "location": parse_location,
+    "social_media": parse_social_media,
+}
+
+
+def normalize_source(source: str, data: Any) -> Dict:
+    if not data or not isinstance(data, dict) or "error" in data:
+        return {}
+    
+    record = {}
+    for field, source_field in SOURCE_FIELDS.get(source, {}).items():
+        raw = data.get(source_field)
+        if raw in (None, "", [], {}):
+            continue
+        value = PARSERS[field](raw)
+        if value not in (None, "", [], {}):
+            record[field] = value
+    
+    if "employees" in record and "employee_range" not in record:
+        record["employee_range"] = {"min": record["employees"], "max": record["employees"]}
+    
+    if source == "linkedin":
+        social_media = {
+            "linkedin_url": data.get("linkedin_url"),
+            "linkedin_id": data.get("linkedin_id"),
+            "linkedin_vanity_name": data.get("vanity_name"),
+        }
+        social_media = parse_social_media(social_media)
+        if social_media:
+            record["social_media"] = social_media
+    
+    if source in LEADERSHIP_EXTRACTORS:
+        leadership = LEADERSHIP_EXTRACTORS[source](data)
+        if leadership:
+            record["leadership"] = leadership
+    
+    return record
+
+
+def normalize_sources(source_data: Dict) -> Dict[str, Dict]:
+    canonical = {}
+    for source, data in source_data.items():
+        record = normalize_source(source, data)
+        if record:
+            canonical[source] = record
+    return canonical
+
+
+def _scaled(number: str, unit: str) -> Optional[int]:
+    try:
+        return int(float(number.replace(",", "")) * MULTIPLIERS[unit.lower()])
+    except ValueError:
+        return None
@@ -0,0 +1,169 @@
+import concurrent.futures
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Optional
+
+from account_plan.generator import AccountPlanGenerator
+from config.settings import SERVICE_CONFIG
+from database.blob_store import get_blob_store
+from database.job_store import COMPLETE, FAILED, QUEUED, RUNNING, JobStore, get_job_store
+from database.repository import PlanRepository, get_plan_repository
+from research.data_aggregator import DataAggregator
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchService:
+    
+    def __init__(self,
+                 workers: int = SERVICE_CONFIG["workers"],
+                 aggregator: Optional[DataAggregator] = None,
+                 plan_generator: Optional[AccountPlanGenerator] = None,
+                 store: Optional[JobStore] = None,
+                 repository: Optional[PlanRepository] = None):
+        self.aggregator = aggregator or DataAggregator()
+        self.plan_generator = plan_generator or AccountPlanGenerator()
+        self.store = store or get_job_store()
+        self.repository = repository or get_plan_repository()
+        self.store.fail_interrupted()
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="research-job"
+        )
+        
+        self._jobs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        threading.Thread(target=self._heartbeat, name="research-heartbeat", daemon=True).start()
+    
+    def submit(self, company_name: str, company_domain: Optional[str] = None,
+               include_news: bool = True, include_officers: bool = False,
+               session_id: Optional[str] = None, refresh: bool = False) -> str:
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "company_name": company_name,
+            "company_domain": company_domain,
+            "status": QUEUED,
+            "sources": {},
+            "research": None,
+            "plan": None,
+            "error": None,
+            "submitted_at": datetime.utcnow().isoformat(),
+            "finished_at": None,
+            "_finished": None,
+        }
+        
+        with self._lock:
+            self._prune()
+            self._jobs[job_id] = job
+        self.store.create(job, session_id)
+        
+        self.executor.submit(self._run, job_id, include_news, include_officers, refresh)
+        logger.info(f"Queued research job {job_id} for {company_name}")
+        return job_id
+    
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                snapshot = {k: v for k, v in job.items() if not k.startswith("_")}
+                snapshot["sources"] = dict(job["sources"])
+                return snapshot
+        return self.store.get(job_id)
+    
+    def _run(self, job_id: str, include_news: bool, include_officers: bool, refresh: bool):
+        job = self._jobs[job_id]
+        self._update(job_id, status=RUNNING)
+        self.store.update(job_id, status=RUNNING)
+        research_ref = None
+        
+        try:
+            stored = None if refresh else self.repository.find_recent(
+                job["company_name"], job["company_domain"]
+            )
+            if stored:
+                research_ref = stored["research_ref"]
+                self._update(job_id, status=COMPLETE, research=stored["research"], plan=stored["plan"])
+            else:
+                research = self.aggregator.research_company(
+                    company_name=job["company_name"],
+                    company_domain=job["company_domain"],
+                    include_news=include_news,
+                    include_officers=include_officers,
+                    on_event=lambda event: self._on_event(job_id, event),
+                )
+                plan = self.plan_generator.generate(research)
+                research_ref = get_blob_store().put(research)
+                plan["research_ref"] = research_ref
+                self._update(job_id, status=COMPLETE, research=research, plan=plan)
+                self.repository.save(research, plan, research_ref)
+        except Exception as e:
+            logger.error(f"Research job {job_id} failed: {str(e)}")
+            self._update(job_id, status=FAILED, error=str(e))
+        
+        finished_at = datetime.utcnow()
+        self._update(job_id, finished_at=finished_at.isoformat(), _finished=time.monotonic())
+        
+        job = self.get_job(job_id)
+        self.store.update(
+            job_id,
+            status=job["status"],
+            sources=job["sources"],
+            research_ref=research_ref if job["status"] == COMPLETE else None,
+            plan_data=job["plan"] if job["status"] == COMPLETE else None,
+            error=job["error"],
+            finished_at=finished_at,
+        )
+    
+    def _on_event(self, job_id: str, event: Dict):
+        if event["type"] in ("started", "finished", "failed"):
+            with self._lock:
+                self._jobs[job_id]["sources"][event["source"]] = event["type"]
+            return
+        
+        if event["type"] == "snapshot":
+            research = event["research"]
+            self._update(job_id, research=research, plan=self.plan_generator.generate(research))
+    
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            self._jobs[job_id].update(fields)
+    
+    def _heartbeat(self):
+        while not self._stopped.wait(SERVICE_CONFIG["heartbeat_interval"]):
+            with self._lock:
+                active = [job_id for job_id, job in self._jobs.items() if job["status"] in (QUEUED, RUNNING)]
+            self.store.heartbeat(active)
+            try:
+                self.store.fail_interrupted()
+            except Exception as e:
+                logger.warning(f"Failed to sweep interrupted research jobs: {str(e)}")
+    
+    def _prune(self):
+        cutoff = time.monotonic() - SERVICE_CONFIG["job_retention"]
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job["_finished"] is not None and job["_finished"] < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+    
+    def shutdown(self):
+        self._stopped.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_service: Optional[ResearchService] = None
+_service_lock = threading.Lock()
+
+
+def get_research_service() -> ResearchService:
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = ResearchService()
+    return _service
@@ -0,0 +1,151 @@
+import asyncio
+import contextvars
+import copy
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _Fanout:
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Any], None]] = []
+        self._events: List[Any] = []
+    
+    def subscribe(self, listener: Callable[[Any], None]):
+        with self._lock:
+            for event in self._events:
+                self._deliver(listener, event)
+            self._listeners.append(listener)
+    
+    def unsubscribe(self, listener: Callable[[Any], None]):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+    
+    def publish(self, event: Any):
+        with self._lock:
+            self._events.append(event)
+            for listener in self._listeners:
+                self._deliver(listener, event)
+    
+    def _deliver(self, listener: Callable[[Any], None], event: Any):
+        try:
+            listener(copy.deepcopy(event))
+        except Exception as e:
+            logger.warning(f"Event listener failed: {str(e)}")
+
+
+class _Call:
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.fanout = _Fanout()
+
+
+class SingleFlight:
+    
+    def __init__(self, name: str = "single_flight"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], Tuple[asyncio.Future, _Fanout]] = {}
+        self._fanout: contextvars.ContextVar[Optional[_Fanout]] = contextvars.ContextVar(f"{name}_fanout", default=None)
+        self._stats = defaultdict(int)
+    
+    def publish(self, event: Any):
+        fanout = self._fanout.get()
+        if fanout is not None:
+            fanout.publish(event)
+    
+    def do(self, key: Hashable, fn: Callable[[], Any],
+           on_event: Optional[Callable[[Any], None]] = None) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._stats["executed"] += 1
+            else:
+                self._stats["shared"] += 1
+        
+        if on_event:
+            call.fanout.subscribe(on_event)
+        
+        if not leader:
+            logger.info(f"{self.name}: waiting on in-flight call for {key}")
+            try:
+                call.done.wait()
+            finally:
+                if on_event:
+                    call.fanout.unsubscribe(on_event)
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        
+        token = self._fanout.set(call.fanout)
+        try:
+            call.result = fn()
+            return copy.deepcopy(call.result)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            self._fanout.reset(token)
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+    
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]],
+                       on_event: Optional[Callable[[Any], None]] = None) -> Any:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            future, fanout = self._async_calls.get((loop, key), (None, None))
+            leader = future is None
+            if leader:
+                future, fanout = loop.create_future(), _Fanout()
+                self._async_calls[(loop, key)] = (future, fanout)
+                self._stats["executed"] += 1
+            else:
+                self._stats["shared"] += 1
+        
+        if on_event:
+            fanout.subscribe(on_event)
+        
+        if not leader:
+            logger.info(f"{self.name}: waiting on in-flight call for {key}")
+            try:
+                return copy.deepcopy(await asyncio.shield(future))
+            finally:
+                if on_event:
+                    fanout.unsubscribe(on_event)
+        
+        token = self._fanout.set(fanout)
+        try:
+            result = await fn()
+            future.set_result(result)
+            return copy.deepcopy(result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._fanout.reset(token)
+            with self._lock:
+                self._async_calls.pop((loop, key), None)
+    
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._calls) + len(self._async_calls)
+        return stats
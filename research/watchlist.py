@@ -0,0 +1,248 @@
+import argparse
+import json
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import sessionmaker
+
+from account_plan.generator import AccountPlanGenerator
+from config.settings import RATE_LIMITS, WATCHLIST_CONFIG
+from database.blob_store import get_blob_store
+from database.models import WatchlistAccount, get_engine
+from database.repository import get_plan_repository
+from research.data_aggregator import SOURCE_PROVIDERS, DataAggregator
+from research.news_clustering import cluster_articles
+from research.rate_limiter import get_rate_limiter
+from utils.normalization import normalize_company_name, normalize_domain
+
+logger = logging.getLogger(__name__)
+
+
+def diff_research(previous: Dict, current: Dict) -> Dict:
+    old_fields = previous.get("consolidated", {})
+    new_fields = current.get("consolidated", {})
+    
+    fields = {}
+    for field in sorted(set(old_fields) | set(new_fields)):
+        old, new = old_fields.get(field), new_fields.get(field)
+        if json.dumps(old, sort_keys=True, default=str) != json.dumps(new, sort_keys=True, default=str):
+            fields[field] = {"old": old, "new": new}
+    
+    previous_news = previous.get("news", [])
+    current_news = current.get("news", [])
+    new_news = []
+    for cluster in cluster_articles(previous_news + current_news):
+        if any(index < len(previous_news) for index in cluster):
+            continue
+        new_news.extend(
+            current_news[index - len(previous_news)].get("url") for index in cluster
+            if current_news[index - len(previous_news)].get("url")
+        )
+    
+    return {"fields": fields, "new_news": new_news}
+
+
+class WatchlistRefresher:
+    
+    def __init__(self, aggregator: Optional[DataAggregator] = None,
+                 plan_generator: Optional[AccountPlanGenerator] = None,
+                 engine=None):
+        self.aggregator = aggregator or DataAggregator()
+        self.plan_generator = plan_generator or AccountPlanGenerator()
+        self.Session = sessionmaker(bind=engine or get_engine(), expire_on_commit=False)
+        self.blob_store = get_blob_store()
+        self.repository = get_plan_repository()
+        self.rate_limiter = get_rate_limiter()
+    
+    def add(self, company_name: str, domain: Optional[str] = None,
+            cadence_hours: int = WATCHLIST_CONFIG["default_cadence_hours"]) -> WatchlistAccount:
+        normalized_name = normalize_company_name(company_name)
+        with self.Session() as session, session.begin():
+            account = session.query(WatchlistAccount).filter_by(normalized_name=normalized_name).first()
+            if account is None:
+                account = WatchlistAccount(company_name=company_name, normalized_name=normalized_name)
+                session.add(account)
+            account.domain = normalize_domain(domain) or account.domain
+            account.cadence_hours = cadence_hours
+        return account
+    
+    def remove(self, company_name: str) -> bool:
+        with self.Session() as session, session.begin():
+            deleted = session.query(WatchlistAccount).filter_by(
+                normalized_name=normalize_company_name(company_name)
+            ).delete()
+        return bool(deleted)
+    
+    def acknowledge(self, company_name: str):
+        with self.Session() as session, session.begin():
+            session.query(WatchlistAccount).filter_by(
+                normalized_name=normalize_company_name(company_name)
+            ).update({"changed": False})
+    
+    def list_accounts(self, changed_only: bool = False) -> List[WatchlistAccount]:
+        with self.Session() as session:
+            query = session.query(WatchlistAccount)
+            if changed_only:
+                query = query.filter(WatchlistAccount.changed.is_(True))
+            return query.order_by(WatchlistAccount.next_run_at).all()
+    
+    def run_once(self, max_accounts: int = WATCHLIST_CONFIG["max_accounts_per_run"]) -> Dict:
+        now = datetime.utcnow()
+        with self.Session() as session:
+            due = (
+                session.query(WatchlistAccount)
+                .filter(WatchlistAccount.next_run_at <= now)
+                .order_by(WatchlistAccount.next_run_at)
+                .limit(max_accounts)
+                .all()
+            )
+        
+        headroom = self._quota_headroom()
+        stats = {"due": len(due), "refreshed": 0, "changed": 0, "skipped": 0, "deferred": 0, "failed": 0}
+        
+        for account in due:
+            previous = self.blob_store.get(account.snapshot_ref) if account.snapshot_ref else None
+            if previous is not None and account.source_timestamps:
+                previous["source_timestamps"] = {**previous.get("source_timestamps", {}), **account.source_timestamps}
+            sources = self.aggregator.stale_sources(previous) if previous else list(SOURCE_PROVIDERS)
+            providers = self._providers_for(sources)
+            
+            if any(headroom.get(provider, float("inf")) < 1 for provider in providers):
+                logger.info(f"Deferring {account.company_name}: not enough quota headroom")
+                stats["deferred"] += 1
+                continue
+            for provider in providers:
+                if provider in headroom:
+                    headroom[provider] -= 1
+            
+            try:
+                refreshed, changed = self._refresh_account(account, previous, sources)
+                stats["refreshed" if refreshed else "skipped"] += 1
+                stats["changed"] += int(changed)
+            except Exception as e:
+                logger.error(f"Watchlist refresh failed for {account.company_name}: {str(e)}")
+                stats["failed"] += 1
+                self._schedule(account.id, changed=None)
+        
+        logger.info(f"Watchlist run: {stats}")
+        return stats
+    
+    def run_forever(self, poll_interval: float = WATCHLIST_CONFIG["poll_interval"]):
+        while True:
+            self.run_once()
+            time.sleep(poll_interval)
+    
+    def _refresh_account(self, account: WatchlistAccount, previous: Optional[Dict],
+                         sources: List[str]) -> Tuple[bool, bool]:
+        if previous is None:
+            current = self.aggregator.research_company(
+                company_name=account.company_name,
+                company_domain=account.domain,
+                include_news=True,
+                include_officers=False,
+            )
+            diff = {"fields": {}, "new_news": [], "initial": True}
+        elif not sources:
+            self._schedule(account.id, changed=False)
+            return False, False
+        else:
+            current = self.aggregator.refresh_research(previous, sources=sources)
+            diff = diff_research(previous, current)
+        
+        changed = bool(diff["fields"] or diff["new_news"])
+        timestamps = current.get("source_timestamps", {})
+        if previous is not None and not changed:
+            self._schedule(account.id, changed=False, source_timestamps=timestamps)
+            return True, False
+        
+        snapshot_ref = self.blob_store.put(current)
+        self.repository.save(current, self.plan_generator.generate(current), snapshot_ref)
+        self._schedule(account.id, changed=changed, snapshot_ref=snapshot_ref, diff=diff,
+                       source_timestamps=timestamps)
+        if changed:
+            logger.info(
+                f"{account.company_name} changed: {len(diff['fields'])} fields, "
+                f"{len(diff['new_news'])} new articles"
+            )
+        return True, changed
+    
+    def _schedule(self, account_id: int, changed: Optional[bool],
+                  snapshot_ref: Optional[str] = None, diff: Optional[Dict] = None,
+                  source_timestamps: Optional[Dict[str, str]] = None):
+        now = datetime.utcnow()
+        with self.Session() as session, session.begin():
+            account = session.get(WatchlistAccount, account_id)
+            if account is None:
+                return
+            
+            cadence = timedelta(hours=account.cadence_hours or WATCHLIST_CONFIG["default_cadence_hours"])
+            jitter = cadence * WATCHLIST_CONFIG["jitter"] * random.random()
+            account.last_checked_at = now
+            account.next_run_at = now + cadence + jitter
+            
+            if snapshot_ref:
+                account.snapshot_ref = snapshot_ref
+            if diff is not None:
+                account.last_diff = diff
+            if source_timestamps is not None:
+                account.source_timestamps = source_timestamps
+            if changed:
+                account.changed = True
+                account.last_changed_at = now
+    
+    def _providers_for(self, sources: List[str]) -> Set[str]:
+        return {provider for source in sources for provider in SOURCE_PROVIDERS.get(source, [])}
+    
+    def _quota_headroom(self) -> Dict[str, float]:
+        reserve = WATCHLIST_CONFIG["quota_reserve"]
+        return {
+            provider: status["available"] - reserve * RATE_LIMITS[provider]["capacity"]
+            for provider, status in self.rate_limiter.get_status().items()
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep a watchlist of accounts refreshed and flag changes.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    add_parser = subparsers.add_parser("add", help="Add or update a watched account")
+    add_parser.add_argument("company_name")
+    add_parser.add_argument("--domain")
+    add_parser.add_argument("--cadence-hours", type=int, default=WATCHLIST_CONFIG["default_cadence_hours"])
+    
+    remove_parser = subparsers.add_parser("remove", help="Stop watching an account")
+    remove_parser.add_argument("company_name")
+    
+    ack_parser = subparsers.add_parser("ack", help="Clear the changed flag of an account")
+    ack_parser.add_argument("company_name")
+    
+    list_parser = subparsers.add_parser("list", help="List watched accounts")
+    list_parser.add_argument("--changed", action="store_true", help="Only show changed accounts")
+    
+    run_parser = subparsers.add_parser("run", help="Refresh due accounts")
+    run_parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    args = parser.parse_args()
+    
+    refresher = WatchlistRefresher()
+    
+    if args.command == "add":
+        refresher.add(args.company_name, args.domain, args.cadence_hours)
+    elif args.command == "remove":
+        refresher.remove(args.company_name)
+    elif args.command == "ack":
+        refresher.acknowledge(args.company_name)
+    elif args.command == "list":
+        for account in refresher.list_accounts(changed_only=args.changed):
+            flag = "CHANGED" if account.changed else "-"
+            print(f"{account.company_name}\t{account.domain or ''}\t{flag}\tnext run {account.next_run_at}")
+    elif args.once:
+        print(json.dumps(refresher.run_once(), indent=2))
+    else:
+        refresher.run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,22 @@
+import asyncio
 import logging
-from typing import Dict, Optional
-import requests
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
 import re
 
+from config.settings import SCRAPING_CONFIG
+from research.async_http import get_async_client
+from research.cache import cached
+from research.crawler import SiteCrawler
+from research.html_extract import (
+    SOCIAL_LINK,
+    PageBuffer,
+    charset_from_content_type,
+    decode_html,
+    extract_social_links,
+    parse_html,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,7 +26,9 @@ class SimpleWebScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         self.timeout = 10
+        self.crawler = SiteCrawler(self.headers, self.timeout)
     
+    @cached("web_scraping")
     def scrape_company_website(self, domain: str) -> Optional[Dict]:
         if not domain.startswith('http'):
             url = f'https://{domain}'
@@ -22,20 +37,51 @@ class SimpleWebScraper:
         
         try:
             logger.info(f"Scraping website: {url}")
-            response = requests.get(url, headers=self.headers, timeout=self.timeout, allow_redirects=True)
-            response.raise_for_status()
+            fetched = self.crawler.polite_fetch(url)
+            if fetched is None:
+                return None
+            
+            final_url, content, encoding = fetched
+            facts = parse_html(decode_html(content, encoding))
+            data = self._page_data(facts, domain, final_url)
+            if SCRAPING_CONFIG["crawl"]:
+                data['crawl_targets'] = self.crawler.targets(final_url, facts['links'])
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            logger.info(f"Successfully scraped basic info from {domain}")
+            return data
+        
+        except Exception as e:
+            logger.error(f"Web scraping failed for {domain}: {str(e)}")
+            return None
+    
+    @cached("web_scraping")
+    async def scrape_company_website_async(self, domain: str) -> Optional[Dict]:
+        if not domain.startswith('http'):
+            url = f'https://{domain}'
+        else:
+            url = domain
+        
+        try:
+            logger.info(f"Scraping website: {url}")
+            allowed, crawl_delay = await asyncio.to_thread(self.crawler.robots.check, url)
+            if not allowed:
+                logger.info(f"robots.txt disallows {url}")
+                return None
+            delay = self.crawler.politeness_delay(crawl_delay)
+            await asyncio.sleep(self.crawler.throttle.reserve(urlparse(url).netloc, delay))
             
-            data = {
-                'name': self._extract_company_name(soup, domain),
-                'description': self._extract_description(soup),
-                'title': self._extract_title(soup),
-                'social_media': self._extract_social_links(soup),
-                'domain': domain,
-                'url': response.url,
-                'source': 'web_scraping',
-            }
+            buffer = PageBuffer()
+            async with get_async_client().stream("GET", url, headers=self.headers, timeout=self.timeout) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(SCRAPING_CONFIG["chunk_size"]):
+                    if buffer.feed(chunk):
+                        break
+            
+            encoding = charset_from_content_type(response.headers.get('content-type'))
+            facts = parse_html(decode_html(buffer.content, encoding))
+            data = self._page_data(facts, domain, str(response.url))
+            if SCRAPING_CONFIG["crawl"]:
+                data['crawl_targets'] = self.crawler.targets(str(response.url), facts['links'])
             
             logger.info(f"Successfully scraped basic info from {domain}")
             return data
@@ -44,14 +90,30 @@ class SimpleWebScraper:
             logger.error(f"Web scraping failed for {domain}: {str(e)}")
             return None
     
-    def _extract_company_name(self, soup: BeautifulSoup, domain: str) -> str:
-        og_title = soup.find('meta', property='og:site_name')
-        if og_title and og_title.get('content'):
-            return og_title['content']
+    @cached("web_scraping")
+    def crawl_website(self, base_url: str, targets: List[List[str]]) -> Optional[Dict]:
+        pages = self.crawler.crawl(base_url, [tuple(target) for target in targets])
+        if not pages:
+            return None
+        return {'url': base_url, 'pages': pages, 'source': 'web_crawl'}
+    
+    def _page_data(self, facts: Dict, domain: str, url: str) -> Dict:
+        return {
+            'name': self._extract_company_name(facts, domain),
+            'description': self._extract_description(facts),
+            'title': facts['title'],
+            'social_media': extract_social_links(facts['links']),
+            'domain': domain,
+            'url': url,
+            'source': 'web_scraping',
+        }
+    
+    def _extract_company_name(self, facts: Dict, domain: str) -> str:
+        if facts['meta'].get('og:site_name'):
+            return facts['meta']['og:site_name']
         
-        title = soup.find('title')
-        if title:
-            title_text = title.get_text().strip()
+        title_text = facts['title']
+        if title_text:
             for suffix in [' - ', ' | ', ' – ']:
                 if suffix in title_text:
                     title_text = title_text.split(suffix)[0]
@@ -59,85 +121,35 @@ class SimpleWebScraper:
         
         return domain.split('.')[0].title()
     
-    def _extract_description(self, soup: BeautifulSoup) -> str:
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc['content']
+    def _extract_description(self, facts: Dict) -> str:
+        meta = facts['meta']
+        if meta.get('description'):
+            return meta['description']
         
-        og_desc = soup.find('meta', property='og:description')
-        if og_desc and og_desc.get('content'):
-            return og_desc['content']
+        if meta.get('og:description'):
+            return meta['og:description']
         
-        paragraphs = soup.find_all('p')
-        for p in paragraphs:
-            text = p.get_text().strip()
-            if len(text) > 100:
-                return text[:500]
+        if facts['paragraph']:
+            return facts['paragraph'][:500]
         
         return "Description not available"
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        title = soup.find('title')
-        if title:
-            return title.get_text().strip()
-        return ""
-    
-    def _extract_social_links(self, soup: BeautifulSoup) -> Dict[str, str]:
-        social_media = {}
-        
-        links = soup.find_all('a', href=True)
-        
-        for link in links:
-            href = link['href']
-            href_lower = href.lower()
-            
-            if 'twitter.com' in href_lower or 'x.com' in href_lower:
-                social_media['twitter_url'] = href
-                twitter_match = re.search(r'(?:twitter\.com|x\.com)/([a-zA-Z0-9_]+)', href)
-                if twitter_match:
-                    social_media['twitter_id'] = twitter_match.group(1)
-                    social_media['twitter_handle'] = f"@{twitter_match.group(1)}"
-            
-            elif 'linkedin.com/company' in href_lower:
-                social_media['linkedin_url'] = href
-                linkedin_match = re.search(r'linkedin\.com/company/([a-zA-Z0-9\-_]+)', href)
-                if linkedin_match:
-                    social_media['linkedin_id'] = linkedin_match.group(1)
-                    social_media['linkedin_vanity_name'] = linkedin_match.group(1)
-            
-            elif 'facebook.com' in href_lower:
-                social_media['facebook_url'] = href
-                fb_match = re.search(r'facebook\.com/([a-zA-Z0-9\.\-_]+)', href)
-                if fb_match:
-                    social_media['facebook_id'] = fb_match.group(1)
-            
-            elif 'instagram.com' in href_lower:
-                social_media['instagram_url'] = href
-                ig_match = re.search(r'instagram\.com/([a-zA-Z0-9\._]+)', href)
-                if ig_match:
-                    social_media['instagram_id'] = ig_match.group(1)
-            
-            elif 'youtube.com' in href_lower:
-                social_media['youtube_url'] = href
-        
-        return social_media
-    
     def extract_linkedin_from_url(self, url: str) -> Optional[str]:
         if not url:
             return None
         
-        match = re.search(r'linkedin\.com/company/([a-zA-Z0-9\-_]+)', url)
-        if match:
-            return match.group(1)
+        match = SOCIAL_LINK.search(url)
+        if match and match.group('linkedin'):
+            return match.group('linkedin')
         return None
     
     def extract_twitter_from_url(self, url: str) -> Optional[str]:
         if not url:
             return None
         
-        match = re.search(r'(?:twitter\.com|x\.com)/([a-zA-Z0-9_]+)', url)
-        if match:
-            return match.group(1)
+        match = SOCIAL_LINK.search(url)
+        if match and match.group('twitter'):
+            return match.group('twitter')
         return None
     
     def extract_emails(self, text: str) -> list:
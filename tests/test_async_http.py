@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from research import async_http
+from utils.retry import retry_scope
+
+
+class _Client:
+    
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.attempts = 0
+    
+    async def get(self, url, **kwargs):
+        self.attempts += 1
+        return httpx.Response(self.status, json={"url": url}, request=httpx.Request("GET", url))
+
+
+class _SlowLimiter:
+    
+    def acquire(self, provider: str):
+        time.sleep(0.5)
+    
+    def record_rate_limited(self, provider: str, retry_after=None):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = _Client()
+    monkeypatch.setattr(async_http, "get_async_client", lambda: client)
+    monkeypatch.setattr(async_http, "get_http_cache", lambda: None)
+    return client
+
+
+def test_slow_rate_limiter_does_not_block_other_fetches(client, monkeypatch):
+    monkeypatch.setattr(async_http, "get_rate_limiter", lambda: _SlowLimiter())
+    finished = {}
+    
+    async def fetch(name: str, source=None):
+        await async_http.fetch_json(f"https://example.com/{name}", source=source)
+        finished[name] = time.monotonic()
+    
+    async def main():
+        started = time.monotonic()
+        await asyncio.gather(fetch("limited", source="slow"), fetch("free"))
+        return started
+    
+    started = asyncio.run(main())
+    assert finished["free"] - started < 0.25
+    assert finished["limited"] - started >= 0.5
+
+
+def test_cancelled_retry_scope_stops_async_retries(client):
+    client.status = 503
+    
+    async def main():
+        with retry_scope(60) as run:
+            threading.Timer(0.1, run.cancel).start()
+            with pytest.raises(httpx.HTTPStatusError):
+                await async_http.fetch_json("https://example.com/down", max_retries=5)
+    
+    started = time.monotonic()
+    asyncio.run(main())
+    assert client.attempts == 1
+    assert time.monotonic() - started < 0.5
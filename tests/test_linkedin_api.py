@@ -0,0 +1,62 @@
+import asyncio
+import uuid
+
+import httpx
+import requests
+
+from research import async_http, http_session
+from research.linkedin_api import LinkedInClient
+
+
+class _SyncSession:
+    
+    def __init__(self):
+        self.attempts = 0
+    
+    def get(self, url, **kwargs):
+        self.attempts += 1
+        response = requests.Response()
+        response.status_code = 503
+        response.url = url
+        response._content = b"{}"
+        return response
+
+
+class _AsyncClient:
+    
+    def __init__(self):
+        self.attempts = 0
+    
+    async def get(self, url, **kwargs):
+        self.attempts += 1
+        return httpx.Response(503, json={}, request=httpx.Request("GET", url))
+
+
+def _client() -> LinkedInClient:
+    client = LinkedInClient()
+    client.access_token = "token"
+    client.enabled = True
+    return client
+
+
+def test_sync_503_is_retried_by_get_json(monkeypatch):
+    session = _SyncSession()
+    monkeypatch.setattr(http_session, "get_session_registry", lambda: session)
+    monkeypatch.setattr(http_session, "get_http_cache", lambda: None)
+    monkeypatch.setattr("utils.retry.time.sleep", lambda delay: None)
+    
+    assert _client().get_company_by_vanity_name(f"acme-{uuid.uuid4().hex}") is None
+    assert session.attempts == 3
+
+
+def test_async_503_is_retried_by_fetch_json(monkeypatch):
+    client = _AsyncClient()
+    monkeypatch.setattr(async_http, "get_async_client", lambda: client)
+    monkeypatch.setattr(async_http, "get_http_cache", lambda: None)
+    
+    async def no_sleep(delay):
+        return None
+    monkeypatch.setattr("utils.retry.asyncio.sleep", no_sleep)
+    
+    assert asyncio.run(_client().get_company_by_vanity_name_async(f"acme-{uuid.uuid4().hex}")) is None
+    assert client.attempts == 3
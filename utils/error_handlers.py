@@ -1,9 +1,12 @@
+import asyncio
 import traceback
 import logging
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Awaitable
 from functools import wraps
 import streamlit as st
 
+from utils.retry import RetryPolicy, call_with_retry, call_with_retry_async
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -19,6 +22,15 @@ class APIError(ResearchError):
     pass
 
 
+class RateLimitExceeded(APIError):
+    retryable = False
+    
+    def __init__(self, provider: str, retry_after: float = 0.0):
+        super().__init__(f"{provider} quota exhausted, retry in {retry_after:.0f}s")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
 class ScrapingError(ResearchError):
     pass
 
@@ -31,37 +43,48 @@ class ExportError(ResearchError):
     pass
 
 
+def _report_error(func: Callable, error: Exception, user_message: str, log_error: bool):
+    if isinstance(error, ValidationError):
+        if log_error:
+            logger.warning(f"Validation error in {func.__name__}: {str(error)}")
+        st.error(f"❌ {str(error)}")
+    elif isinstance(error, APIError):
+        if log_error:
+            logger.error(f"API error in {func.__name__}: {str(error)}")
+        st.warning(f"⚠️ {user_message}: {str(error)}")
+    elif isinstance(error, ScrapingError):
+        if log_error:
+            logger.error(f"Scraping error in {func.__name__}: {str(error)}")
+        st.warning(f"⚠️ {user_message}: {str(error)}")
+    elif isinstance(error, ExportError):
+        if log_error:
+            logger.error(f"Export error in {func.__name__}: {str(error)}")
+        st.error(f"❌ Export failed: {str(error)}")
+    else:
+        if log_error:
+            logger.error(f"Unexpected error in {func.__name__}: {str(error)}")
+            logger.error(traceback.format_exc())
+        st.error(f"❌ {user_message}. Please try again or contact support.")
+
+
 def handle_errors(user_message: str = "An error occurred", log_error: bool = True):
     def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    _report_error(func, e, user_message, log_error)
+                    return None
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             try:
                 return func(*args, **kwargs)
-            except ValidationError as e:
-                if log_error:
-                    logger.warning(f"Validation error in {func.__name__}: {str(e)}")
-                st.error(f"❌ {str(e)}")
-                return None
-            except APIError as e:
-                if log_error:
-                    logger.error(f"API error in {func.__name__}: {str(e)}")
-                st.warning(f"⚠️ {user_message}: {str(e)}")
-                return None
-            except ScrapingError as e:
-                if log_error:
-                    logger.error(f"Scraping error in {func.__name__}: {str(e)}")
-                st.warning(f"⚠️ {user_message}: {str(e)}")
-                return None
-            except ExportError as e:
-                if log_error:
-                    logger.error(f"Export error in {func.__name__}: {str(e)}")
-                st.error(f"❌ Export failed: {str(e)}")
-                return None
             except Exception as e:
-                if log_error:
-                    logger.error(f"Unexpected error in {func.__name__}: {str(e)}")
-                    logger.error(traceback.format_exc())
-                st.error(f"❌ {user_message}. Please try again or contact support.")
+                _report_error(func, e, user_message, log_error)
                 return None
         return wrapper
     return decorator
@@ -79,26 +102,16 @@ def safe_api_call(func: Callable, fallback: Any = None,
 
 
 def retry_with_backoff(func: Callable, max_retries: int = 3, 
-                       initial_delay: float = 1.0) -> Any:
-    import time
-    
-    delay = initial_delay
-    last_exception = None
-    
-    for attempt in range(max_retries):
-        try:
-            return func()
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}")
-            
-            if attempt < max_retries - 1:
-                logger.info(f"Retrying in {delay} seconds...")
-                time.sleep(delay)
-                delay *= 2
-    
-    logger.error(f"All {max_retries} attempts failed")
-    raise last_exception
+                       initial_delay: float = 1.0, source: Optional[str] = None) -> Any:
+    policy = RetryPolicy(max_attempts=max_retries, base_delay=initial_delay)
+    return call_with_retry(func, policy, source=source)
+
+
+async def async_retry_with_backoff(func: Callable[[], Awaitable], max_retries: int = 3,
+                                   initial_delay: float = 1.0,
+                                   source: Optional[str] = None) -> Any:
+    policy = RetryPolicy(max_attempts=max_retries, base_delay=initial_delay)
+    return await call_with_retry_async(func, policy, source=source)
 
 
 def display_error_with_details(error: Exception, show_details: bool = False):
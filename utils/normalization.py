@@ -0,0 +1,22 @@
+import re
+from typing import Optional
+
+LEGAL_SUFFIXES = re.compile(
+    r"\b(inc|incorporated|llc|ltd|limited|corp|corporation|co|company|gmbh|plc|sa|ag)\b\.?"
+)
+
+
+def normalize_company_name(company_name: str) -> str:
+    name = company_name.lower().replace("&", " and ")
+    name = LEGAL_SUFFIXES.sub(" ", name)
+    name = re.sub(r"[^a-z0-9]+", " ", name)
+    return " ".join(name.split())
+
+
+def normalize_domain(domain: Optional[str]) -> Optional[str]:
+    if not domain:
+        return None
+    domain = domain.lower().strip()
+    domain = re.sub(r"^https?://", "", domain)
+    domain = domain.split("/")[0]
+    return domain[4:] if domain.startswith("www.") else domain
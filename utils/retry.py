@@ -0,0 +1,224 @@
+import asyncio
+import contextvars
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+from config.settings import RETRY_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay: float = RETRY_CONFIG["base_delay"]
+    max_delay: float = RETRY_CONFIG["max_delay"]
+    jitter: float = RETRY_CONFIG["jitter"]
+    max_retry_after: float = RETRY_CONFIG["max_retry_after"]
+    retry_statuses: Tuple[int, ...] = tuple(RETRY_CONFIG["retry_statuses"])
+    
+    def is_retryable(self, error: Exception) -> bool:
+        if not getattr(error, "retryable", True):
+            return False
+        
+        status = status_code(error)
+        if status is None:
+            return True
+        return status in self.retry_statuses
+    
+    def compute_delay(self, attempt: int, error: Exception) -> float:
+        response = getattr(error, "response", None)
+        retry_after = parse_retry_after(getattr(response, "headers", None))
+        if retry_after is not None:
+            return retry_after
+        
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (1 - self.jitter + random.random() * self.jitter)
+
+
+class RetryBudget:
+    
+    def __init__(self, max_retries: int):
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+    
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.used >= self.max_retries:
+                return False
+            self.used += 1
+            return True
+
+
+@dataclass
+class RetryRun:
+    deadline: float
+    budget: RetryBudget
+    source_retries: int
+    source_budgets: Dict[str, RetryBudget] = field(default_factory=dict)
+    cancelled: threading.Event = field(default_factory=threading.Event)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+    
+    def source_budget(self, source: str) -> RetryBudget:
+        with self._lock:
+            if source not in self.source_budgets:
+                self.source_budgets[source] = RetryBudget(self.source_retries)
+            return self.source_budgets[source]
+    
+    def cancel(self):
+        self.cancelled.set()
+
+
+_current_run: contextvars.ContextVar[Optional[RetryRun]] = contextvars.ContextVar(
+    "retry_run", default=None
+)
+_in_retry: contextvars.ContextVar[bool] = contextvars.ContextVar("in_retry", default=False)
+
+
+@contextmanager
+def retry_scope(time_limit: float,
+                max_retries: int = RETRY_CONFIG["run_retry_budget"],
+                source_retries: int = RETRY_CONFIG["source_retry_budget"]) -> Iterator[RetryRun]:
+    run = RetryRun(
+        deadline=time.monotonic() + time_limit,
+        budget=RetryBudget(max_retries),
+        source_retries=source_retries,
+    )
+    token = _current_run.set(run)
+    try:
+        yield run
+    finally:
+        _current_run.reset(token)
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    if not headers:
+        return None
+    
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def status_code(error: Exception) -> Optional[int]:
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _next_delay(policy: RetryPolicy, attempt: int, error: Exception,
+                source: Optional[str]) -> Optional[float]:
+    if attempt >= policy.max_attempts - 1 or not policy.is_retryable(error):
+        return None
+    
+    delay = policy.compute_delay(attempt, error)
+    if delay > policy.max_retry_after:
+        logger.warning(f"Retry-After of {delay:.0f}s exceeds limit, giving up")
+        return None
+    
+    run = _current_run.get()
+    if run is None:
+        return delay
+    
+    if run.cancelled.is_set() or delay >= run.remaining():
+        logger.warning("Research time limit reached, not retrying")
+        return None
+    if source and not run.source_budget(source).try_spend():
+        logger.warning(f"Retry budget exhausted for {source}")
+        return None
+    if not run.budget.try_spend():
+        logger.warning("Retry budget exhausted for this research run")
+        return None
+    return delay
+
+
+def call_with_retry(func: Callable[[], Any], policy: Optional[RetryPolicy] = None,
+                    source: Optional[str] = None) -> Any:
+    if _in_retry.get():
+        return func()
+    
+    policy = policy or RetryPolicy()
+    token = _in_retry.set(True)
+    try:
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1}/{policy.max_attempts} failed: {str(e)}")
+                delay = _next_delay(policy, attempt, e, source)
+                if delay is None:
+                    raise
+                
+                logger.info(f"Retrying in {delay:.1f} seconds...")
+                run = _current_run.get()
+                if run is None:
+                    time.sleep(delay)
+                elif run.cancelled.wait(delay):
+                    raise
+                attempt += 1
+    finally:
+        _in_retry.reset(token)
+
+
+async def call_with_retry_async(func: Callable[[], Awaitable[Any]],
+                                policy: Optional[RetryPolicy] = None,
+                                source: Optional[str] = None) -> Any:
+    if _in_retry.get():
+        return await func()
+    
+    policy = policy or RetryPolicy()
+    token = _in_retry.set(True)
+    try:
+        attempt = 0
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1}/{policy.max_attempts} failed: {str(e)}")
+                delay = _next_delay(policy, attempt, e, source)
+                if delay is None:
+                    raise
+                
+                logger.info(f"Retrying in {delay:.1f} seconds...")
+                run = _current_run.get()
+                if run is None:
+                    await asyncio.sleep(delay)
+                elif await _cancelled_during(run, delay):
+                    raise
+                attempt += 1
+    finally:
+        _in_retry.reset(token)
+
+
+async def _cancelled_during(run: RetryRun, delay: float) -> bool:
+    deadline = time.monotonic() + delay
+    while not run.cancelled.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(remaining, RETRY_CONFIG["cancel_poll_interval"]))
+    return True